@@ -1,19 +1,22 @@
 from .components import Component, Identity, T
 from .entities import Entity
 from .entity_ref import EntityRef
-from .event_bus import EventBus
+from .event_bus import DispatchPolicy, EntityEventBus, EventBus
 from .events import Event
 from .exceptions import InvalidEventNameError, InvalidEventPatternError
 from .metaclass import EntityMeta
+from .query import Query
 from .registry import Registry
 from .systems import System
 
 
 __all__ = [
     "Component",
+    "DispatchPolicy",
     "Identity",
     "T",
     "Entity",
+    "EntityEventBus",
     "EntityRef",
     "Event",
     "EventBus",
@@ -21,6 +24,7 @@ __all__ = [
     "InvalidEventNameError",
     "InvalidEventPatternError",
     "EntityMeta",
+    "Query",
     "Registry",
     "System",
 ]
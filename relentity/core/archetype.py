@@ -1,10 +1,52 @@
 import uuid
-from typing import Type, Set
+from typing import Type, Set, Iterable
 
-from relentity.core import Component
+from .components import Component
 
 
 class Archetype:
-    def __init__(self, component_types: Set[Type[Component]]):
+    """
+    A group of entities that share exactly the same set of component types.
+
+    The registry keeps one archetype per distinct component-type set and moves an entity between
+    archetypes whenever a component is added to or removed from it, so a query only has to find the
+    archetypes whose type set is a superset of the requested types and iterate their entities.
+
+    Attributes:
+        component_types (frozenset[Type[Component]]): The component types shared by every entity in the archetype.
+        component_bases (frozenset[Type[Component]]): The component types plus every Component base class in
+            their MROs, used to answer `include_subclasses` queries without walking the entities.
+        entities (Set[uuid.UUID]): The ids of the entities currently in the archetype.
+    """
+
+    def __init__(self, component_types: Iterable[Type[Component]]):
         self.component_types = frozenset(component_types)
+        self.component_bases = frozenset(
+            base
+            for component_type in self.component_types
+            for base in component_type.__mro__
+            if isinstance(base, type) and issubclass(base, Component)
+        )
         self.entities: Set[uuid.UUID] = set()
+
+    def matches(self, component_types: Iterable[Type[Component]], include_subclasses: bool = False) -> bool:
+        """
+        Checks if entities in this archetype have all the specified component types.
+
+        Args:
+            component_types (Iterable[Type[Component]]): The component types to check for.
+            include_subclasses (bool): Whether a subclass of a component type also counts as a match.
+
+        Returns:
+            bool: True if the archetype contains all the component types, False otherwise.
+        """
+        if include_subclasses:
+            return self.component_bases.issuperset(component_types)
+        return self.component_types.issuperset(component_types)
+
+    def __len__(self) -> int:
+        return len(self.entities)
+
+    def __repr__(self) -> str:
+        names = ", ".join(sorted(component_type.__name__ for component_type in self.component_types))
+        return f"Archetype({names}; {len(self.entities)} entities)"
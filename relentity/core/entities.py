@@ -3,7 +3,7 @@ import uuid
 from typing import Dict, Type, Optional, TYPE_CHECKING
 
 from .components import Component, T
-from .event_bus import EventBus
+from .event_bus import EntityEventBus
 from .events import (
     ENTITY_COMPONENT_UPDATED_EVENT,
     ENTITY_COMPONENT_ADDED_EVENT,
@@ -23,7 +23,8 @@ class Entity(metaclass=EntityMeta):
     Attributes:
         components (Dict[Type[Component], Component]): A dictionary of components associated with the entity.
         registry (Registry): The registry to which the entity belongs.
-        event_bus (EventBus): The event bus for handling events related to the entity.
+        event_bus (EntityEventBus): The event bus for handling events related to the entity, which also reaches
+            the registry's subscribers.
     """
 
     def __init__(self, registry: "Registry"):
@@ -34,12 +35,22 @@ class Entity(metaclass=EntityMeta):
             registry (Registry): The registry to register the entity with.
         """
         self.id = uuid.uuid4()
-        self.components: Dict[Type[Component], Component] = {}
         self.registry = registry
+        self._components: Dict[Type[Component], Component] = {}
         self.registry.register_entity(self)
-        self.event_bus = EventBus()
+        self.event_bus = EntityEventBus(self)
         # Emit creation event
-        asyncio.create_task(self.event_bus.emit(ENTITY_CREATED_EVENT, self))
+        self.registry.queue_event(self.event_bus, ENTITY_CREATED_EVENT, self)
+
+    @property
+    def components(self) -> Dict[Type[Component], Component]:
+        return self._components
+
+    @components.setter
+    def components(self, components: Dict[Type[Component], Component]) -> None:
+        # replacing the whole mapping bypasses add_component, so re-index the entity here
+        self._components = components
+        self.registry.register_entity(self)
 
     @property
     def entity_ref(self) -> "EntityRef":
@@ -58,9 +69,9 @@ class Entity(metaclass=EntityMeta):
         self.registry.register_entity(self)
 
         if is_update:
-            asyncio.create_task(self.event_bus.emit(ENTITY_COMPONENT_UPDATED_EVENT, (self, component)))
+            self.registry.queue_event(self.event_bus, ENTITY_COMPONENT_UPDATED_EVENT, (self, component))
         else:
-            asyncio.create_task(self.event_bus.emit(ENTITY_COMPONENT_ADDED_EVENT, (self, component)))
+            self.registry.queue_event(self.event_bus, ENTITY_COMPONENT_ADDED_EVENT, (self, component))
 
     async def add_component(self, component: Component) -> None:
         """
@@ -79,9 +90,9 @@ class Entity(metaclass=EntityMeta):
         else:
             await self.event_bus.emit(ENTITY_COMPONENT_ADDED_EVENT, (self, component))
 
-    async def get_component(self, component_type: Type[T], include_subclasses: bool = False) -> Optional[T]:
+    def get_component_nowait(self, component_type: Type[T], include_subclasses: bool = False) -> Optional[T]:
         """
-        Retrieves a component of the specified type from the entity.
+        Retrieves a component of the specified type from the entity without awaiting.
 
         Args:
             component_type (Type[T]): The type of the component to retrieve.
@@ -91,16 +102,29 @@ class Entity(metaclass=EntityMeta):
             Optional[T]: The component of the specified type, or None if not found.
         """
         if not include_subclasses:
-            return self.components.get(component_type)
+            return self._components.get(component_type)
 
-        for other_component_type, component in list(self.components.items()):
+        for other_component_type, component in list(self._components.items()):
             if issubclass(other_component_type, component_type):
                 return component
         return None
 
-    async def has_components(self, *component_types: Type[Component]) -> bool:
+    async def get_component(self, component_type: Type[T], include_subclasses: bool = False) -> Optional[T]:
         """
-        Checks if the entity has all the specified components.
+        Retrieves a component of the specified type from the entity.
+
+        Args:
+            component_type (Type[T]): The type of the component to retrieve.
+            include_subclasses (bool): Whether to include subclasses of the component type.
+
+        Returns:
+            Optional[T]: The component of the specified type, or None if not found.
+        """
+        return self.get_component_nowait(component_type, include_subclasses)
+
+    def has_components_nowait(self, *component_types: Type[Component]) -> bool:
+        """
+        Checks if the entity has all the specified components without awaiting.
 
         Args:
             component_types (Type[Component]): The types of components to check for.
@@ -108,11 +132,24 @@ class Entity(metaclass=EntityMeta):
         Returns:
             bool: True if the entity has all the specified components, False otherwise.
         """
+        components = self._components
         for component_type in component_types:
-            if await self.get_component(component_type) is None:
+            if components.get(component_type) is None:
                 return False
         return True
 
+    async def has_components(self, *component_types: Type[Component]) -> bool:
+        """
+        Checks if the entity has all the specified components.
+
+        Args:
+            component_types (Type[Component]): The types of components to check for.
+
+        Returns:
+            bool: True if the entity has all the specified components, False otherwise.
+        """
+        return self.has_components_nowait(*component_types)
+
     async def remove_component(self, component_type: Type[Component]) -> None:
         """
         Removes a component of the specified type from the entity.
@@ -122,6 +159,7 @@ class Entity(metaclass=EntityMeta):
         """
         if component_type in self.components:
             self.components.pop(component_type)
+            self.registry.register_entity(self)
 
     async def destroy(self) -> None:
         """
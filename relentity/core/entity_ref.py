@@ -18,9 +18,13 @@ class EntityRef(BaseModel):
         super().__init__(*args, **kwargs)
         self._registry = _registry
 
+    def resolve_nowait(self) -> Optional["Entity"]:
+        """Resolve to the entity without awaiting."""
+        return self._registry.get_entity_by_id_nowait(self.entity_id)
+
     async def resolve(self) -> Optional["Entity"]:
         """Resolve to the entity if it still exists, None otherwise."""
-        return await self._registry.get_entity_by_id(self.entity_id)
+        return self.resolve_nowait()
 
     async def is_valid(self) -> bool:
         """Check if the referenced entity still exists."""
@@ -1,19 +1,62 @@
 import asyncio
 import logging
 import re
-from typing import Dict, List, Any, Awaitable, Pattern, Callable
+from enum import Enum
+from typing import Dict, List, Any, Awaitable, Optional, Pattern, Callable, Set, TYPE_CHECKING
 
 from .exceptions import InvalidEventNameError, InvalidEventPatternError
 
+if TYPE_CHECKING:
+    from .entities import Entity
+
 logger = logging.getLogger(__name__)
 
+# Strong references to fire-and-forget handler tasks, so they aren't garbage collected while running
+_background_tasks: Set[asyncio.Task] = set()
+
+
+class DispatchPolicy(Enum):
+    """
+    How an EventBus runs the handlers of an event.
+
+    SEQUENTIAL awaits the handlers one after another, GATHER runs them concurrently with `asyncio.gather`
+    and FIRE_AND_FORGET starts each in a task and returns without waiting. With SEQUENTIAL or GATHER, a
+    single handler is always awaited directly.
+    """
+
+    SEQUENTIAL = "sequential"
+    GATHER = "gather"
+    FIRE_AND_FORGET = "fire_and_forget"
+
 
 class EventBus:
-    def __init__(self):
+    """
+    Dispatches named events to the handlers registered for them.
+
+    Handlers registered for a plain event name are kept in a dictionary and receive exactly that event.
+    Handlers registered for a pattern containing `*` wildcards receive every event the pattern matches.
+    The handlers an event name resolves to are cached per name, so emitting the same event again costs a
+    single dictionary lookup; registering a handler clears the cache.
+
+    Attributes:
+        dispatch (DispatchPolicy): How the handlers of an event are run.
+        handlers (Dict[str, List[Callable[[Any], Awaitable[None]]]]): The handlers of each plain event name.
+        pattern_handlers (Dict[Pattern[str], List[Callable[[Any], Awaitable[None]]]]): The handlers of each
+            wildcard pattern.
+    """
+
+    def __init__(self, dispatch: DispatchPolicy = DispatchPolicy.GATHER):
         """
-        Initializes the EventBus with an empty dictionary of handlers.
+        Initializes the EventBus with no handlers.
+
+        Args:
+            dispatch (DispatchPolicy, optional): How the handlers of an event are run. Defaults to
+                DispatchPolicy.GATHER.
         """
-        self.handlers: Dict[Pattern[str], List[Callable[[Any], Awaitable[None]]]] = {}
+        self.dispatch = dispatch
+        self.handlers: Dict[str, List[Callable[[Any], Awaitable[None]]]] = {}
+        self.pattern_handlers: Dict[Pattern[str], List[Callable[[Any], Awaitable[None]]]] = {}
+        self._routes: Dict[str, List[Callable[[Any], Awaitable[None]]]] = {}
 
     def validate_event_name(self, event_name: str) -> None:
         """
@@ -50,26 +93,166 @@ class EventBus:
             handler (Callable[[Any], Awaitable[None]]): The handler to register.
         """
         self.validate_event_pattern(event_pattern)
-        pattern = re.compile(event_pattern.replace("*", ".*"))
-        if pattern not in self.handlers:
-            self.handlers[pattern] = []
-        self.handlers[pattern].append(handler)
-        logger.debug(f"Handler registered for pattern: {event_pattern}")
+        if "*" in event_pattern:
+            pattern = re.compile(event_pattern.replace("*", ".*"))
+            self.pattern_handlers.setdefault(pattern, []).append(handler)
+        else:
+            self.handlers.setdefault(event_pattern, []).append(handler)
+        self._routes.clear()
+        logger.debug("Handler registered for pattern: %s", event_pattern)
+
+    def handlers_for(self, event_name: str) -> List[Callable[[Any], Awaitable[None]]]:
+        """
+        Resolves the handlers that receive an event.
+
+        The event name is validated and matched against the wildcard patterns the first time it is seen;
+        the result is cached until the next handler is registered.
+
+        Args:
+            event_name (str): The name of the event.
+
+        Returns:
+            List[Callable[[Any], Awaitable[None]]]: The handlers of the event. Must not be modified.
+
+        Raises:
+            InvalidEventNameError: If the event name is invalid.
+        """
+        route = self._routes.get(event_name)
+        if route is None:
+            self.validate_event_name(event_name)
+            route = list(self.handlers.get(event_name, ()))
+            for pattern, handlers in self.pattern_handlers.items():
+                if pattern.match(event_name):
+                    route.extend(handlers)
+            self._routes[event_name] = route
+        return route
+
+    def has_subscribers(self, event_name: str) -> bool:
+        """
+        Checks whether emitting an event would reach any handler, so callers can skip building event data
+        nobody receives.
+
+        Args:
+            event_name (str): The name of the event.
+
+        Returns:
+            bool: True if at least one handler receives the event.
+        """
+        if not self.handlers and not self.pattern_handlers:
+            return False
+        return bool(self.handlers_for(event_name))
 
     async def emit(self, event_name: str, data: Any = None) -> None:
         """
-        Emits an event to all handlers that match the event name.
+        Emits an event to all handlers that match the event name, running them as the bus's dispatch policy says.
 
         Args:
             event_name (str): The name of the event to emit.
             data (Any, optional): The data to pass to the handlers. Defaults to None.
         """
-        self.validate_event_name(event_name)
-        matching_handlers = [
-            handler for pattern, handlers in self.handlers.items() if pattern.match(event_name) for handler in handlers
-        ]
-        if matching_handlers:
-            logger.debug(f"Emitting event: {event_name} to {len(matching_handlers)} handlers")
-            await asyncio.gather(*[handler(data) for handler in matching_handlers])
+        matching_handlers = self.handlers_for(event_name)
+        if not matching_handlers:
+            logger.debug("No handlers found for event: %s", event_name)
+            return
+
+        logger.debug("Emitting event: %s to %d handlers", event_name, len(matching_handlers))
+        dispatch = self.dispatch
+        if dispatch is DispatchPolicy.FIRE_AND_FORGET:
+            for handler in matching_handlers:
+                task = asyncio.create_task(handler(data))
+                _background_tasks.add(task)
+                task.add_done_callback(_background_tasks.discard)
+        elif len(matching_handlers) == 1:
+            await matching_handlers[0](data)
+        elif dispatch is DispatchPolicy.SEQUENTIAL:
+            for handler in matching_handlers:
+                await handler(data)
         else:
-            logger.debug(f"No handlers found for event: {event_name}")
+            await asyncio.gather(*[handler(data) for handler in matching_handlers])
+
+
+class EntityEventBus(EventBus):
+    """
+    The event bus of an entity: a lightweight view that delivers the entity's events to the handlers
+    registered on it and to the registry-wide subscribers (see `Registry.subscribe`).
+
+    Most entities never register a handler of their own, so the handler tables of a plain EventBus are
+    only created on the first registration; until then an emit only consults the registry's bus.
+
+    Attributes:
+        entity (Entity): The entity whose events the bus carries.
+    """
+
+    def __init__(self, entity: "Entity"):
+        """
+        Initializes the view without any handler tables.
+
+        Args:
+            entity (Entity): The entity whose events the bus carries.
+        """
+        # deliberately not calling EventBus.__init__: the tables live in a bus created on demand
+        self.entity = entity
+        self._local: Optional[EventBus] = None
+
+    def _local_bus(self) -> EventBus:
+        if self._local is None:
+            self._local = EventBus()
+        return self._local
+
+    @property
+    def dispatch(self) -> DispatchPolicy:
+        return self._local.dispatch if self._local is not None else DispatchPolicy.GATHER
+
+    @dispatch.setter
+    def dispatch(self, dispatch: DispatchPolicy) -> None:
+        self._local_bus().dispatch = dispatch
+
+    @property
+    def handlers(self) -> Dict[str, List[Callable[[Any], Awaitable[None]]]]:
+        return self._local.handlers if self._local is not None else {}
+
+    @property
+    def pattern_handlers(self) -> Dict[Pattern[str], List[Callable[[Any], Awaitable[None]]]]:
+        return self._local.pattern_handlers if self._local is not None else {}
+
+    def register_handler(self, event_pattern: str, handler: Callable[[Any], Awaitable[None]]) -> None:
+        self._local_bus().register_handler(event_pattern, handler)
+
+    def handlers_for(self, event_name: str) -> List[Callable[[Any], Awaitable[None]]]:
+        """
+        Resolves the handlers registered on this entity that receive an event. Registry-wide subscribers
+        are not included.
+
+        Args:
+            event_name (str): The name of the event.
+
+        Returns:
+            List[Callable[[Any], Awaitable[None]]]: The handlers of the event. Must not be modified.
+
+        Raises:
+            InvalidEventNameError: If the event name is invalid.
+        """
+        if self._local is None:
+            self.validate_event_name(event_name)
+            return []
+        return self._local.handlers_for(event_name)
+
+    def has_subscribers(self, event_name: str) -> bool:
+        return (self._local is not None and self._local.has_subscribers(event_name)) or (
+            self.entity.registry.event_bus.has_subscribers(event_name)
+        )
+
+    async def emit(self, event_name: str, data: Any = None) -> None:
+        """
+        Emits an event to the entity's own handlers, then to the registry-wide subscribers.
+
+        Args:
+            event_name (str): The name of the event to emit.
+            data (Any, optional): The data to pass to the handlers. Defaults to None.
+        """
+        if self._local is not None:
+            await self._local.emit(event_name, data)
+        registry_bus = self.entity.registry.event_bus
+        # resolving the route also validates the name, once per registry
+        if registry_bus.handlers_for(event_name):
+            await registry_bus.emit(event_name, (self.entity, data))
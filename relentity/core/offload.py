@@ -0,0 +1,119 @@
+import weakref
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+# The shared memory block name, shape and dtype of an array, enough for another process to attach to it
+ArraySpec = Tuple[str, Tuple[int, ...], str]
+
+
+class SharedArrays:
+    """
+    Copies NumPy arrays into shared memory blocks so a worker process can read and write them in place,
+    without pickling the arrays or the components they were gathered from.
+
+    The blocks outlive a single call: `update` copies fresh data into the existing blocks and only allocates
+    a new one for an array whose shape or dtype changed, so a system offloading every tick doesn't pay for
+    creating and unlinking shared memory each time. The blocks are freed by `close`, or when the instance is
+    garbage collected.
+
+    Attributes:
+        arrays (Dict[str, np.ndarray]): Views of the shared copies, by name.
+        specs (Dict[str, Tuple[str, Tuple[int, ...], str]]): What a worker needs to attach to each array.
+    """
+
+    def __init__(self, arrays: Optional[Dict[str, np.ndarray]] = None):
+        """
+        Initializes the shared arrays, copying `arrays` into shared memory if they are given.
+
+        Args:
+            arrays (Optional[Dict[str, np.ndarray]]): The arrays to share, by name.
+        """
+        self._blocks: Dict[str, SharedMemory] = {}
+        self.arrays: Dict[str, np.ndarray] = {}
+        self.specs: Dict[str, ArraySpec] = {}
+        # unlinks whatever blocks are held when the instance goes away without being closed
+        weakref.finalize(self, _release, self._blocks, self.arrays)
+        if arrays:
+            self.update(arrays)
+
+    def update(self, arrays: Dict[str, np.ndarray]) -> None:
+        """
+        Copies the arrays into shared memory, reusing each name's block while its shape and dtype stay the same.
+        Blocks for names that are no longer passed are freed.
+
+        Args:
+            arrays (Dict[str, np.ndarray]): The arrays to share, by name.
+        """
+        for name in [name for name in self._blocks if name not in arrays]:
+            self._free(name)
+        for name, array in arrays.items():
+            array = np.ascontiguousarray(array)
+            spec = self.specs.get(name)
+            if spec is None or spec[1] != array.shape or spec[2] != array.dtype.str:
+                self._free(name)
+                # zero-sized blocks aren't allowed
+                block = SharedMemory(create=True, size=max(array.nbytes, 1))
+                self._blocks[name] = block
+                self.arrays[name] = np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)
+                self.specs[name] = (block.name, array.shape, array.dtype.str)
+            self.arrays[name][...] = array
+
+    def _free(self, name: str) -> None:
+        """Releases and frees the block of one array, if there is one."""
+        self.specs.pop(name, None)
+        # the view must be gone before the block can be closed
+        self.arrays.pop(name, None)
+        block = self._blocks.pop(name, None)
+        if block is not None:
+            block.close()
+            block.unlink()
+
+    def close(self) -> None:
+        """Releases and frees the shared memory blocks. The views in `arrays` can't be used afterwards."""
+        self.specs.clear()
+        _release(self._blocks, self.arrays)
+
+    def __enter__(self) -> "SharedArrays":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+def _release(blocks: Dict[str, SharedMemory], arrays: Dict[str, np.ndarray]) -> None:
+    """Drops the views, then closes and unlinks the blocks behind them."""
+    arrays.clear()
+    for block in blocks.values():
+        block.close()
+        block.unlink()
+    blocks.clear()
+
+
+def run_kernel(kernel: Callable[..., Any], specs: Dict[str, ArraySpec], *args) -> Any:
+    """
+    Attaches to shared arrays and runs a kernel on them. This is what runs in the worker process.
+
+    Args:
+        kernel (Callable[..., Any]): A picklable (module-level) function taking the arrays by name, then `args`.
+            It writes its results into the arrays in place and may return a small result.
+        specs (Dict[str, Tuple[str, Tuple[int, ...], str]]): The shared arrays to attach to, by name.
+        *args: Further arguments for the kernel.
+
+    Returns:
+        Any: The kernel's return value.
+    """
+    blocks = []
+    arrays = {}
+    try:
+        for name, (block_name, shape, dtype) in specs.items():
+            block = SharedMemory(name=block_name)
+            blocks.append(block)
+            arrays[name] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+        return kernel(arrays, *args)
+    finally:
+        # the views must be gone before the blocks can be closed
+        arrays.clear()
+        for block in blocks:
+            block.close()
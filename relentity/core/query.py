@@ -0,0 +1,93 @@
+import uuid
+from typing import Type, Set, Iterable, Iterator, Tuple, Optional
+
+from .archetype import Archetype
+from .components import Component
+
+
+class Query:
+    """
+    A persistent set of the entities that have all of a given set of component types.
+
+    Queries are created through `Registry.query` and kept up to date by the registry as entities are
+    registered, change components or are unregistered, so reading the members is O(matches) and never
+    rebuilds anything. `version` is bumped on every membership change, letting systems skip work when
+    nothing has joined or left since their last tick.
+
+    Attributes:
+        component_types (frozenset[Type[Component]]): The component types an entity must have to match.
+        include_subclasses (bool): Whether a subclass of a component type also counts as a match.
+        entity_ids (Set[uuid.UUID]): The ids of the entities currently matching the query.
+        version (int): A counter incremented whenever an entity joins or leaves the query.
+    """
+
+    def __init__(self, component_types: Iterable[Type[Component]], include_subclasses: bool = False):
+        self.component_types = frozenset(component_types)
+        self.include_subclasses = include_subclasses
+        self.entity_ids: Set[uuid.UUID] = set()
+        self.version = 0
+        self._snapshot: Optional[Tuple[uuid.UUID, ...]] = None
+
+    def matches(self, archetype: Optional[Archetype]) -> bool:
+        """
+        Checks if entities in the given archetype belong to this query.
+
+        Args:
+            archetype (Optional[Archetype]): The archetype to check, or None for an unregistered entity.
+
+        Returns:
+            bool: True if the archetype has all the query's component types, False otherwise.
+        """
+        return archetype is not None and archetype.matches(self.component_types, self.include_subclasses)
+
+    def add(self, entity_id: uuid.UUID) -> None:
+        """
+        Adds an entity to the query's members.
+
+        Args:
+            entity_id (uuid.UUID): The id of the entity joining the query.
+        """
+        if entity_id not in self.entity_ids:
+            self.entity_ids.add(entity_id)
+            self._changed()
+
+    def discard(self, entity_id: uuid.UUID) -> None:
+        """
+        Removes an entity from the query's members if present.
+
+        Args:
+            entity_id (uuid.UUID): The id of the entity leaving the query.
+        """
+        if entity_id in self.entity_ids:
+            self.entity_ids.discard(entity_id)
+            self._changed()
+
+    def _changed(self) -> None:
+        self.version += 1
+        self._snapshot = None
+
+    def snapshot(self) -> Tuple[uuid.UUID, ...]:
+        """
+        Returns the current members as a tuple that is safe to iterate while entities change components.
+
+        The tuple is cached until the membership changes, so repeated calls on a stable query don't allocate.
+
+        Returns:
+            Tuple[uuid.UUID, ...]: The ids of the matching entities.
+        """
+        if self._snapshot is None:
+            self._snapshot = tuple(self.entity_ids)
+        return self._snapshot
+
+    def __iter__(self) -> Iterator[uuid.UUID]:
+        return iter(self.snapshot())
+
+    def __len__(self) -> int:
+        return len(self.entity_ids)
+
+    def __contains__(self, entity_id: object) -> bool:
+        return entity_id in self.entity_ids
+
+    def __repr__(self) -> str:
+        names = ", ".join(sorted(component_type.__name__ for component_type in self.component_types))
+        return f"Query({names}; {len(self.entity_ids)} entities, version {self.version})"
@@ -1,51 +1,361 @@
+import asyncio
 import uuid
-from typing import Set, Dict, Type, AsyncIterator, TYPE_CHECKING
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Set,
+    Dict,
+    Type,
+    AsyncIterator,
+    Iterator,
+    FrozenSet,
+    List,
+    Optional,
+    Tuple,
+    TYPE_CHECKING,
+)
 
+from .archetype import Archetype
 from .components import Component
 from .entity_ref import EntityRef
+from .event_bus import EventBus
 from .events import ENTITY_DESTROYED_EVENT
 from .exceptions import UnknownEntityError, UnknownComponentError
+from .query import Query
 
 if TYPE_CHECKING:
     from .entities import Entity
 
 
 class Registry:
-    def __init__(self):
+    def __init__(self, deferred_events: bool = False):
         """
-        Initializes the Registry with an empty set of entities and a dictionary
-        mapping component types to sets of entities.
+        Initializes the Registry with an empty set of entities, a dictionary
+        mapping component types to sets of entities, the archetypes that
+        group entities by their exact set of component types, and the
+        persistent queries kept up to date as entities change.
+
+        Args:
+            deferred_events (bool, optional): Whether events emitted without waiting, such as entity creation
+                and `add_component_sync`, are queued until `flush_events` instead of each being scheduled as
+                a task. Defaults to False.
         """
         self.entities: Dict[uuid.UUID, Entity] = {}
         self.component_to_entity_ids: Dict[Type[Component], Set[uuid.UUID]] = {}
+        self.component_base_to_entity_ids: Dict[Type[Component], Set[uuid.UUID]] = {}
+        self.archetypes: Dict[FrozenSet[Type[Component]], Archetype] = {}
+        self.entity_archetypes: Dict[uuid.UUID, Archetype] = {}
+        self._matching_archetypes: Dict[Tuple[FrozenSet[Type[Component]], bool], List[Archetype]] = {}
+        self.queries: Dict[Tuple[FrozenSet[Type[Component]], bool], Query] = {}
+        self._component_queries: Dict[Type[Component], List[Query]] = {}
+        self._component_base_queries: Dict[Type[Component], List[Query]] = {}
+        self.deferred_events = deferred_events
+        self.pending_events: List[Tuple[EventBus, str, Any]] = []
+        self.batch_event_bus = EventBus()
+        # registry-wide subscriptions to the events of every entity, see `subscribe`
+        self.event_bus = EventBus()
 
     def register_entity(self, entity: "Entity") -> None:
         """
         Registers an entity with the registry and updates the component-to-entities mapping.
 
+        Calling this again after the entity's components change moves the entity to the archetype
+        matching its new set of component types.
+
         Args:
             entity (Entity): The entity to register.
         """
         self.entities[entity.id] = entity
 
-        for component_type in entity.components:
-            if component_type not in self.component_to_entity_ids:
-                self.component_to_entity_ids[component_type] = set()
-            self.component_to_entity_ids[component_type].add(entity.id)
+        component_types = frozenset(entity.components)
+        current = self.entity_archetypes.get(entity.id)
+        if current is not None and current.component_types == component_types:
+            return
+
+        self._move_entity(entity.id, current, self._get_or_create_archetype(component_types))
+
+    def _drop_entity(self, entity: "Entity") -> None:
+        """
+        Removes an entity from the entity map, its archetype and the component mappings.
+
+        Args:
+            entity (Entity): The entity to drop.
+        """
+        del self.entities[entity.id]
+        self._move_entity(entity.id, self.entity_archetypes.get(entity.id), None)
+
+    def _get_or_create_archetype(self, component_types: FrozenSet[Type[Component]]) -> Archetype:
+        archetype = self.archetypes.get(component_types)
+        if archetype is None:
+            archetype = self.archetypes[component_types] = Archetype(component_types)
+            # a new archetype may match any query we have cached
+            self._matching_archetypes.clear()
+        return archetype
+
+    def _move_entity(self, entity_id: uuid.UUID, source: Optional[Archetype], target: Optional[Archetype]) -> None:
+        """
+        Moves an entity between archetypes, keeping the component indexes and queries in sync.
+
+        Args:
+            entity_id (uuid.UUID): The id of the entity to move.
+            source (Optional[Archetype]): The archetype the entity is leaving, if any.
+            target (Optional[Archetype]): The archetype the entity is joining, or None to drop it entirely.
+        """
+        old_types = source.component_types if source is not None else frozenset()
+        new_types = target.component_types if target is not None else frozenset()
+        old_bases = source.component_bases if source is not None else frozenset()
+        new_bases = target.component_bases if target is not None else frozenset()
+
+        if source is not None:
+            source.entities.discard(entity_id)
+        if target is not None:
+            target.entities.add(entity_id)
+            self.entity_archetypes[entity_id] = target
+        else:
+            self.entity_archetypes.pop(entity_id, None)
+
+        self._update_index(
+            self.component_to_entity_ids, self._component_queries, entity_id, old_types, new_types, target
+        )
+        self._update_index(
+            self.component_base_to_entity_ids, self._component_base_queries, entity_id, old_bases, new_bases, target
+        )
+
+    @staticmethod
+    def _update_index(
+        index: Dict[Type[Component], Set[uuid.UUID]],
+        queries: Dict[Type[Component], List[Query]],
+        entity_id: uuid.UUID,
+        old_types: FrozenSet[Type[Component]],
+        new_types: FrozenSet[Type[Component]],
+        target: Optional[Archetype],
+    ) -> None:
+        removed_types = old_types - new_types
+        added_types = new_types - old_types
+        for component_type in removed_types:
+            entity_ids = index.get(component_type)
+            if entity_ids is not None:
+                entity_ids.discard(entity_id)
+        for component_type in added_types:
+            if component_type not in index:
+                index[component_type] = set()
+            index[component_type].add(entity_id)
+
+        # only queries that mention a component that was added or removed can change membership
+        for component_type in removed_types:
+            for query in queries.get(component_type, ()):
+                if not query.matches(target):
+                    query.discard(entity_id)
+        for component_type in added_types:
+            for query in queries.get(component_type, ()):
+                if query.matches(target):
+                    query.add(entity_id)
+
+    def query(self, *component_types: Type[Component], include_subclasses: bool = False) -> Query:
+        """
+        Returns the persistent query for entities that have all the specified components.
+
+        The query is created and populated on first use, then maintained incrementally by the registry,
+        so calling this every tick returns the same object without recomputing its members.
+
+        Args:
+            component_types (Type[Component]): The types of components to check for.
+            include_subclasses (bool): Whether to include subclasses of the component types.
+
+        Returns:
+            Query: The query for the specified component types.
+        """
+        key = (frozenset(component_types), include_subclasses)
+        query = self.queries.get(key)
+        if query is None:
+            query = self.queries[key] = Query(*key)
+            for archetype in self.archetypes_with_components(*component_types, include_subclasses=include_subclasses):
+                query.entity_ids.update(archetype.entities)
+            queries = self._component_base_queries if include_subclasses else self._component_queries
+            for component_type in query.component_types:
+                queries.setdefault(component_type, []).append(query)
+        return query
+
+    def archetypes_with_components(
+        self, *component_types: Type[Component], include_subclasses: bool = False
+    ) -> List[Archetype]:
+        """
+        Returns the archetypes whose entities have all the specified components.
+
+        The result is cached per set of component types until a new archetype is created.
+
+        Args:
+            component_types (Type[Component]): The types of components to check for.
+            include_subclasses (bool): Whether to include subclasses of the component types.
+
+        Returns:
+            List[Archetype]: The matching archetypes.
+        """
+        key = (frozenset(component_types), include_subclasses)
+        archetypes = self._matching_archetypes.get(key)
+        if archetypes is None:
+            archetypes = self._matching_archetypes[key] = [
+                archetype for archetype in self.archetypes.values() if archetype.matches(*key)
+            ]
+        return archetypes
+
+    def queue_event(self, event_bus: EventBus, event_name: str, data: Any = None) -> None:
+        """
+        Emits an event without waiting for its handlers.
+
+        In deferred mode the event is queued until the next `flush_events`, otherwise it is emitted in a
+        new task.
+
+        Args:
+            event_bus (EventBus): The event bus to emit the event on.
+            event_name (str): The name of the event.
+            data (Any, optional): The data to pass to the handlers. Defaults to None.
+        """
+        if self.deferred_events:
+            self.pending_events.append((event_bus, event_name, data))
+        else:
+            asyncio.create_task(event_bus.emit(event_name, data))
+
+    def subscribe(
+        self,
+        event_pattern: str,
+        handler: Callable[["Entity", Any], Awaitable[None]],
+        *component_types: Type[Component],
+    ) -> None:
+        """
+        Subscribes a handler to the events matching a pattern on every entity's event bus.
+
+        One subscription observes all entities, instead of a handler registered on each of them.
+
+        Args:
+            event_pattern (str): The pattern of the events to handle.
+            handler (Callable[[Entity, Any], Awaitable[None]]): The handler, called with the entity the
+                event was emitted on and the event data.
+            component_types (Type[Component]): Only deliver events of entities that have all these components.
+        """
+
+        async def deliver(payload: Tuple["Entity", Any]) -> None:
+            entity, data = payload
+            if not component_types or entity.has_components_nowait(*component_types):
+                await handler(entity, data)
+
+        self.event_bus.register_handler(event_pattern, deliver)
+
+    def register_batch_handler(self, event_pattern: str, handler: Callable[[List[Any]], Awaitable[None]]) -> None:
+        """
+        Registers a handler that receives the queued events matching a pattern in bulk, once per flush.
+
+        Args:
+            event_pattern (str): The pattern of the events to handle.
+            handler (Callable[[List[Any]], Awaitable[None]]): The handler, called with the data of every
+                queued event of one name, in the order they were queued.
+        """
+        self.batch_event_bus.register_handler(event_pattern, handler)
+
+    async def flush_events(self) -> int:
+        """
+        Dispatches the queued events: first each to the handlers on its own event bus, in the order they
+        were queued, then the events of each name to the batch handlers in one call. Events queued by the
+        handlers are dispatched in the same flush.
+
+        Returns:
+            int: The number of events dispatched.
+        """
+        count = 0
+        batch_event_bus = self.batch_event_bus
+        while self.pending_events:
+            pending = self.pending_events
+            self.pending_events = []
+            batches: Dict[str, List[Any]] = {}
+            for event_bus, event_name, data in pending:
+                if event_bus.has_subscribers(event_name):
+                    await event_bus.emit(event_name, data)
+                if batch_event_bus.has_subscribers(event_name):
+                    batches.setdefault(event_name, []).append(data)
+            for event_name, batch in batches.items():
+                await batch_event_bus.emit(event_name, batch)
+            count += len(pending)
+        return count
 
     async def unregister_entity(self, entity_id) -> None:
         """Remove an entity completely from the registry."""
         entity = await self.get_entity_by_id(entity_id)
-        del self.entities[entity_id]
-
-        # Remove from component mappings
-        for component_type in list(entity.components.keys()):
-            if component_type in self.component_to_entity_ids:
-                self.component_to_entity_ids[component_type].discard(entity)
+        self._drop_entity(entity)
 
         # Emit destruction event via entity's event bus
         await entity.event_bus.emit(ENTITY_DESTROYED_EVENT, entity)
 
+    def entities_with_components_nowait(
+        self, *component_types: Type[Component], include_subclasses: bool = False
+    ) -> Iterator[EntityRef]:
+        """
+        Yields entities that have all the specified components without awaiting.
+
+        Args:
+            component_types (Type[Component]): The types of components to check for.
+            include_subclasses (bool): Whether to include subclasses of the component types.
+
+        Yields:
+            EntityRef: A reference to an entity that has all the specified components.
+        """
+        if not component_types:
+            return
+
+        for entity_id in self.query(*component_types, include_subclasses=include_subclasses).snapshot():
+            yield EntityRef(entity_id=entity_id, _registry=self)
+
+    def iter_components(self, *component_types: Type[Component]) -> Iterator[Tuple[Any, ...]]:
+        """
+        Yields the components of every entity that has all the specified component types.
+
+        Each item is a tuple of the entity id followed by the components in the requested order, read straight
+        from the entities without building an `EntityRef` or resolving anything. Entities that lose one of the
+        components (or are removed) while iterating are skipped.
+
+        Args:
+            component_types (Type[Component]): The types of components to retrieve.
+
+        Yields:
+            Tuple[uuid.UUID, Component, ...]: The entity id and its components, in the order requested.
+        """
+        if not component_types:
+            return
+
+        entities = self.entities
+        for entity_id in self.query(*component_types).snapshot():
+            entity = entities.get(entity_id)
+            if entity is None:
+                continue
+            components = entity.components
+            try:
+                row = (entity_id, *[components[component_type] for component_type in component_types])
+            except KeyError:
+                continue
+            yield row
+
+    def iter_component_chunks(
+        self, *component_types: Type[Component], chunk_size: int = 1024
+    ) -> Iterator[List[Tuple[Any, ...]]]:
+        """
+        Yields the rows of `iter_components` in lists of up to `chunk_size` items.
+
+        Args:
+            component_types (Type[Component]): The types of components to retrieve.
+            chunk_size (int): The maximum number of rows per chunk.
+
+        Yields:
+            List[Tuple[uuid.UUID, Component, ...]]: A chunk of entity ids and their components.
+        """
+        chunk = []
+        for row in self.iter_components(*component_types):
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
     async def entities_with_components(
         self, *component_types: Type[Component], include_subclasses: bool = False
     ) -> AsyncIterator[EntityRef]:
@@ -59,24 +369,8 @@ class Registry:
         Yields:
             Entity: An entity that has all the specified components.
         """
-        if not component_types:
-            raise StopAsyncIteration
-
-        if include_subclasses:
-            for entity in list(self.entities.values()):
-                if all(
-                    [
-                        await entity.get_component(component_type, include_subclasses)
-                        for component_type in component_types
-                    ]
-                ):
-                    yield EntityRef(entity_id=entity.id, _registry=self)
-        else:
-            entity_ids = set(self.component_to_entity_ids.get(component_types[0], []))
-            for component_type in component_types[1:]:
-                entity_ids &= set(self.component_to_entity_ids.get(component_type, []))
-            for entity_id in list(entity_ids):
-                yield EntityRef(entity_id=entity_id, _registry=self)
+        for entity_ref in self.entities_with_components_nowait(*component_types, include_subclasses=include_subclasses):
+            yield entity_ref
 
     async def remove_component_from_entity(self, entity_id: uuid.UUID, component_type: Type[Component]) -> None:
         """
@@ -86,28 +380,28 @@ class Registry:
             entity (Entity): The entity to remove the component from.
             component_type (Type[Component]): The type of the component to remove.
         """
-        entity = await self.get_entity_by_id(entity_id)
+        entity = self.get_entity_by_id_nowait(entity_id)
 
         try:
             entity.components.pop(component_type)
         except KeyError as exc:
             raise UnknownComponentError(component_type) from exc
 
-        try:
-            self.component_to_entity_ids[component_type].remove(entity_id)
-        except KeyError:
-            pass
-
         # clean up the entity if it has no components
         if not entity.components:
-            del self.entities[entity.id]
+            self._drop_entity(entity)
+        else:
+            self.register_entity(entity)
 
-    async def get_entity_by_id(self, entity_id) -> "Entity":
+    def get_entity_by_id_nowait(self, entity_id) -> "Entity":
         try:
             return self.entities[entity_id]
         except KeyError:
             raise UnknownEntityError(entity_id)
 
+    async def get_entity_by_id(self, entity_id) -> "Entity":
+        return self.get_entity_by_id_nowait(entity_id)
+
     def get_entity_ref(self, entity_id: uuid.UUID) -> EntityRef:
         return EntityRef(entity_id=entity_id, _registry=self)
 
@@ -1,16 +1,126 @@
-from typing import List
+import asyncio
+from typing import Dict, List, Optional
 
 from relentity.core import System
 
 
 class SystemManager:
-    def __init__(self):
+    """
+    Runs systems in priority order.
+
+    Systems without a tick rate run once per update with the frame's delta time. Systems with a tick rate
+    run on a fixed timestep: the frame's delta time is added to an accumulator and the system runs once
+    per whole step it holds, always with a delta time of exactly one step. So a 1 Hz system skips most
+    frames, and a 60 Hz system may run several times in a long frame, up to its `max_catch_up_ticks`;
+    time left over beyond that is dropped so a slow frame can't snowball into ever longer ones.
+
+    When created with `concurrent=True`, the systems are split into stages from their declared `reads` and `writes`:
+    a system goes into the stage after the last earlier-priority system it conflicts with, and the systems
+    of a stage run together with `asyncio.gather`. Systems that declare nothing conflict with every other
+    system, so they keep running on their own, in priority order.
+
+    Each update starts by flushing the events queued on the registries of the systems (see
+    `Registry.flush_events`), so handlers of deferred events run at a fixed point before any system.
+
+    Attributes:
+        systems (List[System]): The managed systems, in priority order.
+        concurrent (bool): Whether systems that don't conflict run concurrently.
+    """
+
+    def __init__(self, concurrent: bool = False):
+        """
+        Initializes the SystemManager.
+
+        Args:
+            concurrent (bool, optional): Whether systems that don't conflict run concurrently. Defaults to False.
+        """
         self.systems: List[System] = []
+        self.concurrent = concurrent
+        self._accumulators: Dict[System, float] = {}
+        self._stages: Optional[List[List[System]]] = None
+
+    def add_system(self, system: System, tick_rate: Optional[float] = None) -> None:
+        """
+        Adds a system to the manager.
+
+        Args:
+            system (System): The system to add.
+            tick_rate (Optional[float], optional): A fixed update rate in Hz that overrides the system's
+                own `tick_rate`. Defaults to None.
+
+        Raises:
+            ValueError: If the tick rate is not positive.
+        """
+        if tick_rate is not None:
+            system.tick_rate = tick_rate
+        if system.tick_rate is not None and system.tick_rate <= 0:
+            raise ValueError(f"Tick rate must be positive, got {system.tick_rate}")
 
-    def add_system(self, system: System) -> None:
         self.systems.append(system)
         self.systems.sort(key=lambda s: s.priority)
+        self._accumulators[system] = 0.0
+        self._stages = None
+
+    @property
+    def stages(self) -> List[List[System]]:
+        """
+        The groups of systems that run together, in the order they run.
+
+        Returns:
+            List[List[System]]: The stages, each in priority order.
+        """
+        if self._stages is None:
+            self._stages = self._build_stages()
+        return self._stages
+
+    def _build_stages(self) -> List[List[System]]:
+        if not self.concurrent:
+            return [[system] for system in self.systems]
+
+        stages: List[List[System]] = []
+        levels: List[int] = []
+        for index, system in enumerate(self.systems):
+            # the stage after every earlier system this one depends on
+            level = max(
+                (levels[earlier] + 1 for earlier in range(index) if system.conflicts_with(self.systems[earlier])),
+                default=0,
+            )
+            levels.append(level)
+            if level == len(stages):
+                stages.append([])
+            stages[level].append(system)
+        return stages
 
     async def update(self, delta_time: float = 0) -> None:
-        for system in self.systems:
+        """
+        Flushes the queued events, then runs every system that is due, stage by stage.
+
+        Args:
+            delta_time (float): Time elapsed since the last update in seconds.
+        """
+        for registry in dict.fromkeys(system.registry for system in self.systems):
+            if registry.pending_events:
+                await registry.flush_events()
+
+        for stage in self.stages:
+            if len(stage) == 1:
+                await self._run(stage[0], delta_time)
+            else:
+                await asyncio.gather(*(self._run(system, delta_time) for system in stage))
+
+    async def _run(self, system: System, delta_time: float) -> None:
+        if system.tick_rate is None:
             await system.process(delta_time)
+            return
+
+        step = 1.0 / system.tick_rate
+        accumulator = self._accumulators[system] + delta_time
+        ticks = 0
+        while accumulator >= step and ticks < system.max_catch_up_ticks:
+            await system.process(step)
+            accumulator -= step
+            ticks += 1
+        if accumulator >= step:
+            # over the catch-up limit: drop the whole steps that couldn't run, keep the fraction
+            accumulator %= step
+        self._accumulators[system] = accumulator
@@ -1,8 +1,13 @@
+import asyncio
 import time
-from typing import Set, Type, Dict, Any, Callable, Awaitable, TYPE_CHECKING
+from concurrent.futures import Executor
+from typing import Set, Type, Dict, Any, Callable, Awaitable, Optional, TYPE_CHECKING
+
+import numpy as np
 
 from .components import Component
 from .event_bus import EventBus
+from .offload import SharedArrays, run_kernel
 
 if TYPE_CHECKING:
     from .registry import Registry
@@ -14,9 +19,23 @@ class System:
     # Define required components that this system processes
     required_components: Set[Type[Component]] = set()
 
+    # Component types the system reads and writes, used by SystemManager to run systems that don't conflict
+    # concurrently. None means undeclared: the system may touch anything and runs on its own.
+    reads: Optional[Set[Type[Component]]] = None
+    writes: Optional[Set[Type[Component]]] = None
+
     # System execution priority (lower numbers run first)
     priority: int = 100
 
+    # Fixed update rate in Hz used by SystemManager; None runs the system once per manager update
+    tick_rate: Optional[float] = None
+
+    # Most fixed-rate updates SystemManager runs in one manager update to catch up after a slow frame
+    max_catch_up_ticks: int = 5
+
+    # A process pool that `run_offloaded` ships kernels to; None runs them on the event loop thread
+    executor: Optional[Executor] = None
+
     def __init__(self, registry: "Registry"):
         """
         Initialize the System with a registry and default settings.
@@ -31,6 +50,8 @@ class System:
         self.execution_count = 0
         self.average_execution_time = 0.0
         self.config: Dict[str, Any] = {}
+        # shared memory that `run_offloaded` keeps between calls, allocated on first use
+        self._shared: Optional[SharedArrays] = None
 
     async def initialize(self) -> None:
         """
@@ -77,9 +98,12 @@ class System:
     async def shutdown(self) -> None:
         """
         Clean up resources when the system is being removed.
-        Override in subclasses to handle resource cleanup.
+        Override in subclasses to handle resource cleanup, calling the base method to free the shared memory
+        kept by `run_offloaded`.
         """
-        pass
+        if self._shared is not None:
+            self._shared.close()
+            self._shared = None
 
     async def handle_error(self, error: Exception) -> None:
         """
@@ -101,6 +125,56 @@ class System:
         self.config.update(config)
         return self
 
+    async def run_offloaded(self, kernel: Callable[..., Any], arrays: Dict[str, np.ndarray], *args) -> Any:
+        """
+        Runs a number-crunching kernel on component arrays, in a worker process of `executor` if it is set.
+
+        The arrays are passed through shared memory rather than pickled, and the kernel's writes to them are
+        copied back into `arrays` once it finishes, so the system can apply them to its components on the
+        event loop. Meanwhile the loop stays free for other systems and I/O. The shared memory is kept between
+        calls and only reallocated for an array whose shape or dtype changed; `shutdown` frees it. A system
+        should await one offloaded kernel before starting the next.
+
+        Args:
+            kernel (Callable[..., Any]): A module-level function taking the arrays by name, then `args`. It
+                writes into the arrays in place and may return a small, picklable result that isn't a view of
+                them.
+            arrays (Dict[str, np.ndarray]): The arrays the kernel works on, by name. Updated in place.
+            *args: Further picklable arguments for the kernel.
+
+        Returns:
+            Any: The kernel's return value.
+        """
+        if self.executor is None:
+            return kernel(arrays, *args)
+
+        if self._shared is None:
+            self._shared = SharedArrays()
+        shared = self._shared
+        shared.update(arrays)
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(self.executor, run_kernel, kernel, dict(shared.specs), *args)
+        for name, array in arrays.items():
+            array[...] = shared.arrays[name]
+        return result
+
+    def conflicts_with(self, other: "System") -> bool:
+        """
+        Checks whether this system and another may not run concurrently.
+
+        Two systems conflict when either one writes a component type the other reads or writes (counting
+        subclasses), or when either one hasn't declared what it reads and writes.
+
+        Args:
+            other (System): The other system.
+
+        Returns:
+            bool: True if the systems must run one after the other.
+        """
+        if self.reads is None or self.writes is None or other.reads is None or other.writes is None:
+            return True
+        return _overlaps(self.writes, other.reads | other.writes) or _overlaps(other.writes, self.reads)
+
     def enable(self) -> None:
         """Enable the system."""
         self.enabled = True
@@ -118,3 +192,7 @@ class System:
             handler (Callable): The handler function to call when events occur.
         """
         self.event_bus.register_handler(event_pattern, handler)
+
+
+def _overlaps(first: Set[Type[Component]], second: Set[Type[Component]]) -> bool:
+    return any(issubclass(a, b) or issubclass(b, a) for a in first for b in second)
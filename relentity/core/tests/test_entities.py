@@ -77,3 +77,14 @@ async def test_get_component_with_subclasses(registry):
     await entity.add_component(dog)
 
     assert await entity.get_component(Animal, include_subclasses=True) == dog
+
+
+@pytest.mark.asyncio
+async def test_get_component_nowait(registry):
+    """Test the synchronous component accessors."""
+    entity = Entity[Position(x=3, y=4), Velocity(vx=1, vy=0)](registry)
+
+    assert entity.get_component_nowait(Position).x == 3
+    assert entity.get_component_nowait(Identity) is None
+    assert entity.has_components_nowait(Position, Velocity)
+    assert not entity.has_components_nowait(Position, Identity)
@@ -1,7 +1,9 @@
+import asyncio
 from unittest.mock import AsyncMock
 
 import pytest
 
+from relentity.core.event_bus import DispatchPolicy, EventBus
 from relentity.core.exceptions import InvalidEventNameError, InvalidEventPatternError
 
 
@@ -65,3 +67,118 @@ async def test_multiple_handlers(event_bus):
     # Assert
     handler1.assert_awaited_once_with("data")
     handler2.assert_awaited_once_with("data")
+
+
+@pytest.mark.asyncio
+async def test_plain_names_match_exactly(event_bus):
+    """Test that a handler registered without wildcards only receives that exact event."""
+    # Arrange
+    handler = AsyncMock()
+    event_bus.register_handler("test.event", handler)
+
+    # Act
+    await event_bus.emit("test.events", "data")
+    await event_bus.emit("test.event", "data")
+
+    # Assert
+    handler.assert_awaited_once_with("data")
+
+
+@pytest.mark.asyncio
+async def test_routes_are_cached_until_a_handler_is_registered(event_bus):
+    """Test that resolved handlers are reused and refreshed when handlers are added."""
+    # Arrange
+    exact = AsyncMock()
+    wildcard = AsyncMock()
+    event_bus.register_handler("test.event", exact)
+    await event_bus.emit("test.event", "first")
+
+    # Act
+    event_bus.register_handler("test.*", wildcard)
+    await event_bus.emit("test.event", "second")
+
+    # Assert
+    assert event_bus.handlers_for("test.event") is event_bus.handlers_for("test.event")
+    assert event_bus.handlers_for("test.event") == [exact, wildcard]
+    assert exact.await_count == 2
+    wildcard.assert_awaited_once_with("second")
+
+
+@pytest.mark.asyncio
+async def test_invalid_event_name_is_rejected_with_handlers(event_bus):
+    """Test that event names are still validated when they can't be resolved from the cache."""
+    # Arrange
+    event_bus.register_handler("*", AsyncMock())
+
+    # Act & Assert
+    with pytest.raises(InvalidEventNameError):
+        await event_bus.emit("invalid-event-name")
+
+
+def test_has_subscribers(event_bus):
+    """Test checking for handlers without emitting."""
+    # Arrange & Act & Assert
+    assert not event_bus.has_subscribers("test.event")
+
+    event_bus.register_handler("test.*", AsyncMock())
+    assert event_bus.has_subscribers("test.event")
+    assert not event_bus.has_subscribers("other.event")
+
+
+@pytest.mark.asyncio
+async def test_single_handler_is_awaited_without_gather(event_bus, monkeypatch):
+    """Test that one handler is awaited directly rather than through asyncio.gather."""
+    # Arrange
+    handler = AsyncMock()
+    event_bus.register_handler("test.event", handler)
+    gather = AsyncMock()
+    monkeypatch.setattr("relentity.core.event_bus.asyncio.gather", gather)
+
+    # Act
+    await event_bus.emit("test.event", "data")
+
+    # Assert
+    handler.assert_awaited_once_with("data")
+    gather.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_sequential_dispatch_runs_handlers_in_order():
+    """Test that sequential dispatch finishes each handler before starting the next."""
+    # Arrange
+    event_bus = EventBus(dispatch=DispatchPolicy.SEQUENTIAL)
+    calls = []
+
+    async def slow(data):
+        calls.append("slow started")
+        await asyncio.sleep(0)
+        calls.append("slow finished")
+
+    async def fast(data):
+        calls.append("fast")
+
+    event_bus.register_handler("test.event", slow)
+    event_bus.register_handler("test.*", fast)
+
+    # Act
+    await event_bus.emit("test.event")
+
+    # Assert
+    assert calls == ["slow started", "slow finished", "fast"]
+
+
+@pytest.mark.asyncio
+async def test_fire_and_forget_dispatch_does_not_wait():
+    """Test that fire-and-forget dispatch returns before the handlers run."""
+    # Arrange
+    event_bus = EventBus(dispatch=DispatchPolicy.FIRE_AND_FORGET)
+    handler = AsyncMock()
+    event_bus.register_handler("test.event", handler)
+
+    # Act
+    await event_bus.emit("test.event", "data")
+    handler.assert_not_awaited()
+    await asyncio.sleep(0)
+
+    # Assert
+    handler.assert_awaited_once_with("data")
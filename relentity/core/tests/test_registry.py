@@ -1,6 +1,11 @@
+from unittest.mock import AsyncMock
+
 import pytest
 
-from relentity.core import Entity
+from relentity.core import Entity, Component, Identity, Registry, System
+from relentity.core.events import ENTITY_CREATED_EVENT
+from relentity.core.exceptions import InvalidEventNameError
+from relentity.core.system_manager import SystemManager
 from relentity.spatial import Velocity, Position
 
 
@@ -30,3 +35,260 @@ async def test_remove_component_from_entity(registry):
 
     await registry.remove_component_from_entity(entity.id, Velocity)
     assert Velocity not in entity.components
+
+
+@pytest.mark.asyncio
+async def test_entities_are_grouped_by_archetype(registry):
+    """Test that entities with the same component types share an archetype."""
+    entity1 = Entity[Position(x=0, y=0), Velocity(vx=1, vy=1)](registry)
+    entity2 = Entity[Position(x=5, y=5), Velocity(vx=0, vy=0)](registry)
+    entity3 = Entity[Position(x=5, y=5)](registry)
+
+    assert registry.entity_archetypes[entity1.id] is registry.entity_archetypes[entity2.id]
+    assert registry.entity_archetypes[entity3.id].component_types == frozenset({Position})
+    assert len(registry.archetypes_with_components(Position)) == 2
+    assert len(registry.archetypes_with_components(Position, Velocity)) == 1
+
+
+@pytest.mark.asyncio
+async def test_entity_migrates_between_archetypes(registry):
+    """Test that adding and removing components moves an entity between archetypes."""
+    entity = Entity[Position(x=0, y=0)](registry)
+
+    await entity.add_component(Velocity(vx=1, vy=1))
+    assert registry.entity_archetypes[entity.id].component_types == frozenset({Position, Velocity})
+    assert [e.entity_id async for e in registry.entities_with_components(Position, Velocity)] == [entity.id]
+
+    await registry.remove_component_from_entity(entity.id, Velocity)
+    assert registry.entity_archetypes[entity.id].component_types == frozenset({Position})
+    assert [e async for e in registry.entities_with_components(Position, Velocity)] == []
+
+    await entity.add_component(Velocity(vx=1, vy=1))
+    await entity.remove_component(Velocity)
+    assert [e async for e in registry.entities_with_components(Velocity)] == []
+
+
+@pytest.mark.asyncio
+async def test_unregister_entity_removes_from_queries(registry):
+    """Test that unregistered entities are no longer returned by queries."""
+    entity = Entity[Position(x=0, y=0), Velocity(vx=1, vy=1)](registry)
+
+    await registry.unregister_entity(entity.id)
+
+    assert entity.id not in registry.entity_archetypes
+    assert entity.id not in registry.component_to_entity_ids[Position]
+    assert [e async for e in registry.entities_with_components(Position)] == []
+
+
+@pytest.mark.asyncio
+async def test_query_is_persistent(registry):
+    """Test that querying the same component types returns the same query object."""
+    assert registry.query(Position, Velocity) is registry.query(Velocity, Position)
+
+
+@pytest.mark.asyncio
+async def test_query_is_maintained_incrementally(registry):
+    """Test that query membership and version follow entity changes."""
+    existing = Entity[Position(x=0, y=0), Velocity(vx=1, vy=1)](registry)
+    query = registry.query(Position, Velocity)
+    assert set(query) == {existing.id}
+    version = query.version
+
+    entity = Entity[Position(x=0, y=0)](registry)
+    assert entity.id not in query
+    assert query.version == version
+
+    await entity.add_component(Velocity(vx=1, vy=1))
+    assert entity.id in query
+    assert query.version == version + 1
+
+    # replacing a component doesn't change membership
+    await entity.add_component(Velocity(vx=2, vy=2))
+    assert query.version == version + 1
+
+    await registry.remove_component_from_entity(entity.id, Velocity)
+    assert entity.id not in query
+
+    await registry.unregister_entity(existing.id)
+    assert len(query) == 0
+    assert query.version == version + 3
+
+
+@pytest.mark.asyncio
+async def test_query_snapshot_is_cached(registry):
+    """Test that the query snapshot is only rebuilt when membership changes."""
+    Entity[Position(x=0, y=0)](registry)
+    query = registry.query(Position)
+
+    snapshot = query.snapshot()
+    assert query.snapshot() is snapshot
+
+    Entity[Position(x=1, y=1)](registry)
+    assert query.snapshot() is not snapshot
+    assert len(query.snapshot()) == 2
+
+
+@pytest.mark.asyncio
+async def test_include_subclasses_query_uses_index(registry):
+    """Test that subclass queries are answered from the component base index."""
+
+    class Animal(Component):
+        species: str
+
+    class Dog(Animal):
+        breed: str
+
+    dog = Entity[Dog(species="canine", breed="retriever")](registry)
+    Entity[Position(x=0, y=0)](registry)
+
+    assert registry.component_base_to_entity_ids[Animal] == {dog.id}
+    assert [e.entity_id async for e in registry.entities_with_components(Animal, include_subclasses=True)] == [dog.id]
+    assert [e async for e in registry.entities_with_components(Animal)] == []
+
+    await dog.remove_component(Dog)
+    assert [e async for e in registry.entities_with_components(Animal, include_subclasses=True)] == []
+    assert registry.component_base_to_entity_ids[Animal] == set()
+
+
+@pytest.mark.asyncio
+async def test_entities_with_components_nowait(registry):
+    """Test the synchronous query iterator and reference resolution."""
+    entity = Entity[Position(x=10, y=10), Velocity(vx=5, vy=5)](registry)
+
+    refs = list(registry.entities_with_components_nowait(Position, Velocity))
+    assert [ref.resolve_nowait() for ref in refs] == [entity]
+    assert registry.get_entity_by_id_nowait(entity.id) is entity
+    assert list(registry.entities_with_components_nowait()) == []
+
+
+@pytest.mark.asyncio
+async def test_iter_components(registry):
+    """Test iterating component tuples straight from the registry."""
+    entity = Entity[Position(x=10, y=10), Velocity(vx=5, vy=5)](registry)
+    Entity[Position(x=0, y=0)](registry)
+
+    rows = list(registry.iter_components(Velocity, Position))
+    assert rows == [(entity.id, entity.components[Velocity], entity.components[Position])]
+
+
+@pytest.mark.asyncio
+async def test_iter_components_skips_entities_changed_while_iterating(registry):
+    """Test that entities losing a component mid-iteration are skipped."""
+    entities = [Entity[Position(x=i, y=i), Velocity(vx=1, vy=1)](registry) for i in range(4)]
+
+    seen = []
+    for entity_id, position, velocity in registry.iter_components(Position, Velocity):
+        seen.append(entity_id)
+        for entity in entities:
+            if entity.id not in seen and Velocity in entity.components:
+                await entity.remove_component(Velocity)
+
+    assert len(seen) == 1
+
+
+@pytest.mark.asyncio
+async def test_iter_component_chunks(registry):
+    """Test that chunked iteration yields every row in bounded chunks."""
+    for i in range(5):
+        Entity[Position(x=i, y=i)](registry)
+
+    chunks = list(registry.iter_component_chunks(Position, chunk_size=2))
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert sorted(position.x for chunk in chunks for _, position in chunk) == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_deferred_events_wait_for_flush():
+    """Test that deferred events are queued until flushed, then dispatched in order and in batches."""
+    # Arrange
+    registry = Registry(deferred_events=True)
+    received = []
+    batches = []
+
+    async def on_batch(batch):
+        batches.append(batch)
+
+    registry.register_batch_handler("entity.component_*", on_batch)
+    entity = Entity(registry)
+    entity.event_bus.register_handler("entity.*", AsyncMock(side_effect=lambda data: received.append(data)))
+    first, second = Identity(name="a", description="a"), Position(x=0, y=0)
+    entity.add_component_sync(first)
+    entity.add_component_sync(second)
+
+    # Act & Assert
+    assert len(registry.pending_events) == 3
+    assert received == []
+
+    assert await registry.flush_events() == 3
+    assert received == [entity, (entity, first), (entity, second)]
+    assert batches == [[(entity, first), (entity, second)]]
+    assert registry.pending_events == []
+
+
+@pytest.mark.asyncio
+async def test_system_manager_flushes_deferred_events():
+    """Test that the system manager dispatches queued events before running systems."""
+    # Arrange
+    registry = Registry(deferred_events=True)
+    manager = SystemManager()
+    system = System(registry)
+    system.update = AsyncMock()
+    manager.add_system(system)
+    entity = Entity(registry)
+    handler = AsyncMock()
+    entity.event_bus.register_handler(ENTITY_CREATED_EVENT, handler)
+
+    # Act
+    await manager.update()
+
+    # Assert
+    handler.assert_awaited_once_with(entity)
+    system.update.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_subscribe_observes_events_of_every_entity(registry):
+    """Test that a registry-wide subscriber receives an event type from all entities, filtered by component."""
+    # Arrange
+    handler = AsyncMock()
+    positioned = AsyncMock()
+    registry.subscribe("area.*", handler)
+    registry.subscribe("area.entered", positioned, Position)
+    first = Entity[Position(x=0, y=0)](registry)
+    second = Entity(registry)
+
+    # Act
+    await first.event_bus.emit("area.entered", "first")
+    await second.event_bus.emit("area.exited", "second")
+    await second.event_bus.emit("area.entered", "second")
+
+    # Assert
+    assert handler.await_args_list == [((first, "first"),), ((second, "second"),), ((second, "second"),)]
+    positioned.assert_awaited_once_with(first, "first")
+    assert first.event_bus.has_subscribers("area.entered")
+    assert not first.event_bus.has_subscribers("task.progress")
+
+
+@pytest.mark.asyncio
+async def test_entity_event_bus_is_a_view_until_handlers_are_registered(registry):
+    """Test that entity buses start without handlers and only call the handlers registered on them."""
+    # Arrange
+    entity = Entity(registry)
+    other = Entity(registry)
+    handler = AsyncMock()
+
+    # Act & Assert
+    assert entity.event_bus.handlers == {}
+    assert not entity.event_bus.has_subscribers("area.entered")
+    with pytest.raises(InvalidEventNameError):
+        await entity.event_bus.emit("invalid-event-name")
+
+    entity.event_bus.register_handler("area.entered", handler)
+    assert entity.event_bus.has_subscribers("area.entered")
+    assert other.event_bus.handlers == {}
+    assert not other.event_bus.has_subscribers("area.entered")
+
+    await other.event_bus.emit("area.entered", "other data")
+    handler.assert_not_awaited()
+    await entity.event_bus.emit("area.entered", "data")
+    handler.assert_awaited_once_with("data")
@@ -0,0 +1,166 @@
+import asyncio
+
+import pytest
+
+from relentity.core.components import Identity
+from relentity.core.system_manager import SystemManager
+from relentity.core.systems import System
+from relentity.spatial import Position, SpatialRegistry, Velocity
+from relentity.spatial.sound.systems import AudioSystem
+from relentity.spatial.systems import MovementSystem
+from relentity.spatial.vision.systems import VisionSystem
+from relentity.tasks.systems import TaskSystem
+
+
+class RecordingSystem(System):
+    """A system that records the delta time of every update."""
+
+    def __init__(self, registry, calls, priority=100):
+        super().__init__(registry)
+        self.calls = calls
+        self.priority = priority
+        self.delta_times = []
+
+    async def update(self, delta_time: float = 0) -> None:
+        self.calls.append(self)
+        self.delta_times.append(delta_time)
+
+
+@pytest.mark.asyncio
+async def test_systems_run_in_priority_order(registry):
+    calls = []
+    manager = SystemManager()
+    late = RecordingSystem(registry, calls, priority=200)
+    early = RecordingSystem(registry, calls, priority=10)
+    manager.add_system(late)
+    manager.add_system(early)
+
+    await manager.update(0.5)
+
+    assert calls == [early, late]
+    assert early.delta_times == [0.5]
+
+
+@pytest.mark.asyncio
+async def test_fixed_rate_system_runs_once_per_step(registry):
+    manager = SystemManager()
+    system = RecordingSystem(registry, [])
+    manager.add_system(system, tick_rate=4)
+
+    for _ in range(8):
+        await manager.update(0.125)
+
+    # 1 second at 4 Hz, always with the fixed step
+    assert system.delta_times == [0.25] * 4
+
+
+@pytest.mark.asyncio
+async def test_fixed_rate_system_catches_up_within_limit(registry):
+    manager = SystemManager()
+    system = RecordingSystem(registry, [])
+    system.tick_rate = 8
+    system.max_catch_up_ticks = 3
+    manager.add_system(system)
+
+    # a 1.0625 second hitch owes 8.5 steps, but only 3 run and the whole missed steps are dropped
+    await manager.update(1.0625)
+    assert len(system.delta_times) == 3
+
+    await manager.update(0.0625)
+    assert len(system.delta_times) == 4
+
+
+def test_tick_rate_must_be_positive(registry):
+    with pytest.raises(ValueError):
+        SystemManager().add_system(RecordingSystem(registry, []), tick_rate=0)
+
+
+class AccessSystem(System):
+    """A system with declared component access that hands off to a partner system mid-update."""
+
+    def __init__(self, registry, reads, writes, priority=100):
+        super().__init__(registry)
+        self.reads = reads
+        self.writes = writes
+        self.priority = priority
+        self.started = asyncio.Event()
+        self.partner = None
+
+    async def update(self, delta_time: float = 0) -> None:
+        self.started.set()
+        if self.partner is not None:
+            # only finishes if the partner starts while this system is still running
+            await asyncio.wait_for(self.partner.started.wait(), timeout=0.1)
+
+
+def test_stages_follow_declared_access(registry):
+    manager = SystemManager(concurrent=True)
+    writes_position = AccessSystem(registry, reads={Velocity}, writes={Position}, priority=10)
+    reads_position = AccessSystem(registry, reads={Position}, writes=set(), priority=20)
+    unrelated = AccessSystem(registry, reads={Identity}, writes=set(), priority=30)
+    undeclared = RecordingSystem(registry, [], priority=40)
+    for system in (undeclared, unrelated, reads_position, writes_position):
+        manager.add_system(system)
+
+    assert manager.stages == [[writes_position, unrelated], [reads_position], [undeclared]]
+    assert SystemManager(concurrent=False).stages == []
+
+
+@pytest.mark.asyncio
+async def test_non_conflicting_systems_run_concurrently(registry):
+    manager = SystemManager(concurrent=True)
+    first = AccessSystem(registry, reads={Position}, writes=set())
+    second = AccessSystem(registry, reads={Position}, writes={Identity})
+    first.partner = second
+    manager.add_system(first)
+    manager.add_system(second)
+
+    await manager.update()
+
+    assert first.execution_count == second.execution_count == 1
+
+
+@pytest.mark.parametrize("concurrent", [False, True], ids=["sequential", "concurrent"])
+@pytest.mark.asyncio
+async def test_undeclared_systems_run_one_at_a_time_in_registration_order(registry, concurrent):
+    calls = []
+    manager = SystemManager(concurrent=concurrent)
+    systems = [RecordingSystem(registry, calls) for _ in range(4)]
+    declared = AccessSystem(registry, reads={Position}, writes=set())
+    for system in (*systems[:2], declared, *systems[2:]):
+        manager.add_system(system)
+
+    await manager.update()
+
+    assert calls == systems
+    assert manager.stages == [[systems[0]], [systems[1]], [declared], [systems[2]], [systems[3]]]
+
+
+def test_concurrency_is_opt_in():
+    assert SystemManager().concurrent is False
+
+
+@pytest.mark.asyncio
+async def test_sequential_manager_runs_one_system_at_a_time(registry):
+    manager = SystemManager(concurrent=False)
+    first = AccessSystem(registry, reads={Position}, writes=set())
+    second = AccessSystem(registry, reads={Position}, writes=set())
+    first.partner = second
+    manager.add_system(first)
+    manager.add_system(second)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await manager.update()
+
+
+def test_built_in_perception_systems_run_together_after_movement():
+    registry = SpatialRegistry()
+    manager = SystemManager(concurrent=True)
+    movement = MovementSystem(registry)
+    vision = VisionSystem(registry)
+    audio = AudioSystem(registry)
+    tasks = TaskSystem(registry)
+    for system in (movement, vision, audio, tasks):
+        manager.add_system(system)
+
+    assert manager.stages == [[movement, tasks], [vision, audio]]
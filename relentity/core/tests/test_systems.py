@@ -1,3 +1,6 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
 import pytest
 
 from relentity.core.systems import System
@@ -45,3 +48,67 @@ async def test_custom_system(registry):
 
     # Assert
     assert system.updated
+
+
+def double_in_place(arrays, factor):
+    """A kernel that scales an array in place and returns its sum."""
+    arrays["values"] *= factor
+    return float(arrays["values"].sum())
+
+
+@pytest.mark.parametrize("use_pool", [False, True], ids=["inline", "process_pool"])
+@pytest.mark.asyncio
+async def test_run_offloaded_writes_back_kernel_results(registry, use_pool):
+    """Test that a kernel's in-place writes reach the caller's arrays, with or without a worker process."""
+    # Arrange
+    system = System(registry)
+    values = np.arange(6, dtype=np.float64).reshape(3, 2)
+    empty = np.empty((0, 2))
+
+    # Act
+    if use_pool:
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            system.executor = executor
+            total = await system.run_offloaded(double_in_place, {"values": values, "empty": empty}, 2.0)
+    else:
+        total = await system.run_offloaded(double_in_place, {"values": values, "empty": empty}, 2.0)
+
+    # Assert
+    assert total == 30.0
+    assert values.tolist() == [[0, 2], [4, 6], [8, 10]]
+
+
+def add_one(arrays):
+    """A kernel that adds one to every array in place."""
+    for array in arrays.values():
+        array += 1
+
+
+@pytest.mark.asyncio
+async def test_run_offloaded_keeps_shared_memory_between_calls(registry):
+    """Test that offloading again reuses the shared memory blocks until an array's shape or dtype changes."""
+    # Arrange
+    system = System(registry)
+    values = np.zeros((3, 2))
+    flags = np.zeros(3, dtype=np.int32)
+
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        system.executor = executor
+
+        # Act
+        await system.run_offloaded(add_one, {"values": values, "flags": flags})
+        first = dict(system._shared.specs)
+        await system.run_offloaded(add_one, {"values": values, "flags": flags})
+        second = dict(system._shared.specs)
+        grown = np.zeros((4, 2))
+        await system.run_offloaded(add_one, {"values": grown, "flags": flags.astype(np.float64)})
+        third = dict(system._shared.specs)
+        await system.shutdown()
+
+    # Assert
+    assert second == first
+    assert values.tolist() == [[2, 2]] * 3
+    assert third["values"][0] != first["values"][0]
+    assert third["flags"][0] != first["flags"][0]
+    assert grown.tolist() == [[1, 1]] * 4
+    assert system._shared is None
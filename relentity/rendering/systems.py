@@ -38,6 +38,10 @@ def wrap_text(text, font, max_width):
 class RenderSystem(System):
     """System that renders entities with visual components to a pygame surface."""
 
+    reads = {Position, Velocity, RenderLayer, RenderableShape, RenderableColor, RenderableImage, SpeechBubble}
+    # image rotations and sprite frames are advanced while rendering
+    writes = {VelocityFacingImage, AnimatedSprite}
+
     def __init__(self, registry, width=800, height=600, title="Relentity Simulation"):
         super().__init__(registry)
         self.width = width
@@ -73,14 +77,13 @@ class RenderSystem(System):
 
         # Get all renderable entities grouped by layer
         render_layers = {}
-        async for entity_ref in self.registry.entities_with_components(Position):
+        for entity_id, position in self.registry.iter_components(Position):
             try:
-                entity = await entity_ref.resolve()
-                position = await entity.get_component(Position)
+                entity = self.registry.get_entity_by_id_nowait(entity_id)
 
                 # Get layer (use default if not present)
                 layer = 0
-                layer_component = await entity.get_component(RenderLayer)
+                layer_component = entity.get_component_nowait(RenderLayer)
                 if layer_component:
                     layer = layer_component.layer
 
@@ -88,33 +91,33 @@ class RenderSystem(System):
                     render_layers[layer] = []
 
                 # Check for VelocityFacingImage first
-                velocity_facing_image = await entity.get_component(VelocityFacingImage)
+                velocity_facing_image = entity.get_component_nowait(VelocityFacingImage)
                 if velocity_facing_image:
-                    velocity = await entity.get_component(Velocity)
+                    velocity = entity.get_component_nowait(Velocity)
                     if velocity:
                         velocity_facing_image.update_rotation(velocity)
                     render_layers[layer].append(("velocity_image", entity, position, velocity_facing_image))
                     continue
 
                 # Check for AnimatedSprite
-                animated_sprite = await entity.get_component(AnimatedSprite)
+                animated_sprite = entity.get_component_nowait(AnimatedSprite)
                 if animated_sprite:
                     animated_sprite.update(delta_time)
                     render_layers[layer].append(("animated_sprite", entity, position, animated_sprite))
                     continue
 
                 # Check for RenderableImage
-                image_component = await entity.get_component(RenderableImage)
+                image_component = entity.get_component_nowait(RenderableImage)
                 if image_component:
                     render_layers[layer].append(("image", entity, position, image_component))
                     continue
 
                 # Check for RenderableShape
-                shape = await entity.get_component(RenderableShape)
+                shape = entity.get_component_nowait(RenderableShape)
                 if shape:
                     # Get color (use default if not present)
                     color = (255, 255, 255, 255)
-                    color_component = await entity.get_component(RenderableColor)
+                    color_component = entity.get_component_nowait(RenderableColor)
                     if color_component:
                         color = color_component.rgba
 
@@ -142,7 +145,7 @@ class RenderSystem(System):
 
                     # Update rotation based on velocity if needed
                     if animated_sprite.velocity_facing:
-                        velocity = await entity.get_component(Velocity)
+                        velocity = entity.get_component_nowait(Velocity)
                         if velocity:
                             animated_sprite.update_rotation(velocity)
 
@@ -190,7 +193,7 @@ class RenderSystem(System):
                         pygame.draw.polygon(self.screen, color, points)
 
                 # Render speech bubble if present
-                speech_bubble = await entity.get_component(SpeechBubble)
+                speech_bubble = entity.get_component_nowait(SpeechBubble)
                 if speech_bubble and time.time() - speech_bubble.start_time < speech_bubble.duration:
                     font = pygame.font.Font(None, 24)
                     max_width = 200  # Maximum width of the speech bubble
@@ -1,8 +1,11 @@
 from .components import Position, Velocity, Area, Located
 from .systems import MovementSystem
 from .registry import SpatialRegistry
+from .storage import DenseMotionStore
 from .events import (
     POSITION_UPDATED_EVENT_TYPE,
+    POSITIONS_UPDATED_EVENT_TYPE,
+    PositionsUpdatedEvent,
 )
 
 __all__ = [
@@ -12,5 +15,8 @@ __all__ = [
     "Area",
     "MovementSystem",
     "SpatialRegistry",
+    "DenseMotionStore",
     "POSITION_UPDATED_EVENT_TYPE",
+    "POSITIONS_UPDATED_EVENT_TYPE",
+    "PositionsUpdatedEvent",
 ]
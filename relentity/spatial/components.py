@@ -1,9 +1,10 @@
-from typing import Annotated, TYPE_CHECKING
+from typing import Annotated, Callable, ClassVar, Dict, Optional, Tuple, TYPE_CHECKING
 
+import numpy as np
 from pydantic import PrivateAttr, model_validator
 
 from relentity.core import Component
-from .utils import is_simple_polygon, point_in_polygon
+from .utils import is_simple_polygon, point_in_polygon, points_in_polygon, polygon_edges
 from ..core.entity_ref import EntityRef
 
 if TYPE_CHECKING:
@@ -14,6 +15,9 @@ class Position(Component):
     """
     Component representing the position of an entity in 2D space.
 
+    Writes to `x` and `y` are reported to the SpatialRegistry holding the component, so its spatial indexes
+    never answer from a stale position.
+
     Attributes:
         x (float): The x-coordinate of the entity.
         y (float): The y-coordinate of the entity.
@@ -22,6 +26,15 @@ class Position(Component):
     x: float
     y: float
 
+    # the callbacks of the registries watching a Position, by id; a registry adds one while it holds the component
+    _write_hooks: ClassVar[Dict[int, Callable[[], None]]] = {}
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        hook = Position._write_hooks.get(id(self))
+        if hook is not None:
+            hook()
+
 
 class Velocity(Component):
     """
@@ -37,11 +50,23 @@ class Velocity(Component):
 
 
 class Area(Component):
-    """ """
+    """
+    Component representing a polygonal area entities can be located in.
+
+    The area's bounding box and edge array are computed once per geometry and cached, so membership tests
+    can prefilter by box and test many points with one array operation. Assigning `geometry` clears the
+    cache and bumps `geometry_version`; change the shape by assigning a new list, not by mutating it.
+
+    Attributes:
+        center_point (tuple[float, float]): The nominal center of the area.
+        geometry (list[tuple[float, float]]): The vertices of the area's simple polygon, in order.
+    """
 
     center_point: tuple[float, float] = (0.0, 0.0)
     geometry: list[tuple[float, float]]
     _entities: Annotated[set[EntityRef], PrivateAttr()] = set()
+    _prepared: Annotated[Optional[tuple], PrivateAttr()] = None
+    _geometry_version: Annotated[int, PrivateAttr()] = 0
 
     @model_validator(mode="after")
     def validate_geometry(cls, self):
@@ -49,6 +74,52 @@ class Area(Component):
             raise ValueError("The geometry is not a simple polygon.")
         return self
 
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name == "geometry":
+            self._prepared = None
+            self._geometry_version += 1
+
+    @property
+    def geometry_version(self) -> int:
+        """
+        A counter incremented whenever `geometry` is assigned.
+
+        Returns:
+            int: The current geometry version.
+        """
+        return self._geometry_version
+
+    def _prepare(self) -> tuple:
+        if self._prepared is None:
+            edges = polygon_edges(self.geometry)
+            bounds = (
+                float(edges[:, 0].min()),
+                float(edges[:, 1].min()),
+                float(edges[:, 0].max()),
+                float(edges[:, 1].max()),
+            )
+            self._prepared = (bounds, edges)
+        return self._prepared
+
+    def get_bounds(self) -> Tuple[float, float, float, float]:
+        """
+        Returns the axis-aligned bounding box of the area.
+
+        Returns:
+            Tuple[float, float, float, float]: The min x, min y, max x and max y of the geometry.
+        """
+        return self._prepare()[0]
+
+    def get_edges(self) -> np.ndarray:
+        """
+        Returns the edges of the area's polygon, for use with `points_in_polygon`.
+
+        Returns:
+            np.ndarray: An (n, 4) array holding the x1, y1, x2, y2 of each edge.
+        """
+        return self._prepare()[1]
+
     def point_within_bounds(self, x, y):
         """
         Check if a point is within the bounds of the location.
@@ -59,7 +130,20 @@ class Area(Component):
         Returns:
             bool: True if the point is within the bounds, False otherwise.
         """
-        point_in_polygon(x, y, self.geometry)
+        return point_in_polygon(x, y, self.geometry)
+
+    def points_within_bounds(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """
+        Checks many points against the area at once.
+
+        Args:
+            xs (np.ndarray): The x-coordinates of the points.
+            ys (np.ndarray): The y-coordinates of the points.
+
+        Returns:
+            np.ndarray: A boolean array, True for each point within the area.
+        """
+        return points_in_polygon(xs, ys, self.get_edges())
 
 
 class Located(Component):
@@ -1,8 +1,14 @@
+import uuid
+from typing import List
+
+import numpy as np
+
 from relentity.core import EntityRef
 from .components import Velocity, Position, Area
 
 ENTITY_SEEN_EVENT_TYPE = "entity_seen"
 POSITION_UPDATED_EVENT_TYPE = "position_updated"
+POSITIONS_UPDATED_EVENT_TYPE = "positions_updated"
 SOUND_HEARD_EVENT_TYPE = "sound_heard"
 SOUND_CREATED_EVENT_TYPE = "sound_created"
 AREA_ENTERED_EVENT_TYPE = "area.entered"
@@ -33,6 +39,30 @@ class EntitySeenEvent:
         self.velocity = velocity
 
 
+class PositionsUpdatedEvent:
+    """
+    Event representing every entity moved by a single movement tick.
+
+    Attributes:
+        entity_ids (List[uuid.UUID]): The ids of the entities that moved.
+        positions (np.ndarray): A (len(entity_ids), 2) array of their new x, y coordinates, in the same order.
+    """
+
+    def __init__(self, entity_ids: List[uuid.UUID], positions: np.ndarray):
+        """
+        Initializes a PositionsUpdatedEvent.
+
+        Args:
+            entity_ids (List[uuid.UUID]): The ids of the entities that moved.
+            positions (np.ndarray): The new x, y coordinates of the entities, in the same order.
+        """
+        self.entity_ids = entity_ids
+        self.positions = positions
+
+    def __len__(self) -> int:
+        return len(self.entity_ids)
+
+
 class SoundEvent:
     """
     Event representing a sound.
@@ -0,0 +1,237 @@
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+def _pairs_before(ends: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Expands "position p pairs with every position q in (p, ends[p])" into two index arrays.
+
+    Args:
+        ends (np.ndarray): For each position, the exclusive end of the run of positions it pairs with.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The first and second position of every pair.
+    """
+    positions = np.arange(len(ends))
+    counts = np.maximum(ends - positions - 1, 0)
+    first = np.repeat(positions, counts)
+    run_starts = np.repeat(np.cumsum(counts) - counts, counts)
+    second = first + 1 + (np.arange(len(first)) - run_starts)
+    return first, second
+
+
+def _overlapping_pairs(bounds: np.ndarray, first: np.ndarray, second: np.ndarray) -> np.ndarray:
+    """
+    Keeps the candidate pairs whose boxes overlap, as unique (i, j) rows with i < j in lexicographic order.
+
+    Args:
+        bounds (np.ndarray): The (n, 4) min x, min y, max x, max y of every body.
+        first (np.ndarray): The first body index of every candidate pair.
+        second (np.ndarray): The second body index of every candidate pair.
+
+    Returns:
+        np.ndarray: A (k, 2) integer array of overlapping pairs.
+    """
+    low = np.minimum(first, second)
+    high = np.maximum(first, second)
+    overlapping = (
+        (low != high)
+        & (bounds[low, 0] <= bounds[high, 2])
+        & (bounds[high, 0] <= bounds[low, 2])
+        & (bounds[low, 1] <= bounds[high, 3])
+        & (bounds[high, 1] <= bounds[low, 3])
+    )
+    keys = np.unique(low[overlapping] * len(bounds) + high[overlapping])
+    return np.column_stack((keys // len(bounds), keys % len(bounds))).astype(np.intp)
+
+
+class BroadPhase:
+    """
+    Base class for collision broad phases.
+
+    A broad phase cheaply finds the pairs of bodies whose axis-aligned bounding boxes overlap (touching
+    counts), so the narrow phase only runs exact shape tests on those. Pairs are returned in the order a
+    pairwise loop over the bodies would visit them, so the collision response doesn't depend on the
+    broad phase in use.
+    """
+
+    def find_pairs(self, bounds: np.ndarray) -> np.ndarray:
+        """
+        Finds the pairs of bodies whose bounding boxes overlap.
+
+        Args:
+            bounds (np.ndarray): The (n, 4) min x, min y, max x, max y of every body.
+
+        Returns:
+            np.ndarray: A (k, 2) integer array of (i, j) body indices with i < j, in lexicographic order.
+
+        Raises:
+            NotImplementedError: If the method is not overridden by a subclass.
+        """
+        raise NotImplementedError
+
+
+class BruteForceBroadPhase(BroadPhase):
+    """Tests the bounding boxes of every pair of bodies. Useful as a reference and for very small worlds."""
+
+    def find_pairs(self, bounds: np.ndarray) -> np.ndarray:
+        first, second = np.triu_indices(len(bounds), k=1)
+        return _overlapping_pairs(bounds, first, second)
+
+
+class SweepAndPruneBroadPhase(BroadPhase):
+    """
+    Sorts the bodies by the left edge of their bounding box and pairs each body only with the bodies
+    that start before it ends on the x axis, then checks the y axis.
+    """
+
+    def find_pairs(self, bounds: np.ndarray) -> np.ndarray:
+        if len(bounds) < 2:
+            return np.empty((0, 2), dtype=np.intp)
+
+        order = np.argsort(bounds[:, 0], kind="stable")
+        starts = bounds[order, 0]
+        # every body whose left edge is at most this body's right edge overlaps it on x
+        ends = np.searchsorted(starts, bounds[order, 2], side="right")
+        first, second = _pairs_before(ends)
+        return _overlapping_pairs(bounds, order[first], order[second])
+
+
+class UniformGridBroadPhase(BroadPhase):
+    """
+    Inserts every body into the grid cells its bounding box covers and pairs the bodies sharing a cell.
+
+    Attributes:
+        cell_size (float): The side length of a cell. Works best at about the size of a typical body.
+    """
+
+    def __init__(self, cell_size: float = 32.0):
+        """
+        Initializes the UniformGridBroadPhase.
+
+        Args:
+            cell_size (float, optional): The side length of a cell. Defaults to 32.0.
+
+        Raises:
+            ValueError: If the cell size is not positive.
+        """
+        if cell_size <= 0:
+            raise ValueError(f"Cell size must be positive, got {cell_size}")
+        self.cell_size = cell_size
+
+    def find_pairs(self, bounds: np.ndarray) -> np.ndarray:
+        if len(bounds) < 2:
+            return np.empty((0, 2), dtype=np.intp)
+
+        low_cells = np.floor(bounds[:, :2] / self.cell_size).astype(np.int64)
+        high_cells = np.floor(bounds[:, 2:] / self.cell_size).astype(np.int64)
+        spans = high_cells - low_cells + 1
+        cell_counts = spans[:, 0] * spans[:, 1]
+
+        # one row per (body, covered cell)
+        bodies = np.repeat(np.arange(len(bounds)), cell_counts)
+        offsets = np.arange(len(bodies)) - np.repeat(np.cumsum(cell_counts) - cell_counts, cell_counts)
+        columns = low_cells[bodies, 0] + offsets // spans[bodies, 1]
+        rows = low_cells[bodies, 1] + offsets % spans[bodies, 1]
+
+        order = np.lexsort((bodies, rows, columns))
+        columns = columns[order]
+        rows = rows[order]
+        bodies = bodies[order]
+
+        # every row pairs with the later rows of the same cell
+        boundaries = np.flatnonzero((np.diff(columns) != 0) | (np.diff(rows) != 0)) + 1
+        cell_ends = np.append(boundaries, len(bodies))
+        ends = np.repeat(cell_ends, np.diff(np.concatenate(([0], cell_ends))))
+        first, second = _pairs_before(ends)
+        return _overlapping_pairs(bounds, bodies[first], bodies[second])
+
+
+class BoundsIndex:
+    """
+    A fixed set of bounding boxes, sorted by their left edge, that other boxes can be tested against.
+
+    Used for the bodies that don't move on their own (static and sleeping bodies), so their boxes are sorted
+    once and every update only sweeps the awake bodies' boxes through them.
+
+    Attributes:
+        bounds (np.ndarray): The (m, 4) min x, min y, max x, max y of every indexed box.
+    """
+
+    def __init__(self, bounds: np.ndarray):
+        """
+        Initializes the BoundsIndex.
+
+        Args:
+            bounds (np.ndarray): The (m, 4) boxes to index.
+        """
+        self.bounds = bounds
+        self._order = np.argsort(bounds[:, 0], kind="stable")
+        self._starts = bounds[self._order, 0]
+        self._max_width = float((bounds[:, 2] - bounds[:, 0]).max()) if len(bounds) else 0.0
+
+    def __len__(self) -> int:
+        return len(self.bounds)
+
+    def find_overlaps(self, bounds: np.ndarray) -> np.ndarray:
+        """
+        Finds the indexed boxes that overlap each of the given boxes (touching counts).
+
+        Args:
+            bounds (np.ndarray): The (n, 4) boxes to test.
+
+        Returns:
+            np.ndarray: A (k, 2) integer array of (given box, indexed box) index pairs.
+        """
+        if not len(bounds) or not len(self.bounds):
+            return np.empty((0, 2), dtype=np.intp)
+
+        # an indexed box overlaps on x only if it starts within its widest width before the tested box does
+        begins = np.searchsorted(self._starts, bounds[:, 0] - self._max_width, side="left")
+        ends = np.searchsorted(self._starts, bounds[:, 2], side="right")
+        counts = np.maximum(ends - begins, 0)
+        tested = np.repeat(np.arange(len(bounds)), counts)
+        run_starts = np.repeat(np.cumsum(counts) - counts, counts)
+        indexed = self._order[np.repeat(begins, counts) + (np.arange(len(tested)) - run_starts)]
+
+        overlapping = (
+            (self.bounds[indexed, 0] <= bounds[tested, 2])
+            & (bounds[tested, 0] <= self.bounds[indexed, 2])
+            & (self.bounds[indexed, 1] <= bounds[tested, 3])
+            & (bounds[tested, 1] <= self.bounds[indexed, 3])
+        )
+        return np.column_stack((tested[overlapping], indexed[overlapping])).astype(np.intp)
+
+
+def find_awake_pairs(
+    broad_phase: BroadPhase,
+    awake: np.ndarray,
+    awake_bounds: np.ndarray,
+    resting: np.ndarray,
+    resting_index: Optional[BoundsIndex],
+) -> np.ndarray:
+    """
+    Finds the overlapping pairs that involve an awake body: the broad phase runs on the awake bodies only, and
+    their boxes are tested against the index of the resting bodies. Pairs of two resting bodies are skipped.
+
+    Args:
+        broad_phase (BroadPhase): Finds the pairs among the awake bodies.
+        awake (np.ndarray): The body index of every awake body.
+        awake_bounds (np.ndarray): The (len(awake), 4) boxes of the awake bodies.
+        resting (np.ndarray): The body index of every resting body, in the order of `resting_index`.
+        resting_index (Optional[BoundsIndex]): The boxes of the resting bodies, or None if there are none.
+
+    Returns:
+        np.ndarray: A (k, 2) integer array of (i, j) body indices with i < j, in lexicographic order.
+    """
+    pairs = awake[broad_phase.find_pairs(awake_bounds)].reshape(-1, 2)
+    if resting_index is None or not len(resting_index):
+        return pairs
+
+    overlaps = resting_index.find_overlaps(awake_bounds)
+    if not len(overlaps):
+        return pairs
+    pairs = np.vstack((pairs, np.column_stack((awake[overlaps[:, 0]], resting[overlaps[:, 1]]))))
+    pairs.sort(axis=1)
+    return pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
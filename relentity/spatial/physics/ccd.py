@@ -0,0 +1,146 @@
+from typing import Optional, Tuple
+
+from relentity.spatial.physics.components import ShapeBody, ShapeType
+
+# A hit: the fraction of the displacement at which the bodies touch, and the contact normal pointing from the
+# second body toward the first
+Impact = Tuple[float, float, float]
+
+
+def swept_circle_circle(
+    x: float, y: float, dx: float, dy: float, other_x: float, other_y: float, radius_sum: float
+) -> Optional[Impact]:
+    """
+    Finds when a circle moving by (dx, dy) first touches a resting circle.
+
+    Args:
+        x (float): The x-coordinate of the moving circle's center.
+        y (float): The y-coordinate of the moving circle's center.
+        dx (float): The displacement of the moving circle along x.
+        dy (float): The displacement of the moving circle along y.
+        other_x (float): The x-coordinate of the resting circle's center.
+        other_y (float): The y-coordinate of the resting circle's center.
+        radius_sum (float): The sum of both radii.
+
+    Returns:
+        Optional[Tuple[float, float, float]]: The time of impact in [0, 1] and the contact normal, or None if
+            the circles don't touch during the move or already overlap at its start.
+    """
+    fx = x - other_x
+    fy = y - other_y
+    c = fx * fx + fy * fy - radius_sum * radius_sum
+    a = dx * dx + dy * dy
+    if c < 0 or a == 0:
+        return None
+
+    b = 2 * (fx * dx + fy * dy)
+    discriminant = b * b - 4 * a * c
+    if discriminant < 0:
+        return None
+
+    t = (-b - discriminant**0.5) / (2 * a)
+    if not 0 <= t <= 1:
+        return None
+
+    nx = fx + dx * t
+    ny = fy + dy * t
+    length = (nx * nx + ny * ny) ** 0.5
+    if length == 0:
+        return None
+    return t, nx / length, ny / length
+
+
+def swept_point_box(
+    x: float, y: float, dx: float, dy: float, box_x: float, box_y: float, half_width: float, half_height: float
+) -> Optional[Impact]:
+    """
+    Finds when a point moving by (dx, dy) enters an axis-aligned box, using the slab method.
+
+    A moving box or circle against a box reduces to this test by growing the resting box by the moving
+    shape's half size (for circles, their radius, which treats the box's rounded corners as square).
+
+    Args:
+        x (float): The x-coordinate of the point.
+        y (float): The y-coordinate of the point.
+        dx (float): The displacement of the point along x.
+        dy (float): The displacement of the point along y.
+        box_x (float): The x-coordinate of the box's center.
+        box_y (float): The y-coordinate of the box's center.
+        half_width (float): Half the box's width.
+        half_height (float): Half the box's height.
+
+    Returns:
+        Optional[Tuple[float, float, float]]: The time of impact in [0, 1] and the normal of the face that was
+            hit, or None if the point doesn't enter the box during the move or starts inside it.
+    """
+    t_enter = float("-inf")
+    t_exit = float("inf")
+    normal = (0.0, 0.0)
+
+    for position, displacement, low, high, axis_normal in (
+        (x, dx, box_x - half_width, box_x + half_width, (1.0, 0.0)),
+        (y, dy, box_y - half_height, box_y + half_height, (0.0, 1.0)),
+    ):
+        if displacement == 0:
+            if not low <= position <= high:
+                return None
+            continue
+        near = (low - position) / displacement
+        far = (high - position) / displacement
+        if near > far:
+            near, far = far, near
+        if near > t_enter:
+            t_enter = near
+            # the face hit opposes the direction of travel
+            sign = -1.0 if displacement > 0 else 1.0
+            normal = (axis_normal[0] * sign, axis_normal[1] * sign)
+        t_exit = min(t_exit, far)
+
+    if t_enter > t_exit or not 0 <= t_enter <= 1:
+        return None
+    return t_enter, normal[0], normal[1]
+
+
+def time_of_impact(
+    x: float, y: float, shape: ShapeBody, dx: float, dy: float, other_x: float, other_y: float, other: ShapeBody
+) -> Optional[Impact]:
+    """
+    Finds when a body moving by (dx, dy) first touches another body, using the same shape rules as the
+    discrete collision tests: circles and rectangles collide by their shapes, and any pair involving
+    another shape collides as circles of their radius.
+
+    Args:
+        x (float): The x-coordinate of the moving body.
+        y (float): The y-coordinate of the moving body.
+        shape (ShapeBody): The shape of the moving body.
+        dx (float): The displacement of the moving body relative to the other body, along x.
+        dy (float): The displacement of the moving body relative to the other body, along y.
+        other_x (float): The x-coordinate of the other body.
+        other_y (float): The y-coordinate of the other body.
+        other (ShapeBody): The shape of the other body.
+
+    Returns:
+        Optional[Tuple[float, float, float]]: The time of impact in [0, 1] and the contact normal pointing
+            toward the moving body, or None if the bodies don't touch during the move.
+    """
+    shape_types = (shape.shape_type, other.shape_type)
+    box_types = (ShapeType.CIRCLE, ShapeType.RECTANGLE)
+
+    if ShapeType.RECTANGLE not in shape_types or not all(shape_type in box_types for shape_type in shape_types):
+        return swept_circle_circle(x, y, dx, dy, other_x, other_y, shape.radius + other.radius)
+
+    if shape.shape_type == ShapeType.RECTANGLE:
+        half_width, half_height = shape.width / 2, shape.height / 2
+    else:
+        half_width = half_height = shape.radius
+
+    if other.shape_type == ShapeType.RECTANGLE:
+        return swept_point_box(
+            x, y, dx, dy, other_x, other_y, half_width + other.width / 2, half_height + other.height / 2
+        )
+    # a box sweeping into a resting circle is the circle sweeping into the box the other way around
+    hit = swept_point_box(other_x, other_y, -dx, -dy, x, y, half_width + other.radius, half_height + other.radius)
+    if hit is None:
+        return None
+    t, nx, ny = hit
+    return t, -nx, -ny
@@ -1,4 +1,7 @@
 from enum import Enum
+from typing import Annotated
+
+from pydantic import PrivateAttr
 
 from relentity.core.components import Component
 
@@ -10,9 +13,36 @@ class ShapeType(Enum):
 
 
 class ShapeBody(Component):
+    """
+    Component giving an entity a collision shape.
+
+    Attributes:
+        shape_type (ShapeType): The shape of the body.
+        radius (int): The radius of circles, also used for triangles.
+        width (int): The width of rectangles.
+        height (int): The height of rectangles.
+        static (bool): Whether the body never moves, like a wall. Static bodies don't need a Velocity and are
+            never pushed by collisions.
+        sleeping (bool): Whether the body is at rest and skipped by the collision system until an awake body
+            touches it or its velocity changes.
+        continuous (bool): Whether the collision system sweeps the body along its velocity each update to catch
+            impacts between ticks, so small fast bodies don't tunnel through thin ones.
+    """
+
     shape_type: ShapeType
     # For circles
     radius: int = 10
     # For rectangles
     width: int = 20
     height: int = 20
+    static: bool = False
+    sleeping: bool = False
+    continuous: bool = False
+    _still_ticks: Annotated[int, PrivateAttr()] = 0
+
+    def wake(self) -> None:
+        """
+        Wakes the body up and restarts its rest counter.
+        """
+        self.sleeping = False
+        self._still_ticks = 0
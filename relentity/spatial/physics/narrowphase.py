@@ -0,0 +1,223 @@
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from relentity.spatial.physics.broadphase import BoundsIndex, BroadPhase, find_awake_pairs
+from relentity.spatial.physics.components import ShapeType
+
+# Shape codes used by the batched narrow phase; every shape that isn't a circle or a rectangle collides as a
+# circle of its radius
+CIRCLE = 0
+RECTANGLE = 1
+OTHER = 2
+
+SHAPE_CODES = {ShapeType.CIRCLE: CIRCLE, ShapeType.RECTANGLE: RECTANGLE}
+
+# Collision response, matching CollisionSystem._resolve_collision
+RESTITUTION = 0.8
+MASS_RATIO = 0.5
+PENETRATION = 0.05
+
+
+def body_bounds(
+    positions: np.ndarray, shape_codes: np.ndarray, radii: np.ndarray, half_sizes: np.ndarray
+) -> np.ndarray:
+    """
+    Computes a bounding box per body that contains every shape test the narrow phase may run on it.
+
+    Rectangles test as boxes against circles and rectangles, but as circles of their radius against other
+    shapes, so their box covers both.
+
+    Args:
+        positions (np.ndarray): The (n, 2) centers of the bodies.
+        shape_codes (np.ndarray): The shape code of every body.
+        radii (np.ndarray): The radius of every body.
+        half_sizes (np.ndarray): The (n, 2) half width and half height of every body.
+
+    Returns:
+        np.ndarray: The (n, 4) min x, min y, max x, max y of every body.
+    """
+    extents = np.repeat(radii[:, np.newaxis], 2, axis=1)
+    rectangles = shape_codes == RECTANGLE
+    extents[rectangles] = np.maximum(half_sizes[rectangles], extents[rectangles])
+    return np.hstack((positions - extents, positions + extents))
+
+
+def _circles_overlap(positions: np.ndarray, radii: np.ndarray, first: np.ndarray, second: np.ndarray) -> np.ndarray:
+    distance_squared = (positions[first, 0] - positions[second, 0]) ** 2 + (
+        positions[first, 1] - positions[second, 1]
+    ) ** 2
+    return distance_squared < (radii[first] + radii[second]) ** 2
+
+
+def _rectangles_overlap(
+    positions: np.ndarray, half_sizes: np.ndarray, first: np.ndarray, second: np.ndarray
+) -> np.ndarray:
+    low1 = positions[first] - half_sizes[first]
+    high1 = positions[first] + half_sizes[first]
+    low2 = positions[second] - half_sizes[second]
+    high2 = positions[second] + half_sizes[second]
+    return ((high1 >= low2) & (low1 <= high2)).all(axis=1)
+
+
+def _circle_rectangle_overlap(
+    positions: np.ndarray, radii: np.ndarray, half_sizes: np.ndarray, circles: np.ndarray, rectangles: np.ndarray
+) -> np.ndarray:
+    # closest point of the rectangle to the circle's center
+    closest = np.maximum(
+        positions[rectangles] - half_sizes[rectangles],
+        np.minimum(positions[circles], positions[rectangles] + half_sizes[rectangles]),
+    )
+    distance_squared = ((positions[circles] - closest) ** 2).sum(axis=1)
+    return distance_squared < radii[circles] ** 2
+
+
+def find_contacts(
+    pairs: np.ndarray, positions: np.ndarray, shape_codes: np.ndarray, radii: np.ndarray, half_sizes: np.ndarray
+) -> np.ndarray:
+    """
+    Runs the exact shape tests of `CollisionSystem._check_collision` on many pairs at once.
+
+    The pairs are split by shape combination and each group is tested with one set of array operations.
+
+    Args:
+        pairs (np.ndarray): A (k, 2) array of body index pairs.
+        positions (np.ndarray): The (n, 2) centers of the bodies.
+        shape_codes (np.ndarray): The shape code of every body.
+        radii (np.ndarray): The radius of every body.
+        half_sizes (np.ndarray): The (n, 2) half width and half height of every body.
+
+    Returns:
+        np.ndarray: A boolean array, True for each pair whose shapes overlap.
+    """
+    first = pairs[:, 0]
+    second = pairs[:, 1]
+    codes1 = shape_codes[first]
+    codes2 = shape_codes[second]
+    touching = np.zeros(len(pairs), dtype=bool)
+
+    group = (codes1 == RECTANGLE) & (codes2 == RECTANGLE)
+    touching[group] = _rectangles_overlap(positions, half_sizes, first[group], second[group])
+
+    group = (codes1 == CIRCLE) & (codes2 == RECTANGLE)
+    touching[group] = _circle_rectangle_overlap(positions, radii, half_sizes, first[group], second[group])
+
+    group = (codes1 == RECTANGLE) & (codes2 == CIRCLE)
+    touching[group] = _circle_rectangle_overlap(positions, radii, half_sizes, second[group], first[group])
+
+    # circle pairs, and every pair involving another shape, test as circles of their radius
+    group = ~(((codes1 == RECTANGLE) | (codes2 == RECTANGLE)) & (codes1 != OTHER) & (codes2 != OTHER))
+    touching[group] = _circles_overlap(positions, radii, first[group], second[group])
+    return touching
+
+
+def resolve_contacts(
+    contacts: np.ndarray, positions: np.ndarray, velocities: np.ndarray, static: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Applies the collision impulse of every contact to the velocities, in place.
+
+    Impulses are computed from the velocities at the start of the call and accumulated per body, so a body
+    in several contacts receives the sum of their impulses. A static body behaves as if infinitely heavy: its
+    velocity (expected to be zero) is left alone and the other body takes the whole impulse.
+
+    Args:
+        contacts (np.ndarray): A (k, 2) array of colliding body index pairs.
+        positions (np.ndarray): The (n, 2) centers of the bodies.
+        velocities (np.ndarray): The (n, 2) velocities of the bodies, updated in place.
+        static (Optional[np.ndarray], optional): A boolean array, True for each static body. Defaults to None.
+
+    Returns:
+        np.ndarray: The indices of the bodies whose velocity changed.
+    """
+    first = contacts[:, 0]
+    second = contacts[:, 1]
+    deltas = positions[second] - positions[first]
+    distances = np.sqrt((deltas**2).sum(axis=1))
+
+    # coincident centers have no collision normal
+    separated = distances > 0
+    first, second = first[separated], second[separated]
+    normals = deltas[separated] / distances[separated, np.newaxis]
+
+    # only push apart bodies that move toward each other
+    normal_velocities = ((velocities[second] - velocities[first]) * normals).sum(axis=1)
+    approaching = normal_velocities < 0
+    first, second, normals = first[approaching], second[approaching], normals[approaching]
+    impulses = (-(1 + RESTITUTION) * normal_velocities[approaching])[:, np.newaxis] * normals
+
+    if static is None:
+        changes = impulses * MASS_RATIO + normals * PENETRATION
+        np.add.at(velocities, first, -changes)
+        np.add.at(velocities, second, changes)
+        return np.unique(np.concatenate((first, second)))
+
+    static1 = static[first]
+    static2 = static[second]
+    ratios1 = np.where(static1, 0.0, np.where(static2, 1.0, MASS_RATIO))[:, np.newaxis]
+    ratios2 = np.where(static2, 0.0, np.where(static1, 1.0, MASS_RATIO))[:, np.newaxis]
+    pushes1 = ~static1[:, np.newaxis]
+    pushes2 = ~static2[:, np.newaxis]
+    np.add.at(velocities, first, -(impulses * ratios1 + normals * PENETRATION * pushes1))
+    np.add.at(velocities, second, impulses * ratios2 + normals * PENETRATION * pushes2)
+    return np.unique(np.concatenate((first[~static1], second[~static2])))
+
+
+def collide_bodies(
+    arrays: Dict[str, np.ndarray], broad_phase: BroadPhase, resting_index: Optional[BoundsIndex] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Runs the broad phase, the shape tests and the collision response on body arrays. This is the kernel the
+    vectorized CollisionSystem runs, possibly in a worker process.
+
+    Args:
+        arrays (Dict[str, np.ndarray]): The body arrays: "positions", "velocities" (updated in place),
+            "shape_codes", "radii", "half_sizes", "static" and "active" (False for static and sleeping bodies).
+        broad_phase (BroadPhase): Finds the candidate pairs among the active bodies.
+        resting_index (Optional[BoundsIndex], optional): The boxes of the inactive bodies, in body order. Built
+            from the arrays when None. Defaults to None.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The (k, 2) colliding pairs and the indices of the bodies whose velocity
+            changed.
+    """
+    positions = arrays["positions"]
+    shape_codes = arrays["shape_codes"]
+    radii = arrays["radii"]
+    half_sizes = arrays["half_sizes"]
+    active = arrays["active"]
+    awake = np.flatnonzero(active)
+    resting = np.flatnonzero(~active)
+    if resting_index is None and len(resting):
+        resting_index = BoundsIndex(
+            body_bounds(positions[resting], shape_codes[resting], radii[resting], half_sizes[resting])
+        )
+
+    # Pairs of static or sleeping bodies can't start moving on their own, so only awake bodies are swept
+    awake_bounds = body_bounds(positions[awake], shape_codes[awake], radii[awake], half_sizes[awake])
+    pairs = find_awake_pairs(broad_phase, awake, awake_bounds, resting, resting_index)
+
+    contacts = pairs[find_contacts(pairs, positions, shape_codes, radii, half_sizes)]
+    if not len(contacts):
+        return contacts, np.empty(0, dtype=np.intp)
+
+    static = arrays["static"]
+    changed = resolve_contacts(contacts, positions, arrays["velocities"], static if static.any() else None)
+    return contacts, changed
+
+
+def shape_arrays(shapes) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Converts ShapeBody components into the arrays used by the batched narrow phase.
+
+    Args:
+        shapes (Iterable[ShapeBody]): The shapes of the bodies.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: The shape codes, radii and (n, 2) half sizes of the bodies.
+    """
+    shapes = list(shapes)
+    shape_codes = np.array([SHAPE_CODES.get(shape.shape_type, OTHER) for shape in shapes], dtype=np.int8)
+    radii = np.array([getattr(shape, "radius", 10) for shape in shapes], dtype=np.float64)
+    half_sizes = np.array([(shape.width / 2, shape.height / 2) for shape in shapes], dtype=np.float64).reshape(-1, 2)
+    return shape_codes, radii, half_sizes
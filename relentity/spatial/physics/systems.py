@@ -1,79 +1,408 @@
+from concurrent.futures import Executor
+from typing import FrozenSet, Optional
+
+import numpy as np
+
 from relentity.core import System
 from relentity.spatial import Position, Velocity
+from relentity.spatial.physics.broadphase import BoundsIndex, BroadPhase, SweepAndPruneBroadPhase, find_awake_pairs
+from relentity.spatial.physics.ccd import time_of_impact
 from relentity.spatial.physics.components import ShapeBody, ShapeType
+from relentity.spatial.physics.narrowphase import body_bounds, collide_bodies, shape_arrays
 
 
 class CollisionSystem(System):
-    def __init__(self, registry):
+    reads = set()
+    writes = {Position, Velocity, ShapeBody}
+
+    def __init__(
+        self,
+        registry,
+        broad_phase: Optional[BroadPhase] = None,
+        vectorized: bool = False,
+        sleep_threshold: float = 0.1,
+        sleep_ticks: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ):
+        """
+        Initializes the CollisionSystem.
+
+        In vectorized mode the exact shape tests run on all candidate pairs at once, grouped by shape
+        combination, and the impulses of every contact are computed from the velocities at the start of
+        the update and summed per body, instead of being applied one pair after another. With an `executor`
+        (a process pool) that work runs in a worker process on shared-memory arrays, so a large world doesn't
+        block the event loop.
+
+        Bodies whose ShapeBody is `continuous` are then swept along their velocity for the coming update. If
+        one would hit another body before the update ends, it is bounced at the point of impact, so it can't
+        tunnel through thin bodies at coarse time steps. The MovementSystem still does the integration: the
+        body is placed so that moving it by its new velocity for the whole update ends it exactly where the
+        rest of the update after the impact takes it. For this the system has to run right before the
+        MovementSystem and receive the same `delta_time`.
+
+        When `sleep_ticks` is set, a body whose speed stays below `sleep_threshold` for that many updates
+        goes to sleep: its velocity is zeroed and pairs of sleeping or static bodies are skipped. A sleeping
+        body wakes up when an awake body touches it or when its velocity is changed from outside. Only the
+        awake bodies go through the broad phase; the boxes of static and sleeping bodies are kept in an index
+        that is rebuilt when a body falls asleep, wakes up or one of them is reported as moved.
+
+        Args:
+            registry (Registry): The registry to be used by the system.
+            broad_phase (Optional[BroadPhase], optional): Finds the candidate pairs the exact shape tests run on.
+                Defaults to a SweepAndPruneBroadPhase.
+            vectorized (bool, optional): Whether to use the batched narrow phase. Defaults to False.
+            sleep_threshold (float, optional): The speed below which a body counts as resting. Defaults to 0.1.
+            sleep_ticks (Optional[int], optional): The number of resting updates before a body sleeps, or None
+                to never put bodies to sleep. Defaults to None.
+            executor (Optional[Executor], optional): A process pool for the vectorized mode. Defaults to None.
+        """
         super().__init__(registry)
         self.collision_count = 0
+        self.broad_phase = broad_phase if broad_phase is not None else SweepAndPruneBroadPhase()
+        self.vectorized = vectorized
+        self.sleep_threshold = sleep_threshold
+        self.sleep_ticks = sleep_ticks
+        self.executor = executor
+        # a plain Registry can't report moved bodies, so the resting index is then rebuilt on every update
+        track_position_changes = getattr(registry, "track_position_changes", None)
+        self._position_changes = track_position_changes() if track_position_changes is not None else None
+        self._resting_ids: Optional[tuple] = None
+        self._resting_id_set: FrozenSet = frozenset()
+        self._resting_index: Optional[BoundsIndex] = None
 
     async def update(self, delta_time: float = 0) -> None:
-        entities_data = []
-
-        # Collect all entities with position, velocity, and renderable shape
-        async for entity_ref in self.registry.entities_with_components(Position, Velocity, ShapeBody):
-            entity = await entity_ref.resolve()
-            if entity:
-                position = await entity.get_component(Position)
-                velocity = await entity.get_component(Velocity)
-                shape = await entity.get_component(ShapeBody)
-                entities_data.append((entity, position, velocity, shape))
-
-        if not entities_data:
+        # Same default step as the MovementSystem
+        if delta_time == 0:
+            delta_time = 0.016
+
+        # Collect all entities with position and shape; static bodies don't need a velocity
+        entities_data = self._gather_bodies()
+
+        if len(entities_data) >= 2:
+            if self.vectorized:
+                await self._collide_batched(entities_data)
+            else:
+                self._collide(entities_data)
+            # swept last, with the velocities the MovementSystem is about to integrate
+            if any(shape.continuous for _, _, velocity, shape in entities_data if velocity is not None):
+                self._sweep(entities_data, delta_time)
+
+        if self.sleep_ticks is not None:
+            self._update_sleep(entities_data)
+
+    def _gather_bodies(self) -> list:
+        """
+        Collects the bodies taking part in collisions.
+
+        Returns:
+            list: The (entity_id, position, velocity, shape) of every body. The velocity is None for static bodies.
+        """
+        entities = self.registry.entities
+        bodies = []
+        for entity_id, position, shape in self.registry.iter_components(Position, ShapeBody):
+            if shape.static:
+                bodies.append((entity_id, position, None, shape))
+                continue
+            velocity = entities[entity_id].components.get(Velocity)
+            if velocity is not None:
+                bodies.append((entity_id, position, velocity, shape))
+        return bodies
+
+    def _sweep(self, entities_data: list, delta_time: float) -> None:
+        """
+        Moves every continuous body that would hit another body during the coming update to the point of
+        impact and bounces it.
+
+        Args:
+            entities_data (list): The (entity_id, position, velocity, shape) of every body.
+            delta_time (float): The time step the bodies are about to be moved by.
+        """
+        positions = np.array([(position.x, position.y) for _, position, _, _ in entities_data], dtype=np.float64)
+        displacements = np.array(
+            [(velocity.vx, velocity.vy) if velocity is not None else (0.0, 0.0) for _, _, velocity, _ in entities_data],
+            dtype=np.float64,
+        )
+        displacements *= delta_time
+        bounds = body_bounds(positions, *shape_arrays(shape for _, _, _, shape in entities_data))
+        # the boxes covering each body over the whole update
+        swept = np.hstack(
+            (
+                np.minimum(bounds[:, :2], bounds[:, :2] + displacements),
+                np.maximum(bounds[:, 2:], bounds[:, 2:] + displacements),
+            )
+        )
+
+        for index, (_, position, velocity, shape) in enumerate(entities_data):
+            if velocity is None or not shape.continuous or not displacements[index].any():
+                continue
+
+            candidates = np.flatnonzero(
+                (swept[:, 0] <= swept[index, 2])
+                & (swept[index, 0] <= swept[:, 2])
+                & (swept[:, 1] <= swept[index, 3])
+                & (swept[index, 1] <= swept[:, 3])
+            )
+            earliest = None
+            for other_index in candidates.tolist():
+                if other_index == index:
+                    continue
+                _, other_position, _, other_shape = entities_data[other_index]
+                dx, dy = (displacements[index] - displacements[other_index]).tolist()
+                hit = time_of_impact(
+                    position.x, position.y, shape, dx, dy, other_position.x, other_position.y, other_shape
+                )
+                if hit is not None and (earliest is None or hit[0] < earliest[0]):
+                    earliest = (*hit, other_index)
+
+            if earliest is not None:
+                self.collision_count += 1
+                self._resolve_impact(entities_data, index, displacements[index], delta_time, *earliest)
+
+    def _resolve_impact(
+        self,
+        entities_data: list,
+        index: int,
+        displacement: np.ndarray,
+        delta_time: float,
+        t: float,
+        nx: float,
+        ny: float,
+        other: int,
+    ) -> None:
+        """
+        Bounce a continuous body off the body it hits at time `t` of the update, then place it so that the
+        MovementSystem's full `delta_time` step ends at the impact point plus the new velocity for the rest of
+        the update
+        """
+        _, position, velocity, shape = entities_data[index]
+        _, _, other_velocity, other_shape = entities_data[other]
+
+        other_vx, other_vy = (other_velocity.vx, other_velocity.vy) if other_velocity is not None else (0, 0)
+        normal_vel = (velocity.vx - other_vx) * nx + (velocity.vy - other_vy) * ny
+        if normal_vel < 0:
+            j = -(1 + 0.8) * normal_vel  # 0.8 = coefficient of restitution
+            if other_velocity is None:
+                # static bodies take none of the impulse
+                velocity.vx += j * nx
+                velocity.vy += j * ny
+            else:
+                velocity.vx += j * nx * 0.5
+                velocity.vy += j * ny * 0.5
+                other_velocity.vx -= j * nx * 0.5
+                other_velocity.vy -= j * ny * 0.5
+                if other_shape.sleeping:
+                    other_shape.wake()
+
+        # impact point + v * (1 - t) * dt, minus the v * dt the MovementSystem adds
+        position.x += (float(displacement[0]) - velocity.vx * delta_time) * t
+        position.y += (float(displacement[1]) - velocity.vy * delta_time) * t
+
+    def _collide(self, entities_data: list) -> None:
+        """
+        Finds and resolves the collisions between the bodies, one pair after another.
+
+        Args:
+            entities_data (list): The (entity_id, position, velocity, shape) of every body.
+        """
+        active = self._active_mask(entities_data)
+        awake = np.flatnonzero(active)
+        resting = np.flatnonzero(~active)
+        positions = np.array(
+            [(entities_data[index][1].x, entities_data[index][1].y) for index in awake.tolist()], dtype=np.float64
+        ).reshape(-1, 2)
+        awake_bounds = body_bounds(positions, *shape_arrays(entities_data[index][3] for index in awake.tolist()))
+
+        # Only check the pairs whose bounding boxes overlap, in the same order as a pairwise loop
+        pairs = find_awake_pairs(
+            self.broad_phase, awake, awake_bounds, resting, self._get_resting_index(entities_data, resting)
+        )
+
+        for i, j in pairs.tolist():
+            _, pos1, vel1, shape1 = entities_data[i]
+            _, pos2, vel2, shape2 = entities_data[j]
+
+            # Check for collision based on shape types
+            if self._check_collision(pos1, shape1, pos2, shape2):
+                self.collision_count += 1
+                if shape1.sleeping:
+                    shape1.wake()
+                if shape2.sleeping:
+                    shape2.wake()
+                self._resolve_collision(pos1, vel1, pos2, vel2)
+
+    async def _collide_batched(self, entities_data: list) -> None:
+        """
+        Gathers the bodies into arrays, runs the `collide_bodies` kernel on them (in a worker process when
+        the system has an executor) and writes the changed velocities back.
+
+        Args:
+            entities_data (list): The (entity_id, position, velocity, shape) of every body.
+        """
+        shape_codes, radii, half_sizes = shape_arrays(shape for _, _, _, shape in entities_data)
+        arrays = {
+            "positions": np.array([(position.x, position.y) for _, position, _, _ in entities_data], dtype=np.float64),
+            # static bodies keep a zero velocity
+            "velocities": np.array(
+                [
+                    (velocity.vx, velocity.vy) if velocity is not None else (0.0, 0.0)
+                    for _, _, velocity, _ in entities_data
+                ],
+                dtype=np.float64,
+            ),
+            "shape_codes": shape_codes,
+            "radii": radii,
+            "half_sizes": half_sizes,
+            "static": np.array([velocity is None for _, _, velocity, _ in entities_data], dtype=bool),
+            "active": self._active_mask(entities_data),
+        }
+        resting_index = self._get_resting_index(entities_data, np.flatnonzero(~arrays["active"]))
+
+        contacts, changed = await self.run_offloaded(collide_bodies, arrays, self.broad_phase, resting_index)
+        self.collision_count += len(contacts)
+
+        for index in np.unique(contacts).tolist():
+            shape = entities_data[index][3]
+            if shape.sleeping:
+                shape.wake()
+        for index, (vx, vy) in zip(changed.tolist(), arrays["velocities"][changed].tolist()):
+            velocity = entities_data[index][2]
+            velocity.vx = vx
+            velocity.vy = vy
+
+    @staticmethod
+    def _active_mask(entities_data: list) -> np.ndarray:
+        """Flag the bodies that can move on their own, i.e. that are neither static nor sleeping"""
+        return np.array([not (shape.static or shape.sleeping) for _, _, _, shape in entities_data], dtype=bool)
+
+    def _get_resting_index(self, entities_data: list, resting: np.ndarray) -> Optional[BoundsIndex]:
+        """
+        Returns the index of the static and sleeping bodies' boxes, rebuilding it only when the set of resting
+        bodies changed or one of them was reported as moved. Without a SpatialRegistry to report moves it is
+        rebuilt every time.
+
+        Args:
+            entities_data (list): The (entity_id, position, velocity, shape) of every body.
+            resting (np.ndarray): The indices of the static and sleeping bodies in `entities_data`.
+
+        Returns:
+            Optional[BoundsIndex]: The boxes of the resting bodies, in the order of `resting`, or None if there are
+                none.
+        """
+        resting_ids = tuple(entities_data[index][0] for index in resting.tolist())
+        if self._position_changes is not None:
+            changed_ids, unknown = self._position_changes.take()
+        else:
+            changed_ids, unknown = (), True
+        if resting_ids == self._resting_ids and not unknown and self._resting_id_set.isdisjoint(changed_ids):
+            return self._resting_index
+
+        self._resting_ids = resting_ids
+        self._resting_id_set = frozenset(resting_ids)
+        if not resting_ids:
+            self._resting_index = None
+            return None
+
+        positions = np.array(
+            [(entities_data[index][1].x, entities_data[index][1].y) for index in resting.tolist()], dtype=np.float64
+        )
+        shapes = (entities_data[index][3] for index in resting.tolist())
+        self._resting_index = BoundsIndex(body_bounds(positions, *shape_arrays(shapes)))
+        return self._resting_index
+
+    def _update_sleep(self, entities_data: list) -> None:
+        """
+        Puts bodies that have been resting for `sleep_ticks` updates to sleep and wakes bodies that were set moving.
+
+        Args:
+            entities_data (list): The (entity_id, position, velocity, shape) of every body.
+        """
+        threshold_squared = self.sleep_threshold * self.sleep_threshold
+        for _, _, velocity, shape in entities_data:
+            if velocity is None:
+                continue
+            if velocity.vx * velocity.vx + velocity.vy * velocity.vy >= threshold_squared:
+                if shape.sleeping or shape._still_ticks:
+                    shape.wake()
+                continue
+            if shape.sleeping:
+                continue
+            shape._still_ticks += 1
+            if shape._still_ticks >= self.sleep_ticks:
+                shape.sleeping = True
+                velocity.vx = 0
+                velocity.vy = 0
+
+    def _resolve_collision(self, pos1, vel1, pos2, vel2) -> None:
+        """Apply an impulse pushing two colliding bodies apart; a None velocity marks a static body"""
+        if vel1 is None or vel2 is None:
+            self._resolve_static_collision(pos1, vel1, pos2, vel2)
             return
 
-        # Check for collisions between all entity pairs
-        for i in range(len(entities_data)):
-            entity1, pos1, vel1, shape1 = entities_data[i]
-
-            for j in range(i + 1, len(entities_data)):
-                entity2, pos2, vel2, shape2 = entities_data[j]
-
-                # Check for collision based on shape types
-                if self._check_collision(pos1, shape1, pos2, shape2):
-                    self.collision_count += 1
-
-                    # More natural collision response
-                    # Calculate collision normal vector
-                    dx = pos2.x - pos1.x
-                    dy = pos2.y - pos1.y
-                    distance = (dx * dx + dy * dy) ** 0.5
-
-                    if distance > 0:  # Avoid division by zero
-                        # Normalize the collision normal
-                        nx = dx / distance
-                        ny = dy / distance
-
-                        # Calculate relative velocity along normal
-                        dvx = vel2.vx - vel1.vx
-                        dvy = vel2.vy - vel1.vy
-                        normal_vel = dvx * nx + dvy * ny
-
-                        # Only separate if objects are moving toward each other
-                        if normal_vel < 0:
-                            # Assume equal masses (can be extended with a Mass component)
-                            mass_ratio1 = 0.5
-                            mass_ratio2 = 0.5
-
-                            # Impulse scalar
-                            j = -(1 + 0.8) * normal_vel  # 0.8 = coefficient of restitution
-
-                            # Apply impulse
-                            impulse_x = j * nx
-                            impulse_y = j * ny
-
-                            vel1.vx -= impulse_x * mass_ratio1
-                            vel1.vy -= impulse_y * mass_ratio1
-                            vel2.vx += impulse_x * mass_ratio2
-                            vel2.vy += impulse_y * mass_ratio2
-
-                            # Optional: add a bit of position correction to prevent sinking
-                            penetration = 0.05  # small constant to prevent objects from sticking
-                            vel1.vx -= nx * penetration
-                            vel1.vy -= ny * penetration
-                            vel2.vx += nx * penetration
-                            vel2.vy += ny * penetration
+        # More natural collision response
+        # Calculate collision normal vector
+        dx = pos2.x - pos1.x
+        dy = pos2.y - pos1.y
+        distance = (dx * dx + dy * dy) ** 0.5
+
+        if distance > 0:  # Avoid division by zero
+            # Normalize the collision normal
+            nx = dx / distance
+            ny = dy / distance
+
+            # Calculate relative velocity along normal
+            dvx = vel2.vx - vel1.vx
+            dvy = vel2.vy - vel1.vy
+            normal_vel = dvx * nx + dvy * ny
+
+            # Only separate if objects are moving toward each other
+            if normal_vel < 0:
+                # Assume equal masses (can be extended with a Mass component)
+                mass_ratio1 = 0.5
+                mass_ratio2 = 0.5
+
+                # Impulse scalar
+                j = -(1 + 0.8) * normal_vel  # 0.8 = coefficient of restitution
+
+                # Apply impulse
+                impulse_x = j * nx
+                impulse_y = j * ny
+
+                vel1.vx -= impulse_x * mass_ratio1
+                vel1.vy -= impulse_y * mass_ratio1
+                vel2.vx += impulse_x * mass_ratio2
+                vel2.vy += impulse_y * mass_ratio2
+
+                # Optional: add a bit of position correction to prevent sinking
+                penetration = 0.05  # small constant to prevent objects from sticking
+                vel1.vx -= nx * penetration
+                vel1.vy -= ny * penetration
+                vel2.vx += nx * penetration
+                vel2.vy += ny * penetration
+
+    def _resolve_static_collision(self, pos1, vel1, pos2, vel2) -> None:
+        """Bounce a moving body off a static one, which takes none of the impulse"""
+        if vel1 is None and vel2 is None:
+            return
+
+        dx = pos2.x - pos1.x
+        dy = pos2.y - pos1.y
+        distance = (dx * dx + dy * dy) ** 0.5
+        if distance == 0:
+            return
+
+        # Normal pointing from the static body toward the moving one
+        sign = 1 if vel1 is None else -1
+        nx = sign * dx / distance
+        ny = sign * dy / distance
+        velocity = vel2 if vel1 is None else vel1
+
+        # Only bounce if the moving body heads into the static one
+        normal_vel = velocity.vx * nx + velocity.vy * ny
+        if normal_vel < 0:
+            j = -(1 + 0.8) * normal_vel  # 0.8 = coefficient of restitution
+            penetration = 0.05  # small constant to prevent objects from sticking
+            velocity.vx += j * nx + nx * penetration
+            velocity.vy += j * ny + ny * penetration
 
     def _check_collision(self, pos1, shape1, pos2, shape2):
         """Check for collision between two entities based on their shapes"""
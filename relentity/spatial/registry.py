@@ -1,23 +1,296 @@
-from math import sqrt
-from typing import Type, AsyncIterator
+import uuid
+import weakref
+from typing import Type, AsyncIterator, Optional, Dict, Iterable, List, Set, Tuple, TYPE_CHECKING
+
+import numpy as np
+from scipy.spatial import cKDTree
 
 from relentity.core import Registry, Component
 from .components import Position, Area
-from .utils import point_in_polygon
+from .spatial_hash import SpatialHash
+from .storage import DenseMotionStore
 from ..core.entity_ref import EntityRef
 
+if TYPE_CHECKING:
+    from relentity.core import Entity
+
+
+class PositionChanges:
+    """
+    Collects the entities whose Position changed, for a consumer that processes them in batches.
+
+    Created through `SpatialRegistry.track_position_changes` and filled by the registry until `take` empties it.
+
+    Attributes:
+        entity_ids (Set[uuid.UUID]): The ids of the entities whose Position was written, added, replaced or removed.
+        unknown (bool): Whether Positions were written without saying which, so any entity may have moved.
+    """
+
+    def __init__(self):
+        self.entity_ids: Set[uuid.UUID] = set()
+        # the consumer hasn't seen any position yet
+        self.unknown = True
+
+    def take(self) -> Tuple[Set[uuid.UUID], bool]:
+        """
+        Returns the changes collected so far and starts collecting anew.
+
+        Returns:
+            Tuple[Set[uuid.UUID], bool]: The ids of the changed entities, and whether any entity may have moved.
+        """
+        entity_ids, unknown = self.entity_ids, self.unknown
+        self.entity_ids = set()
+        self.unknown = False
+        return entity_ids, unknown
+
 
 class SpatialRegistry(Registry):
     """
     A specialized registry for spatial entities, providing additional methods for spatial queries.
+
+    Attributes:
+        motion_store (Optional[DenseMotionStore]): When dense storage is enabled, the NumPy arrays holding
+            the Position and Velocity of every entity that has both.
+        cell_size (float): The cell size of the spatial hashes used to answer radius queries.
     """
 
+    def __init__(
+        self,
+        dense_storage: bool = False,
+        dense_capacity: int = 1024,
+        cell_size: float = 64.0,
+        deferred_events: bool = False,
+    ):
+        """
+        Initializes the SpatialRegistry.
+
+        Args:
+            dense_storage (bool, optional): Whether to keep Position and Velocity of moving entities in
+                contiguous NumPy arrays so systems can process them with vectorized operations. Defaults to False.
+            dense_capacity (int, optional): The initial number of slots in the dense store. Defaults to 1024.
+            cell_size (float, optional): The cell size of the spatial hash. Radius queries are fastest when it is
+                close to the typical query radius. Defaults to 64.0.
+            deferred_events (bool, optional): Whether fire-and-forget events are queued until `flush_events`.
+                Defaults to False.
+        """
+        super().__init__(deferred_events)
+        self.motion_store: Optional[DenseMotionStore] = DenseMotionStore(dense_capacity) if dense_storage else None
+        self.cell_size = cell_size
+        self._layout_generation = 0
+        self._position_writes = 0
+        self._positions: Dict[uuid.UUID, Position] = {}
+        self._position_changes: List[PositionChanges] = []
+        self._spatial_hashes: Dict[frozenset, Tuple[tuple, SpatialHash]] = {}
+        self._kd_trees: Dict[frozenset, Tuple[tuple, List[uuid.UUID], Optional[cKDTree]]] = {}
+
+    def register_entity(self, entity: "Entity") -> None:
+        super().register_entity(entity)
+        # a replaced Position doesn't change the entity's archetype, so compare with the one seen last
+        position = entity.components.get(Position)
+        previous = self._positions.get(entity.id)
+        if position is not previous:
+            if previous is not None:
+                Position._write_hooks.pop(id(previous), None)
+            if position is None:
+                del self._positions[entity.id]
+            else:
+                self._positions[entity.id] = position
+                self._watch_position(entity.id, position)
+            self._layout_generation += 1
+            for changes in self._position_changes:
+                changes.entity_ids.add(entity.id)
+        if self.motion_store is not None:
+            self.motion_store.sync(entity)
+
+    def _drop_entity(self, entity: "Entity") -> None:
+        super()._drop_entity(entity)
+        previous = self._positions.pop(entity.id, None)
+        if previous is not None:
+            Position._write_hooks.pop(id(previous), None)
+        self._layout_generation += 1
+        for changes in self._position_changes:
+            changes.entity_ids.add(entity.id)
+        if self.motion_store is not None:
+            self.motion_store.unbind(entity.id)
+
+    def _watch_position(self, entity_id: uuid.UUID, position: Position) -> None:
+        """
+        Installs the hook through which writes to `position.x` and `position.y` reach this registry.
+
+        The hook only holds the registry weakly, and it is removed when the Position is garbage collected, so a
+        registry that is dropped with its entities leaves nothing behind.
+
+        Args:
+            entity_id (uuid.UUID): The id of the entity holding the Position.
+            position (Position): The Position to watch.
+        """
+        registry_ref = weakref.ref(self)
+
+        def written() -> None:
+            registry = registry_ref()
+            if registry is not None:
+                registry._position_written(entity_id)
+
+        Position._write_hooks[id(position)] = written
+        weakref.finalize(position, Position._write_hooks.pop, id(position), None)
+
+    def _position_written(self, entity_id: uuid.UUID) -> None:
+        self._position_writes += 1
+        for changes in self._position_changes:
+            changes.entity_ids.add(entity_id)
+
+    def mark_positions_written(self, entity_ids: Optional[Iterable[uuid.UUID]] = None) -> None:
+        """
+        Records that Positions were changed without going through their fields, so the spatial indexes are
+        rebuilt on their next use.
+
+        Writes to `position.x` and `position.y` are seen automatically. Only code that writes the dense store's
+        `positions` array directly, like the vectorized MovementSystem, has to call this, once per batch.
+
+        Args:
+            entity_ids (Optional[Iterable[uuid.UUID]], optional): The ids of the moved entities, passed on to the
+                `track_position_changes` consumers. None if they aren't known. Defaults to None.
+        """
+        self._position_writes += 1
+        if not self._position_changes:
+            return
+        if entity_ids is None:
+            for changes in self._position_changes:
+                changes.unknown = True
+            return
+        entity_ids = list(entity_ids)
+        for changes in self._position_changes:
+            changes.entity_ids.update(entity_ids)
+
+    def track_position_changes(self) -> PositionChanges:
+        """
+        Starts collecting the entities whose Position is written, added, replaced, removed or marked as written.
+
+        The collector is kept for the registry's lifetime, so a consumer should call this once and `take` the
+        changes on every tick. Its first `take` reports that any entity may have moved.
+
+        Returns:
+            PositionChanges: The collector, filled from now on.
+        """
+        changes = PositionChanges()
+        self._position_changes.append(changes)
+        return changes
+
+    @property
+    def positions_version(self) -> tuple:
+        """
+        A token that changes whenever a Position is written, added, replaced or removed, or
+        `mark_positions_written` is called.
+
+        Returns:
+            tuple: A value to compare with a previously seen version to tell if positions may have changed.
+        """
+        return self._layout_generation, self._position_writes
+
+    def get_spatial_hash(self, *component_types: Type[Component]) -> SpatialHash:
+        """
+        Returns a spatial hash over the Positions of the entities that have the specified components.
+
+        The hash is built from the component index, so it only ever contains matching entities, and it is
+        rebuilt lazily the first time it is requested after `positions_version` changed.
+
+        Args:
+            component_types (Type[Component]): The types of components the indexed entities must have.
+
+        Returns:
+            SpatialHash: The up-to-date spatial hash.
+        """
+        types_key = frozenset(component_types)
+        key = self.positions_version
+        cached = self._spatial_hashes.get(types_key)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        spatial_hash = cached[1] if cached is not None else SpatialHash(self.cell_size)
+        spatial_hash.rebuild(
+            (entity_id, position.x, position.y)
+            for entity_id, position, *_ in self.iter_components(Position, *component_types)
+        )
+        self._spatial_hashes[types_key] = (key, spatial_hash)
+        return spatial_hash
+
+    def neighbors_within(
+        self, radii_by_entity: Dict[uuid.UUID, float], *component_types: Type[Component]
+    ) -> Dict[uuid.UUID, List[EntityRef]]:
+        """
+        Finds, for many entities at once, the entities within a radius of each that have the specified components.
+
+        A KD-tree over the Positions of the candidate entities is built once per set of component types and
+        reused until a Position changes, and every radius query is answered by a single vectorized call.
+        Like `entities_within_distance`, an entity is included in its own result if it matches.
+
+        Args:
+            radii_by_entity (Dict[uuid.UUID, float]): The query radius for each observing entity.
+            component_types (Type[Component]): The types of components the neighbors must have.
+
+        Returns:
+            Dict[uuid.UUID, List[EntityRef]]: The neighbors of each observing entity that has a Position, in no
+                particular order. Observers without a Position are left out.
+        """
+        observer_ids = []
+        observer_points = []
+        radii = []
+        for entity_id, radius in radii_by_entity.items():
+            entity = self.entities.get(entity_id)
+            position = entity.components.get(Position) if entity is not None else None
+            if position is not None:
+                observer_ids.append(entity_id)
+                observer_points.append((position.x, position.y))
+                radii.append(radius)
+        if not observer_ids:
+            return {}
+
+        candidate_ids, tree = self._get_kd_tree(component_types)
+        if tree is None:
+            return {entity_id: [] for entity_id in observer_ids}
+
+        matches = tree.query_ball_point(np.array(observer_points), r=np.array(radii), return_sorted=True)
+        return {
+            entity_id: [EntityRef(entity_id=candidate_ids[index], _registry=self) for index in indices]
+            for entity_id, indices in zip(observer_ids, matches)
+        }
+
+    def _get_kd_tree(self, component_types: Tuple[Type[Component], ...]) -> Tuple[List[uuid.UUID], Optional[cKDTree]]:
+        """
+        Returns a KD-tree over the Positions of the entities that have the specified components.
+
+        Args:
+            component_types (Tuple[Type[Component], ...]): The types of components the indexed entities must have.
+
+        Returns:
+            Tuple[List[uuid.UUID], Optional[cKDTree]]: The id of the entity behind each point of the tree, and the
+                tree itself, or None if no entity matches.
+        """
+        types_key = frozenset(component_types)
+        key = self.positions_version
+        cached = self._kd_trees.get(types_key)
+        if cached is not None and cached[0] == key:
+            return cached[1], cached[2]
+
+        candidate_ids = []
+        points = []
+        for entity_id, position, *_ in self.iter_components(Position, *component_types):
+            candidate_ids.append(entity_id)
+            points.append((position.x, position.y))
+        tree = cKDTree(np.array(points, dtype=np.float64)) if points else None
+        self._kd_trees[types_key] = (key, candidate_ids, tree)
+        return candidate_ids, tree
+
     async def entities_within_distance(
         self, centroid: Position, distance: float, *component_types: Type[Component]
     ) -> AsyncIterator[EntityRef]:
         """
         Yields entities within a specified distance from a given position that have the specified components.
 
+        Candidates come from a spatial hash built over the component index intersection of Position and the
+        requested types, so a query for a sparse component such as Hearing never touches other entities. Only
+        the cells overlapping the query's bounding box are visited, and distances are compared squared.
+
         Args:
             centroid (Position): The central position to measure distance from.
             distance (float): The maximum distance from the centroid.
@@ -26,25 +299,33 @@ class SpatialRegistry(Registry):
         Yields:
             Entity: An entity within the specified distance that has the specified components.
         """
-        for entity in list(self.entities.values()):
-            position = await entity.get_component(Position)
-            if position:
-                dist = sqrt((position.x - centroid.x) ** 2 + (position.y - centroid.y) ** 2)
-                if dist <= distance:
-                    if all([await entity.get_component(component_type) for component_type in component_types]):
-                        yield EntityRef(entity_id=entity.id, _registry=self)
+        spatial_hash = self.get_spatial_hash(*component_types)
+        entity_ids = list(spatial_hash.within_distance(centroid.x, centroid.y, distance))
+        for entity_id in entity_ids:
+            # the entity may have been removed by the consumer while iterating
+            if entity_id in self.entities:
+                yield EntityRef(entity_id=entity_id, _registry=self)
 
     async def entities_within_area(self, area: Area) -> AsyncIterator[EntityRef]:
         """
         Yields entities within a specified area.
 
+        Candidates are the entities whose Position falls in the area's bounding box, found through the spatial
+        hash, and they are tested against the polygon with one vectorized point-in-polygon call.
+
         Args:
             area (Area): The area to check for entities.
 
         Yields:
             EntityRef: A reference to an entity within the specified area.
         """
-        for entity in self.entities.values():
-            position = await entity.get_component(Position)
-            if position and point_in_polygon(position.x, position.y, area.geometry):
-                yield EntityRef(entity_id=entity.id, _registry=self)
+        candidates = list(self.get_spatial_hash().within_bounds(*area.get_bounds()))
+        if not candidates:
+            return
+
+        coordinates = np.array([(x, y) for _, x, y in candidates], dtype=np.float64)
+        inside = area.points_within_bounds(coordinates[:, 0], coordinates[:, 1])
+        for index in np.flatnonzero(inside).tolist():
+            entity_id = candidates[index][0]
+            if entity_id in self.entities:
+                yield EntityRef(entity_id=entity_id, _registry=self)
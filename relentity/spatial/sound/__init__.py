@@ -0,0 +1,8 @@
+from .components import Audible, Hearing
+from .systems import AudioSystem
+
+__all__ = [
+    "Audible",
+    "Hearing",
+    "AudioSystem",
+]
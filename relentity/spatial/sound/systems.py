@@ -15,28 +15,46 @@ class AudioSystem(SpatialSystem):
         update: Processes sound events and emits SOUND_HEARD_EVENT_TYPE and SOUND_CREATED_EVENT_TYPE events.
     """
 
+    # sounds are queued on and drained from the Hearing and Audible components
+    reads = {Position}
+    writes = {Hearing, Audible}
+
     async def update(self, delta_time: float = 0) -> None:
         """
         Processes sound events for entities with Hearing and Audible components.
         Emits SOUND_HEARD_EVENT_TYPE events for entities that hear sounds.
-        Emits SOUND_CREATED_EVENT_TYPE events for entities that create sounds.
+        Emits SOUND_CREATED_EVENT_TYPE events for entities that create sounds, and finds the listeners of
+        every emitting entity with one bulk `neighbors_within` call. Queues are drained even when nobody
+        listens for their events.
         """
-        async for entity_ref in self.registry.entities_with_components(Hearing):
-            entity = await entity_ref.resolve()
-            hearing = await entity.get_component(Hearing)
+        entities = self.registry.entities
+        for entity_id, hearing in self.registry.iter_components(Hearing):
             sound_queue = hearing.retrieve_queue(clear=True)
-            for sound_event in sound_queue:
-                await entity.event_bus.emit(SOUND_HEARD_EVENT_TYPE, sound_event)
+            event_bus = entities[entity_id].event_bus
+            if sound_queue and event_bus.has_subscribers(SOUND_HEARD_EVENT_TYPE):
+                for sound_event in sound_queue:
+                    await event_bus.emit(SOUND_HEARD_EVENT_TYPE, sound_event)
 
-        async for entity_ref in self.registry.entities_with_components(Audible, Position):
-            entity = await entity_ref.resolve()
-            audio = await entity.get_component(Audible)
-            position = await entity.get_component(Position)
+        sound_queues = {}
+        volumes = {}
+        for entity_id, audio, _ in self.registry.iter_components(Audible, Position):
             sound_queue = audio.retrieve_queue(clear=True)
+            if sound_queue:
+                sound_queues[entity_id] = sound_queue
+                volumes[entity_id] = audio.volume
+        if not sound_queues:
+            return
+
+        listeners = self.registry.neighbors_within(volumes, Hearing)
+        for entity_id, sound_queue in sound_queues.items():
+            event_bus = entities[entity_id].event_bus
+            announce = event_bus.has_subscribers(SOUND_CREATED_EVENT_TYPE)
+            other_entity_refs = listeners.get(entity_id, [])
             for sound_event in sound_queue:
-                await entity.event_bus.emit(SOUND_CREATED_EVENT_TYPE, sound_event)
-                async for other_entity_ref in self.registry.entities_within_distance(position, audio.volume, Hearing):
-                    if other_entity_ref.entity_id != entity.id:
-                        other_entity = await other_entity_ref.resolve()
-                        other_hearing = await other_entity.get_component(Hearing)
+                if announce:
+                    await event_bus.emit(SOUND_CREATED_EVENT_TYPE, sound_event)
+                for other_entity_ref in other_entity_refs:
+                    if other_entity_ref.entity_id != entity_id:
+                        other_entity = other_entity_ref.resolve_nowait()
+                        other_hearing = other_entity.get_component_nowait(Hearing)
                         other_hearing.queue_sound(sound_event)
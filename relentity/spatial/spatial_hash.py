@@ -0,0 +1,128 @@
+import uuid
+from math import floor
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+Cell = Tuple[int, int]
+
+
+class SpatialHash:
+    """
+    A uniform grid that buckets entity positions into square cells so radius queries only visit nearby cells.
+
+    Attributes:
+        cell_size (float): The side length of a cell, in world units.
+        cells (Dict[Tuple[int, int], List[Tuple[uuid.UUID, float, float]]]): The (entity_id, x, y) entries
+            in each occupied cell.
+    """
+
+    def __init__(self, cell_size: float = 64.0):
+        """
+        Initializes an empty SpatialHash.
+
+        Args:
+            cell_size (float, optional): The side length of a cell. Defaults to 64.0.
+
+        Raises:
+            ValueError: If the cell size is not positive.
+        """
+        if cell_size <= 0:
+            raise ValueError(f"Cell size must be positive, got {cell_size}")
+        self.cell_size = cell_size
+        self.cells: Dict[Cell, List[Tuple[uuid.UUID, float, float]]] = {}
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def cell_of(self, x: float, y: float) -> Cell:
+        """
+        Returns the cell containing a point.
+
+        Args:
+            x (float): The x-coordinate of the point.
+            y (float): The y-coordinate of the point.
+
+        Returns:
+            Tuple[int, int]: The column and row of the cell.
+        """
+        return floor(x / self.cell_size), floor(y / self.cell_size)
+
+    def rebuild(self, entries: Iterable[Tuple[uuid.UUID, float, float]]) -> None:
+        """
+        Replaces the contents of the grid.
+
+        Args:
+            entries (Iterable[Tuple[uuid.UUID, float, float]]): The (entity_id, x, y) of every entity to index.
+        """
+        cells: Dict[Cell, List[Tuple[uuid.UUID, float, float]]] = {}
+        inverse_size = 1.0 / self.cell_size
+        count = 0
+        for entry in entries:
+            key = (floor(entry[1] * inverse_size), floor(entry[2] * inverse_size))
+            bucket = cells.get(key)
+            if bucket is None:
+                cells[key] = [entry]
+            else:
+                bucket.append(entry)
+            count += 1
+        self.cells = cells
+        self._count = count
+
+    def _buckets(self, min_x: float, min_y: float, max_x: float, max_y: float) -> Iterator[list]:
+        min_col, min_row = self.cell_of(min_x, min_y)
+        max_col, max_row = self.cell_of(max_x, max_y)
+        cells = self.cells
+        if (max_col - min_col + 1) * (max_row - min_row + 1) <= len(cells):
+            for col in range(min_col, max_col + 1):
+                for row in range(min_row, max_row + 1):
+                    bucket = cells.get((col, row))
+                    if bucket is not None:
+                        yield bucket
+        else:
+            # the box covers more cells than are occupied, so walk the occupied ones instead
+            for (col, row), bucket in cells.items():
+                if min_col <= col <= max_col and min_row <= row <= max_row:
+                    yield bucket
+
+    def within_bounds(
+        self, min_x: float, min_y: float, max_x: float, max_y: float
+    ) -> Iterator[Tuple[uuid.UUID, float, float]]:
+        """
+        Yields the indexed entries inside an axis-aligned box.
+
+        Args:
+            min_x (float): The left edge of the box (inclusive).
+            min_y (float): The bottom edge of the box (inclusive).
+            max_x (float): The right edge of the box (inclusive).
+            max_y (float): The top edge of the box (inclusive).
+
+        Yields:
+            Tuple[uuid.UUID, float, float]: The (entity_id, x, y) of an entity inside the box.
+        """
+        for bucket in self._buckets(min_x, min_y, max_x, max_y):
+            for entry in bucket:
+                if min_x <= entry[1] <= max_x and min_y <= entry[2] <= max_y:
+                    yield entry
+
+    def within_distance(self, x: float, y: float, distance: float) -> Iterator[uuid.UUID]:
+        """
+        Yields the ids of the indexed entities within a distance of a point.
+
+        Args:
+            x (float): The x-coordinate of the point.
+            y (float): The y-coordinate of the point.
+            distance (float): The maximum distance from the point (inclusive).
+
+        Yields:
+            uuid.UUID: The id of an entity within the distance.
+        """
+        if distance < 0:
+            return
+
+        distance_squared = distance * distance
+        for bucket in self._buckets(x - distance, y - distance, x + distance, y + distance):
+            for entity_id, entry_x, entry_y in bucket:
+                dx = entry_x - x
+                dy = entry_y - y
+                if dx * dx + dy * dy <= distance_squared:
+                    yield entity_id
@@ -0,0 +1,261 @@
+import uuid
+from typing import Dict, List, Optional, Type, TYPE_CHECKING
+
+import numpy as np
+
+from .components import Position, Velocity
+
+if TYPE_CHECKING:
+    from relentity.core import Entity
+
+
+def _view_property(store: "DenseMotionStore", array_name: str, column: int) -> property:
+    """
+    Builds a property that reads and writes one column of one of the store's arrays.
+
+    Args:
+        store (DenseMotionStore): The store holding the arrays.
+        array_name (str): The name of the array attribute on the store ("positions" or "velocities").
+        column (int): The column of the array backing the field.
+
+    Returns:
+        property: The property to install on a view class.
+    """
+    slots = store._component_slots
+
+    def fget(self):
+        return getattr(store, array_name).item(slots[id(self)], column)
+
+    def fset(self, value):
+        getattr(store, array_name)[slots[id(self)], column] = value
+
+    return property(fget, fset)
+
+
+def _make_view_class(store: "DenseMotionStore", base: Type, array_name: str, fields: tuple) -> Type:
+    """
+    Creates a subclass of `base` whose fields are views into one of the store's arrays.
+
+    Instances keep their pydantic `__dict__`, which is refreshed from the arrays before they are
+    serialized, compared, copied, pickled or printed, so bound components behave like ordinary components.
+    Copies and pickles are plain `base` instances, detached from the store.
+
+    Args:
+        store (DenseMotionStore): The store holding the arrays.
+        base (Type): The component class being viewed (Position or Velocity).
+        array_name (str): The name of the array attribute on the store.
+        fields (tuple): The field names, in column order.
+
+    Returns:
+        Type: The view class.
+    """
+
+    class DenseView(base):
+        __dense_base__ = base
+
+        def _sync_fields(self) -> None:
+            row = getattr(store, array_name)[store._component_slots[id(self)]]
+            for column, name in enumerate(fields):
+                self.__dict__[name] = row.item(column)
+
+        def model_dump(self, *args, **kwargs):
+            self._sync_fields()
+            return super().model_dump(*args, **kwargs)
+
+        def model_dump_json(self, *args, **kwargs):
+            self._sync_fields()
+            return super().model_dump_json(*args, **kwargs)
+
+        # copies, including `model_copy`, and pickles are plain components holding the current values
+        def __copy__(self):
+            self._sync_fields()
+            copied = super().__copy__()
+            copied.__class__ = base
+            return copied
+
+        def __deepcopy__(self, memo=None):
+            self._sync_fields()
+            copied = super().__deepcopy__(memo)
+            copied.__class__ = base
+            return copied
+
+        def __reduce__(self):
+            self._sync_fields()
+            return base.model_validate, ({name: self.__dict__[name] for name in fields},)
+
+        def __eq__(self, other):
+            self._sync_fields()
+            if not isinstance(other, base):
+                return super().__eq__(other)
+            if hasattr(other, "_sync_fields"):
+                other._sync_fields()
+            # views compare equal to plain components (and views from other stores) holding the same values
+            return getattr(type(other), "__dense_base__", type(other)) is base and self.__dict__ == other.__dict__
+
+        def __repr_args__(self):
+            self._sync_fields()
+            return super().__repr_args__()
+
+    DenseView.__name__ = DenseView.__qualname__ = f"Dense{base.__name__}"
+    for column, name in enumerate(fields):
+        setattr(DenseView, name, _view_property(store, array_name, column))
+    return DenseView
+
+
+class DenseMotionStore:
+    """
+    Structure-of-arrays storage for the Position and Velocity of entities that have both.
+
+    Each bound entity owns one slot, i.e. one row of `positions` and `velocities`. Bound rows are kept
+    contiguous in `[0, count)` (removal moves the last row into the freed slot), so systems can update
+    every moving entity with a handful of vectorized operations on `positions[:count]` and
+    `velocities[:count]`.
+
+    The bound Position and Velocity components stay in `entity.components`, but their class is swapped
+    for a view subclass whose fields read and write the arrays, so code using `position.x` keeps
+    working. Unbinding writes the current values back and restores the original class. Code that writes
+    `positions` directly should call `SpatialRegistry.mark_positions_written`, since only writes through the
+    components' fields are seen by the spatial indexes.
+
+    Attributes:
+        positions (np.ndarray): A (capacity, 2) float64 array of x, y coordinates.
+        velocities (np.ndarray): A (capacity, 2) float64 array of vx, vy components.
+        count (int): The number of bound entities.
+        entity_ids (List[uuid.UUID]): The id of the entity in each bound slot.
+        position_components (List[Position]): The bound Position view in each slot.
+        velocity_components (List[Velocity]): The bound Velocity view in each slot.
+        slots (Dict[uuid.UUID, int]): The slot of each bound entity.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        """
+        Initializes the store with room for `capacity` entities; the arrays grow as needed.
+
+        Args:
+            capacity (int, optional): The initial number of slots. Defaults to 1024.
+        """
+        capacity = max(1, capacity)
+        self.positions = np.zeros((capacity, 2), dtype=np.float64)
+        self.velocities = np.zeros((capacity, 2), dtype=np.float64)
+        self.count = 0
+        self.entity_ids: List[uuid.UUID] = []
+        self.slots: Dict[uuid.UUID, int] = {}
+        self.position_components: List[Position] = []
+        self.velocity_components: List[Velocity] = []
+        self._component_slots: Dict[int, int] = {}
+        self._position_view = _make_view_class(self, Position, "positions", ("x", "y"))
+        self._velocity_view = _make_view_class(self, Velocity, "velocities", ("vx", "vy"))
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __contains__(self, entity_id: object) -> bool:
+        return entity_id in self.slots
+
+    def sync(self, entity: "Entity") -> None:
+        """
+        Binds, rebinds or unbinds an entity so the store matches its current components.
+
+        Args:
+            entity (Entity): The entity whose Position and Velocity should be reflected in the store.
+        """
+        position = entity.components.get(Position)
+        velocity = entity.components.get(Velocity)
+        slot = self.slots.get(entity.id)
+
+        if slot is not None:
+            if position is self.position_components[slot] and velocity is self.velocity_components[slot]:
+                return
+            self.unbind(entity.id)
+
+        if position is not None and velocity is not None:
+            self.bind(entity.id, position, velocity)
+
+    def bind(self, entity_id: uuid.UUID, position: Position, velocity: Velocity) -> int:
+        """
+        Moves an entity's Position and Velocity into the arrays and turns the components into views.
+
+        Args:
+            entity_id (uuid.UUID): The id of the entity.
+            position (Position): The entity's Position component.
+            velocity (Velocity): The entity's Velocity component.
+
+        Returns:
+            int: The slot assigned to the entity.
+        """
+        if self.count == len(self.positions):
+            self._grow()
+
+        slot = self.count
+        self.positions[slot] = (position.x, position.y)
+        self.velocities[slot] = (velocity.vx, velocity.vy)
+
+        self.entity_ids.append(entity_id)
+        self.position_components.append(position)
+        self.velocity_components.append(velocity)
+        self.slots[entity_id] = slot
+        self._component_slots[id(position)] = slot
+        self._component_slots[id(velocity)] = slot
+        position.__class__ = self._position_view
+        velocity.__class__ = self._velocity_view
+        self.count += 1
+        return slot
+
+    def unbind(self, entity_id: uuid.UUID) -> None:
+        """
+        Writes an entity's values back into its components and releases its slot.
+
+        Args:
+            entity_id (uuid.UUID): The id of the entity to unbind.
+        """
+        slot = self.slots.pop(entity_id, None)
+        if slot is None:
+            return
+
+        position = self.position_components[slot]
+        velocity = self.velocity_components[slot]
+        position._sync_fields()
+        velocity._sync_fields()
+        position.__class__ = Position
+        velocity.__class__ = Velocity
+        del self._component_slots[id(position)]
+        del self._component_slots[id(velocity)]
+
+        # keep bound rows contiguous by moving the last row into the freed slot
+        last = self.count - 1
+        if slot != last:
+            moved_id = self.entity_ids[last]
+            moved_position = self.position_components[last]
+            moved_velocity = self.velocity_components[last]
+            self.positions[slot] = self.positions[last]
+            self.velocities[slot] = self.velocities[last]
+            self.entity_ids[slot] = moved_id
+            self.position_components[slot] = moved_position
+            self.velocity_components[slot] = moved_velocity
+            self.slots[moved_id] = slot
+            self._component_slots[id(moved_position)] = slot
+            self._component_slots[id(moved_velocity)] = slot
+
+        self.entity_ids.pop()
+        self.position_components.pop()
+        self.velocity_components.pop()
+        self.count = last
+
+    def get_slot(self, entity_id: uuid.UUID) -> Optional[int]:
+        """
+        Returns the slot of a bound entity.
+
+        Args:
+            entity_id (uuid.UUID): The id of the entity.
+
+        Returns:
+            Optional[int]: The entity's slot, or None if it isn't bound.
+        """
+        return self.slots.get(entity_id)
+
+    def _grow(self) -> None:
+        capacity = len(self.positions) * 2
+        for name in ("positions", "velocities"):
+            grown = np.zeros((capacity, 2), dtype=np.float64)
+            grown[: self.count] = getattr(self, name)[: self.count]
+            setattr(self, name, grown)
@@ -1,10 +1,18 @@
+import uuid
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
 from .components import Position, Velocity, Area, Located
 from .events import (
     POSITION_UPDATED_EVENT_TYPE,
+    POSITIONS_UPDATED_EVENT_TYPE,
     AreaEvent,
+    PositionsUpdatedEvent,
 )
 from .events import AREA_ENTERED_EVENT_TYPE, AREA_EXITED_EVENT_TYPE
 from .registry import SpatialRegistry
+from .storage import DenseMotionStore
 from ..core import Entity, System
 from ..core.entity_ref import EntityRef
 from ..core.exceptions import UnknownComponentError
@@ -30,60 +38,95 @@ class SpatialSystem(System):
 
 
 class MovementSystem(SpatialSystem):
-    _entity_cache = {}
-    _cache_ttl = 10
-    _cache_counter = {}
+    reads = {Velocity}
+    writes = {Position, Velocity}
 
-    def __init__(self, registry: SpatialRegistry, max_speed: float = 10):
+    def __init__(self, registry: SpatialRegistry, max_speed: float = 10, vectorized: bool = False):
         """
         Initializes the MovementSystem with a registry and a maximum speed for entities.
 
+        In vectorized mode the system gathers every moving entity into arrays, clamps and integrates them
+        in one pass and emits a single `POSITIONS_UPDATED_EVENT_TYPE` event on its own event bus. The
+        per-entity `POSITION_UPDATED_EVENT_TYPE` event is then only emitted to entities that have a
+        handler for it.
+
         Args:
             registry (SpatialRegistry): The registry to be used by the system.
             max_speed (float, optional): The maximum speed for entities. Defaults to 10.
+            vectorized (bool, optional): Whether to use the vectorized, batched-event mode. Defaults to False.
         """
         super().__init__(registry)
         self.max_speed = max_speed
+        self.vectorized = vectorized
         # Pre-calculate constants
         self._max_speed_squared = max_speed * max_speed
+        self._moved = []
 
     async def update(self, delta_time: float = 0) -> None:
-        # Process cache expiration only every few frames to reduce overhead
-        if hasattr(self, "_frame_counter"):
-            self._frame_counter = (self._frame_counter + 1) % 5
-            if self._frame_counter == 0:
-                self._process_cache_expiration()
-        else:
-            self._frame_counter = 0
-
         # Fast path for zero delta time
         if delta_time == 0:
             delta_time = 0.016  # Default to ~60fps if not specified
 
         # Reuse list to avoid allocation
-        if not hasattr(self, "_entities_data"):
-            self._entities_data = []
+        moved = self._moved
+        moved.clear()
+
+        motion_store = getattr(self.registry, "motion_store", None)
+        if motion_store is not None:
+            positions = self._integrate_dense(motion_store, delta_time, moved)
+        elif self.vectorized:
+            positions = self._integrate_gathered(delta_time, moved)
         else:
-            self._entities_data.clear()
-
-        # Collect entities using cache
-        async for entity_ref in self.registry.entities_with_components(Position, Velocity):
-            entity_id = entity_ref.entity_id
-
-            if entity_id in self._entity_cache:
-                entity, position, velocity = self._entity_cache[entity_id]
-                self._cache_counter[entity_id] = 0
-            else:
-                entity = await entity_ref.resolve()
-                position = await entity.get_component(Position)
-                velocity = await entity.get_component(Velocity)
-                self._entity_cache[entity_id] = (entity, position, velocity)
-                self._cache_counter[entity_id] = 0
-
-            self._entities_data.append((entity, position, velocity))
-
-        # Process all entities efficiently
-        for entity, position, velocity in self._entities_data:
+            positions = None
+            self._integrate_components(delta_time, moved)
+
+        if motion_store is not None and moved:
+            # the dense path writes the arrays directly, which the Position write hooks don't see
+            self.registry.mark_positions_written(entity_id for entity_id, _ in moved)
+
+        if self.vectorized:
+            await self._emit_batched(moved, positions)
+            return
+
+        # Emit events only for moved entities that listen for them
+        entities = self.registry.entities
+        for entity_id, position in moved:
+            entity = entities.get(entity_id)
+            if entity is not None and entity.event_bus.has_subscribers(POSITION_UPDATED_EVENT_TYPE):
+                await entity.event_bus.emit(POSITION_UPDATED_EVENT_TYPE, position)
+
+    async def _emit_batched(self, moved: list, positions: Optional[np.ndarray]) -> None:
+        """
+        Emits one batched event for the tick, then `position_updated` to the entities that listen for it.
+
+        Args:
+            moved (list): The (entity_id, position) pair of every entity that moved.
+            positions (Optional[np.ndarray]): The new coordinates of the moved entities, in the same order.
+        """
+        if not moved:
+            return
+
+        if self.event_bus.has_subscribers(POSITIONS_UPDATED_EVENT_TYPE):
+            if positions is None:
+                positions = np.array([(position.x, position.y) for _, position in moved], dtype=np.float64)
+            event = PositionsUpdatedEvent([entity_id for entity_id, _ in moved], positions)
+            await self.event_bus.emit(POSITIONS_UPDATED_EVENT_TYPE, event)
+
+        entities = self.registry.entities
+        for entity_id, position in moved:
+            entity = entities.get(entity_id)
+            if entity is not None and entity.event_bus.has_subscribers(POSITION_UPDATED_EVENT_TYPE):
+                await entity.event_bus.emit(POSITION_UPDATED_EVENT_TYPE, position)
+
+    def _integrate_components(self, delta_time: float, moved: list) -> None:
+        """
+        Clamps speeds and integrates positions one component at a time.
+
+        Args:
+            delta_time (float): Time elapsed since the last update in seconds.
+            moved (list): Receives an (entity_id, position) pair for every entity that moved.
+        """
+        for entity_id, position, velocity in self.registry.iter_components(Position, Velocity):
             # Skip update for stationary objects
             if velocity.vx == 0 and velocity.vy == 0:
                 continue
@@ -101,18 +144,83 @@ class MovementSystem(SpatialSystem):
             # Apply movement with delta time
             position.x += velocity.vx * delta_time
             position.y += velocity.vy * delta_time
+            moved.append((entity_id, position))
 
-        # Emit events only for moved entities
-        for entity, position, velocity in self._entities_data:
-            if velocity.vx != 0 or velocity.vy != 0:
-                await entity.event_bus.emit(POSITION_UPDATED_EVENT_TYPE, position)
+    def _integrate_gathered(self, delta_time: float, moved: list) -> Optional[np.ndarray]:
+        """
+        Gathers moving entities into arrays, clamps and integrates them in one pass and writes the results back.
 
-    def _process_cache_expiration(self):
-        for entity_id in list(self._cache_counter.keys()):
-            self._cache_counter[entity_id] += 1
-            if self._cache_counter[entity_id] > self._cache_ttl:
-                self._entity_cache.pop(entity_id, None)
-                self._cache_counter.pop(entity_id, None)
+        Args:
+            delta_time (float): Time elapsed since the last update in seconds.
+            moved (list): Receives an (entity_id, position) pair for every entity that moved.
+
+        Returns:
+            Optional[np.ndarray]: The new coordinates of the moved entities, or None if nothing moved.
+        """
+        gathered = [
+            (entity_id, position, velocity)
+            for entity_id, position, velocity in self.registry.iter_components(Position, Velocity)
+            if velocity.vx or velocity.vy
+        ]
+        if not gathered:
+            return None
+
+        positions = np.array([(position.x, position.y) for _, position, _ in gathered], dtype=np.float64)
+        velocities = np.array([(velocity.vx, velocity.vy) for _, _, velocity in gathered], dtype=np.float64)
+        _, clamped = self._clamp_and_integrate(positions, velocities, delta_time)
+
+        for slot in clamped.tolist():
+            velocity = gathered[slot][2]
+            velocity.vx, velocity.vy = velocities[slot].tolist()
+        for (entity_id, position, _), (x, y) in zip(gathered, positions.tolist()):
+            position.x = x
+            position.y = y
+            moved.append((entity_id, position))
+        return positions
+
+    def _integrate_dense(self, motion_store: DenseMotionStore, delta_time: float, moved: list) -> np.ndarray:
+        """
+        Clamps speeds and integrates positions for every entity in the dense store with array operations.
+
+        Args:
+            motion_store (DenseMotionStore): The registry's dense Position/Velocity storage.
+            delta_time (float): Time elapsed since the last update in seconds.
+            moved (list): Receives an (entity_id, position) pair for every entity that moved.
+
+        Returns:
+            np.ndarray: The new coordinates of the moved entities.
+        """
+        count = motion_store.count
+        positions = motion_store.positions[:count]
+        velocities = motion_store.velocities[:count]
+        moving, _ = self._clamp_and_integrate(positions, velocities, delta_time)
+
+        entity_ids = motion_store.entity_ids
+        position_components = motion_store.position_components
+        moved.extend((entity_ids[slot], position_components[slot]) for slot in moving.tolist())
+        return positions[moving]
+
+    def _clamp_and_integrate(self, positions: np.ndarray, velocities: np.ndarray, delta_time: float) -> tuple:
+        """
+        Clamps the velocities to the maximum speed and advances the positions in place.
+
+        Args:
+            positions (np.ndarray): An (n, 2) array of x, y coordinates.
+            velocities (np.ndarray): An (n, 2) array of vx, vy components.
+            delta_time (float): Time elapsed since the last update in seconds.
+
+        Returns:
+            tuple: The indices of the rows that moved and the indices of the rows whose velocity was clamped.
+        """
+        speed_squared = np.einsum("ij,ij->i", velocities, velocities)
+        moving = np.flatnonzero(speed_squared)
+
+        clamped = np.flatnonzero(speed_squared > self._max_speed_squared)
+        if clamped.size:
+            velocities[clamped] *= (self.max_speed / np.sqrt(speed_squared[clamped]))[:, np.newaxis]
+
+        positions[moving] += velocities[moving] * delta_time
+        return moving, clamped
 
     @staticmethod
     def _fast_inverse_sqrt(number):
@@ -121,33 +229,222 @@ class MovementSystem(SpatialSystem):
 
 
 class LocationSystem(SpatialSystem):
+    reads = {Position, Area}
+    writes = {Located}
+
+    def __init__(self, registry: SpatialRegistry, incremental: bool = False):
+        """
+        Initializes the LocationSystem with a registry.
+
+        In incremental mode the system remembers the positions it last tested. A tick where no Position
+        changed and no Area was added, removed or reshaped returns immediately. Otherwise only the entities
+        whose Position changed are re-tested, and only against the areas whose bounding box holds their old
+        or new position. Enter and exit events are the same in both modes. The changed entities come from
+        `SpatialRegistry.track_position_changes`, which sees every write to a Position's fields.
+
+        Args:
+            registry (SpatialRegistry): The registry to be used by the system.
+            incremental (bool, optional): Whether to only re-test entities that moved. Defaults to False.
+        """
+        super().__init__(registry)
+        self.incremental = incremental
+        self._position_changes = registry.track_position_changes() if incremental else None
+        self._last_positions: Dict[uuid.UUID, Tuple[float, float]] = {}
+        self._area_versions: Dict[uuid.UUID, int] = {}
+
     async def update(self, delta_time: float = 0) -> None:
-        async for area_entity_ref in self.registry.entities_with_components(Area):
-            area_entity: Entity = await area_entity_ref.resolve()
-            area: Area = await area_entity.get_component(Area)
-
-            existing_entity_refs: set[EntityRef] = area._entities
-            _updated_entity_refs: set[EntityRef] = set()
-            async for entity_ref in self.registry.entities_within_area(area):
-                _updated_entity_refs.add(entity_ref)
-                if entity_ref not in existing_entity_refs:
-                    entity = await entity_ref.resolve()
-                    try:
-                        await entity.remove_component(Located)
-                    except UnknownComponentError:
-                        pass
-
-                    await entity.add_component(Located(area_entity_ref=area_entity_ref))
-                    event = AreaEvent(entity_ref=entity_ref, area_entity_ref=area_entity_ref)
-                    await entity.event_bus.emit(AREA_ENTERED_EVENT_TYPE, event)
-                    await area_entity.event_bus.emit(AREA_ENTERED_EVENT_TYPE, event)
-
-            old_refs = existing_entity_refs - _updated_entity_refs
-            for entity_ref in old_refs:
-                entity = await entity_ref.resolve()
-                event = AreaEvent(entity_ref=entity_ref, area_entity_ref=area_entity_ref)
-                await self.registry.remove_component_from_entity(entity.id, Located)
-                await entity.event_bus.emit(AREA_EXITED_EVENT_TYPE, event)
-                await area_entity.event_bus.emit(AREA_EXITED_EVENT_TYPE, event)
-
-            area._entities = _updated_entity_refs
+        if self.incremental:
+            await self._update_incremental()
+            return
+
+        for area_entity_id, area in self.registry.iter_components(Area):
+            await self._update_area(area_entity_id, area)
+
+    async def _update_area(self, area_entity_id: uuid.UUID, area: Area) -> None:
+        """
+        Recomputes the membership of one area from scratch, emitting enter and exit events for the changes.
+
+        Args:
+            area_entity_id (uuid.UUID): The id of the entity holding the area.
+            area (Area): The area to update.
+        """
+        area_entity: Entity = self.registry.get_entity_by_id_nowait(area_entity_id)
+        area_entity_ref = self.registry.get_entity_ref(area_entity_id)
+
+        existing_entity_refs: set[EntityRef] = area._entities
+        _updated_entity_refs: set[EntityRef] = set()
+        async for entity_ref in self.registry.entities_within_area(area):
+            _updated_entity_refs.add(entity_ref)
+            if entity_ref not in existing_entity_refs:
+                await self._enter(entity_ref, area_entity, area_entity_ref)
+
+        old_refs = existing_entity_refs - _updated_entity_refs
+        for entity_ref in old_refs:
+            await self._exit(entity_ref, area_entity, area_entity_ref)
+
+        area._entities = _updated_entity_refs
+
+    async def _update_incremental(self) -> None:
+        """
+        Updates area membership for the entities whose Position changed since the last update.
+        """
+        # taken before any handler runs, so positions they write are picked up next tick
+        changed_ids, unknown = self._position_changes.take()
+        areas = list(self.registry.iter_components(Area))
+        area_versions = {area_entity_id: area.geometry_version for area_entity_id, area in areas}
+        if not changed_ids and not unknown and area_versions == self._area_versions:
+            return
+
+        last_positions = self._last_positions
+        if unknown:
+            changed_ids = set(last_positions)
+            changed_ids.update(entity_id for entity_id, _ in self.registry.iter_components(Position))
+
+        changed = []
+        lost = []
+        new_points = []
+        old_points = []
+        entities = self.registry.entities
+        for entity_id in changed_ids:
+            entity = entities.get(entity_id)
+            position = entity.components.get(Position) if entity is not None else None
+            if position is None:
+                if last_positions.pop(entity_id, None) is not None:
+                    lost.append(entity_id)
+                continue
+            point = (position.x, position.y)
+            # entities without a previous position get NaN, which falls outside every bounding box
+            old_point = last_positions.get(entity_id, (np.nan, np.nan))
+            if old_point != point:
+                changed.append(entity_id)
+                new_points.append(point)
+                old_points.append(old_point)
+                last_positions[entity_id] = point
+        new_points = np.array(new_points, dtype=np.float64).reshape(-1, 2)
+        old_points = np.array(old_points, dtype=np.float64).reshape(-1, 2)
+
+        for area_entity_id, area in areas:
+            if self._area_versions.get(area_entity_id) != area_versions[area_entity_id]:
+                await self._update_area(area_entity_id, area)
+            elif changed or lost:
+                await self._update_area_members(area_entity_id, area, changed, new_points, old_points, lost)
+
+        self._area_versions = area_versions
+
+    async def _update_area_members(
+        self,
+        area_entity_id: uuid.UUID,
+        area: Area,
+        changed: List[uuid.UUID],
+        new_points: np.ndarray,
+        old_points: np.ndarray,
+        lost: List[uuid.UUID],
+    ) -> None:
+        """
+        Re-tests the entities that moved in or out of an area's bounding box, emitting enter and exit events.
+
+        Args:
+            area_entity_id (uuid.UUID): The id of the entity holding the area.
+            area (Area): The area to update.
+            changed (List[uuid.UUID]): The ids of the entities whose Position changed.
+            new_points (np.ndarray): The current x, y of the changed entities, in the same order.
+            old_points (np.ndarray): The previously tested x, y of the changed entities, NaN for new ones.
+            lost (List[uuid.UUID]): The ids of the entities that no longer have a Position.
+        """
+        members: set[EntityRef] = set(area._entities)
+        entered = []
+        exited = []
+
+        min_x, min_y, max_x, max_y = area.get_bounds()
+
+        def in_bounds(points: np.ndarray) -> np.ndarray:
+            xs = points[:, 0]
+            ys = points[:, 1]
+            return (xs >= min_x) & (xs <= max_x) & (ys >= min_y) & (ys <= max_y)
+
+        crossed = np.flatnonzero(in_bounds(new_points) | in_bounds(old_points))
+        if crossed.size:
+            inside = area.points_within_bounds(new_points[crossed, 0], new_points[crossed, 1])
+            for index, is_inside in zip(crossed.tolist(), inside.tolist()):
+                entity_ref = self.registry.get_entity_ref(changed[index])
+                if is_inside and entity_ref not in members:
+                    entered.append(entity_ref)
+                elif not is_inside and entity_ref in members:
+                    exited.append(entity_ref)
+
+        for entity_id in lost:
+            entity_ref = self.registry.get_entity_ref(entity_id)
+            if entity_ref in members:
+                if entity_id in self.registry.entities:
+                    exited.append(entity_ref)
+                else:
+                    # the entity is gone, so there is nobody left to notify
+                    members.discard(entity_ref)
+
+        if entered or exited:
+            area_entity: Entity = self.registry.get_entity_by_id_nowait(area_entity_id)
+            area_entity_ref = self.registry.get_entity_ref(area_entity_id)
+            for entity_ref in entered:
+                members.add(entity_ref)
+                await self._enter(entity_ref, area_entity, area_entity_ref)
+            for entity_ref in exited:
+                members.discard(entity_ref)
+                await self._exit(entity_ref, area_entity, area_entity_ref)
+
+        area._entities = members
+
+    async def _enter(self, entity_ref: EntityRef, area_entity: Entity, area_entity_ref: EntityRef) -> None:
+        """
+        Marks an entity as located in an area and emits AREA_ENTERED_EVENT_TYPE to the entity and the area.
+
+        Args:
+            entity_ref (EntityRef): The entity entering the area.
+            area_entity (Entity): The entity holding the area.
+            area_entity_ref (EntityRef): A reference to the entity holding the area.
+        """
+        entity = entity_ref.resolve_nowait()
+        try:
+            await entity.remove_component(Located)
+        except UnknownComponentError:
+            pass
+
+        await entity.add_component(Located(area_entity_ref=area_entity_ref))
+        await self._emit_area_event(AREA_ENTERED_EVENT_TYPE, entity, entity_ref, area_entity, area_entity_ref)
+
+    async def _exit(self, entity_ref: EntityRef, area_entity: Entity, area_entity_ref: EntityRef) -> None:
+        """
+        Removes an entity's location and emits AREA_EXITED_EVENT_TYPE to the entity and the area.
+
+        Args:
+            entity_ref (EntityRef): The entity exiting the area.
+            area_entity (Entity): The entity holding the area.
+            area_entity_ref (EntityRef): A reference to the entity holding the area.
+        """
+        entity = entity_ref.resolve_nowait()
+        await self.registry.remove_component_from_entity(entity.id, Located)
+        await self._emit_area_event(AREA_EXITED_EVENT_TYPE, entity, entity_ref, area_entity, area_entity_ref)
+
+    @staticmethod
+    async def _emit_area_event(
+        event_name: str, entity: Entity, entity_ref: EntityRef, area_entity: Entity, area_entity_ref: EntityRef
+    ) -> None:
+        """
+        Emits an area event to the entity and the area, building it only if one of them listens for it.
+
+        Args:
+            event_name (str): AREA_ENTERED_EVENT_TYPE or AREA_EXITED_EVENT_TYPE.
+            entity (Entity): The entity entering or exiting the area.
+            entity_ref (EntityRef): A reference to the entity.
+            area_entity (Entity): The entity holding the area.
+            area_entity_ref (EntityRef): A reference to the entity holding the area.
+        """
+        entity_listens = entity.event_bus.has_subscribers(event_name)
+        area_listens = area_entity.event_bus.has_subscribers(event_name)
+        if not entity_listens and not area_listens:
+            return
+
+        event = AreaEvent(entity_ref=entity_ref, area_entity_ref=area_entity_ref)
+        if entity_listens:
+            await entity.event_bus.emit(event_name, event)
+        if area_listens:
+            await area_entity.event_bus.emit(event_name, event)
@@ -23,8 +23,8 @@ def audio_system(registry):
 async def test_hearing_entity_processes_sound_queue(registry, audio_system):
     # Create entity with hearing
     hearing_entity = Entity[Position(x=0, y=0), Hearing()](registry)
-    # Mock the emit method to track calls
-    hearing_entity.event_bus.emit = AsyncMock()
+    heard = AsyncMock()
+    hearing_entity.event_bus.register_handler(SOUND_HEARD_EVENT_TYPE, heard)
 
     # Add a sound event to the hearing queue
     hearing = await hearing_entity.get_component(Hearing)
@@ -35,7 +35,7 @@ async def test_hearing_entity_processes_sound_queue(registry, audio_system):
     await audio_system.update()
 
     # Verify that SOUND_HEARD_EVENT_TYPE was emitted with the sound event
-    hearing_entity.event_bus.emit.assert_called_once_with(SOUND_HEARD_EVENT_TYPE, sound_event)
+    heard.assert_called_once_with(sound_event)
 
     # Queue should be cleared
     assert not hearing.retrieve_queue()
@@ -49,8 +49,8 @@ async def test_sound_propagation_within_range(registry, audio_system):
     # Create listener entity within range
     listener_entity = Entity[Position(x=30, y=40), Hearing()](registry)  # Distance = 50
 
-    # Mock event bus emissions
-    source_entity.event_bus.emit = AsyncMock()
+    created = AsyncMock()
+    source_entity.event_bus.register_handler(SOUND_CREATED_EVENT_TYPE, created)
 
     # Create sound event
     audible = await source_entity.get_component(Audible)
@@ -61,7 +61,7 @@ async def test_sound_propagation_within_range(registry, audio_system):
     await audio_system.update()
 
     # Verify that SOUND_CREATED_EVENT_TYPE was emitted
-    source_entity.event_bus.emit.assert_called_with(SOUND_CREATED_EVENT_TYPE, sound_event)
+    created.assert_called_with(sound_event)
 
     # Verify the listener received the sound
     hearing = await listener_entity.get_component(Hearing)
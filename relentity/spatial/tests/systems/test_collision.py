@@ -0,0 +1,314 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pytest
+
+from relentity.core import Registry
+from relentity.core.entities import Entity
+from relentity.spatial.components import Position, Velocity
+from relentity.spatial.physics.broadphase import (
+    BoundsIndex,
+    BruteForceBroadPhase,
+    SweepAndPruneBroadPhase,
+    UniformGridBroadPhase,
+    find_awake_pairs,
+)
+from relentity.spatial.physics.components import ShapeBody, ShapeType
+from relentity.spatial.physics.narrowphase import find_contacts, shape_arrays
+from relentity.spatial.physics.systems import CollisionSystem
+from relentity.spatial.registry import SpatialRegistry
+from relentity.spatial.systems import MovementSystem
+
+BROAD_PHASES = [BruteForceBroadPhase(), SweepAndPruneBroadPhase(), UniformGridBroadPhase(cell_size=7)]
+
+
+def _random_bounds(seed, count=300):
+    rng = np.random.default_rng(seed)
+    centers = rng.uniform(-100, 100, size=(count, 2))
+    # integer centers and extents make many boxes touch exactly
+    centers[: count // 3] = np.round(centers[: count // 3] / 5) * 5
+    extents = rng.choice([0.0, 2.5, 5.0, 12.0], size=(count, 2))
+    return np.hstack((centers - extents, centers + extents))
+
+
+def _pairwise_overlaps(bounds):
+    return [
+        (i, j)
+        for i in range(len(bounds))
+        for j in range(i + 1, len(bounds))
+        if bounds[i, 0] <= bounds[j, 2]
+        and bounds[j, 0] <= bounds[i, 2]
+        and bounds[i, 1] <= bounds[j, 3]
+        and bounds[j, 1] <= bounds[i, 3]
+    ]
+
+
+@pytest.mark.parametrize("broad_phase", BROAD_PHASES, ids=lambda phase: type(phase).__name__)
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_broad_phase_finds_every_overlapping_pair_in_order(broad_phase, seed):
+    bounds = _random_bounds(seed)
+
+    pairs = broad_phase.find_pairs(bounds)
+
+    assert [tuple(pair) for pair in pairs.tolist()] == _pairwise_overlaps(bounds)
+
+
+@pytest.mark.parametrize("broad_phase", BROAD_PHASES, ids=lambda phase: type(phase).__name__)
+def test_broad_phase_handles_fewer_than_two_bodies(broad_phase):
+    assert broad_phase.find_pairs(np.empty((0, 4))).shape == (0, 2)
+    assert broad_phase.find_pairs(np.array([[0.0, 0.0, 1.0, 1.0]])).shape == (0, 2)
+
+
+@pytest.mark.parametrize("broad_phase", BROAD_PHASES, ids=lambda phase: type(phase).__name__)
+@pytest.mark.parametrize("seed", [0, 1])
+def test_awake_pairs_skip_only_pairs_of_resting_bodies(broad_phase, seed):
+    bounds = _random_bounds(seed)
+    active = np.random.default_rng(seed).random(len(bounds)) < 0.3
+    awake = np.flatnonzero(active)
+    resting = np.flatnonzero(~active)
+
+    pairs = find_awake_pairs(broad_phase, awake, bounds[awake], resting, BoundsIndex(bounds[resting]))
+
+    expected = [(i, j) for i, j in _pairwise_overlaps(bounds) if active[i] or active[j]]
+    assert [tuple(pair) for pair in pairs.tolist()] == expected
+
+
+@pytest.mark.parametrize("broad_phase", BROAD_PHASES[1:], ids=lambda phase: type(phase).__name__)
+@pytest.mark.asyncio
+async def test_collision_response_matches_brute_force(broad_phase):
+    rng = np.random.default_rng(11)
+    shapes = [ShapeType.CIRCLE, ShapeType.RECTANGLE, ShapeType.TRIANGLE]
+    bodies = [
+        (
+            rng.uniform(0, 120, size=2).tolist(),
+            rng.uniform(-5, 5, size=2).tolist(),
+            ShapeBody(shape_type=shapes[index % 3], radius=int(rng.integers(2, 12)), width=8, height=14),
+        )
+        for index in range(80)
+    ]
+    registry = SpatialRegistry()
+    entities = [
+        Entity[Position(x=x, y=y), Velocity(vx=vx, vy=vy), shape](registry) for (x, y), (vx, vy), shape in bodies
+    ]
+    results = []
+    for phase in (BruteForceBroadPhase(), broad_phase):
+        for entity, (_, (vx, vy), _) in zip(entities, bodies):
+            entity.get_component_nowait(Velocity).vx = vx
+            entity.get_component_nowait(Velocity).vy = vy
+        system = CollisionSystem(registry, broad_phase=phase)
+        await system.update()
+        velocities = [entity.get_component_nowait(Velocity) for entity in entities]
+        results.append((system.collision_count, [(velocity.vx, velocity.vy) for velocity in velocities]))
+
+    assert results[0][0] > 0
+    assert results[0] == results[1]
+
+
+def test_batched_shape_tests_match_pairwise_checks():
+    rng = np.random.default_rng(4)
+    shape_types = [ShapeType.CIRCLE, ShapeType.RECTANGLE, ShapeType.TRIANGLE]
+    shapes = [
+        ShapeBody(
+            shape_type=shape_types[int(rng.integers(3))],
+            radius=int(rng.integers(1, 10)),
+            width=int(rng.integers(1, 20)),
+            height=int(rng.integers(1, 20)),
+        )
+        for _ in range(60)
+    ]
+    # integer positions make touching rectangles and tangent shapes common
+    positions = [Position(x=float(x), y=float(y)) for x, y in rng.integers(0, 40, size=(60, 2))]
+    pairs = np.array(np.triu_indices(len(shapes), k=1)).T
+    coordinates = np.array([(position.x, position.y) for position in positions])
+    system = CollisionSystem(SpatialRegistry())
+
+    touching = find_contacts(pairs, coordinates, *shape_arrays(shapes))
+
+    expected = [system._check_collision(positions[i], shapes[i], positions[j], shapes[j]) for i, j in pairs.tolist()]
+    assert touching.tolist() == expected
+
+
+@pytest.mark.parametrize("vectorized", [False, True], ids=["pairwise", "vectorized"])
+@pytest.mark.asyncio
+async def test_head_on_circles_bounce_apart(vectorized):
+    registry = SpatialRegistry()
+    left = Entity[Position(x=0, y=0), Velocity(vx=1, vy=0), ShapeBody(shape_type=ShapeType.CIRCLE, radius=5)](registry)
+    right = Entity[Position(x=8, y=0), Velocity(vx=-1, vy=0), ShapeBody(shape_type=ShapeType.CIRCLE, radius=5)](
+        registry
+    )
+
+    system = CollisionSystem(registry, vectorized=vectorized)
+    await system.update()
+
+    assert system.collision_count == 1
+    assert left.get_component_nowait(Velocity).vx == pytest.approx(1 - 1.8 - 0.05)
+    assert right.get_component_nowait(Velocity).vx == pytest.approx(-1 + 1.8 + 0.05)
+
+
+@pytest.mark.parametrize("vectorized", [False, True], ids=["pairwise", "vectorized"])
+@pytest.mark.asyncio
+async def test_ball_bounces_off_static_wall(vectorized):
+    registry = SpatialRegistry()
+    wall = Entity[Position(x=10, y=0), ShapeBody(shape_type=ShapeType.RECTANGLE, width=4, height=40, static=True)](
+        registry
+    )
+    ball = Entity[Position(x=5, y=0), Velocity(vx=3, vy=0), ShapeBody(shape_type=ShapeType.CIRCLE, radius=4)](registry)
+
+    system = CollisionSystem(registry, vectorized=vectorized)
+    await system.update()
+
+    assert system.collision_count == 1
+    assert ball.get_component_nowait(Velocity).vx == pytest.approx(3 - 1.8 * 3 - 0.05)
+    assert wall.get_component_nowait(Velocity) is None
+
+
+@pytest.mark.parametrize("vectorized", [False, True], ids=["pairwise", "vectorized"])
+@pytest.mark.asyncio
+async def test_resting_bodies_sleep_until_touched(vectorized):
+    registry = SpatialRegistry()
+    shape = ShapeBody(shape_type=ShapeType.CIRCLE, radius=5)
+    first = Entity[Position(x=0, y=0), Velocity(vx=0.05, vy=0), shape](registry)
+    second = Entity[Position(x=8, y=0), Velocity(vx=-0.05, vy=0), shape](registry)
+    system = CollisionSystem(registry, vectorized=vectorized, sleep_threshold=0.5, sleep_ticks=2)
+
+    await system.update()
+    await system.update()
+    # the slow bodies bounced apart, then fell asleep with their velocity zeroed
+    assert first.get_component_nowait(ShapeBody).sleeping and second.get_component_nowait(ShapeBody).sleeping
+    assert first.get_component_nowait(Velocity).vx == 0
+
+    count = system.collision_count
+    await system.update()
+    assert system.collision_count == count
+
+    mover = Entity[Position(x=4, y=8), Velocity(vx=0, vy=-5), shape](registry)
+    await system.update()
+    assert system.collision_count > count
+    assert not first.get_component_nowait(ShapeBody).sleeping
+    assert not mover.get_component_nowait(ShapeBody).sleeping
+
+
+@pytest.mark.parametrize("vectorized", [False, True], ids=["pairwise", "vectorized"])
+@pytest.mark.asyncio
+async def test_resting_bodies_skip_the_broad_phase(vectorized, mocker):
+    registry = SpatialRegistry()
+    for index in range(5):
+        Entity[Position(x=index * 20, y=0), ShapeBody(shape_type=ShapeType.RECTANGLE, static=True)](registry)
+    Entity[Position(x=0, y=12), Velocity(vx=0, vy=-5), ShapeBody(shape_type=ShapeType.CIRCLE, radius=5)](registry)
+    broad_phase = SweepAndPruneBroadPhase()
+    find_pairs = mocker.spy(broad_phase, "find_pairs")
+    indexed = mocker.spy(BoundsIndex, "__init__")
+    system = CollisionSystem(registry, broad_phase=broad_phase, vectorized=vectorized)
+
+    await system.update()
+    await system.update()
+
+    assert [len(call.args[0]) for call in find_pairs.call_args_list] == [1, 1]
+    # the static bodies' index is built once and kept while none of them moves
+    assert indexed.call_count == 1
+    # nothing moves the ball between the updates, so it touches the first wall both times
+    assert system.collision_count == 2
+
+
+@pytest.mark.parametrize("vectorized", [False, True], ids=["pairwise", "vectorized"])
+@pytest.mark.asyncio
+async def test_collisions_work_on_a_plain_registry(vectorized):
+    registry = Registry()
+    Entity[Position(x=10, y=0), ShapeBody(shape_type=ShapeType.RECTANGLE, width=4, height=40, static=True)](registry)
+    ball = Entity[Position(x=5, y=0), Velocity(vx=3, vy=0), ShapeBody(shape_type=ShapeType.CIRCLE, radius=4)](registry)
+
+    system = CollisionSystem(registry, vectorized=vectorized)
+    await system.update()
+    await system.update()
+
+    assert system.collision_count == 2
+    assert ball.get_component_nowait(Velocity).vx < 0
+
+
+@pytest.mark.asyncio
+async def test_sleeping_body_wakes_when_set_moving():
+    registry = SpatialRegistry()
+    body = Entity[Position(x=0, y=0), Velocity(vx=0, vy=0), ShapeBody(shape_type=ShapeType.CIRCLE)](registry)
+    system = CollisionSystem(registry, sleep_ticks=1)
+    await system.update()
+    assert body.get_component_nowait(ShapeBody).sleeping
+
+    body.get_component_nowait(Velocity).vx = 2
+    await system.update()
+
+    assert not body.get_component_nowait(ShapeBody).sleeping
+
+
+@pytest.mark.parametrize("continuous", [False, True])
+@pytest.mark.asyncio
+async def test_continuous_bodies_do_not_tunnel_through_thin_walls(continuous):
+    registry = SpatialRegistry()
+    Entity[Position(x=50, y=0), ShapeBody(shape_type=ShapeType.RECTANGLE, width=2, height=100, static=True)](registry)
+    bullet = Entity[
+        Position(x=0, y=0),
+        Velocity(vx=200, vy=0),
+        ShapeBody(shape_type=ShapeType.CIRCLE, radius=1, continuous=continuous),
+    ](registry)
+    collisions = CollisionSystem(registry)
+    movement = MovementSystem(registry, max_speed=1000)
+
+    for _ in range(3):
+        await collisions.update(0.5)
+        await movement.update(0.5)
+
+    position = bullet.get_component_nowait(Position)
+    assert (position.x < 50) == continuous
+    assert (bullet.get_component_nowait(Velocity).vx < 0) == continuous
+
+
+@pytest.mark.parametrize("vectorized", [False, True], ids=["pairwise", "vectorized"])
+@pytest.mark.asyncio
+async def test_continuous_body_only_travels_the_rest_of_the_update_after_bouncing(vectorized):
+    registry = SpatialRegistry()
+    Entity[Position(x=50, y=0), ShapeBody(shape_type=ShapeType.RECTANGLE, width=2, height=100, static=True)](registry)
+    ball = Entity[
+        Position(x=0, y=0),
+        Velocity(vx=100, vy=0),
+        ShapeBody(shape_type=ShapeType.CIRCLE, radius=1, continuous=True),
+    ](registry)
+
+    await CollisionSystem(registry, vectorized=vectorized).update(1)
+    await MovementSystem(registry, max_speed=1000).update(1)
+
+    # touches the wall at x=48 after 0.48 of the update, then moves at -80 for the remaining 0.52
+    position = ball.get_component_nowait(Position)
+    assert ball.get_component_nowait(Velocity).vx == pytest.approx(-80)
+    assert position.x == pytest.approx(48 - 80 * 0.52)
+    assert position.y == 0
+
+
+@pytest.mark.asyncio
+async def test_process_pool_collisions_match_inline():
+    rng = np.random.default_rng(5)
+    shapes = [ShapeType.CIRCLE, ShapeType.RECTANGLE, ShapeType.TRIANGLE]
+    registry = SpatialRegistry()
+    entities = [
+        Entity[
+            Position(x=x, y=y),
+            Velocity(vx=vx, vy=vy),
+            ShapeBody(shape_type=shapes[index % 3], radius=6, width=8, height=14, static=index % 7 == 0),
+        ](registry)
+        for index, (x, y, vx, vy) in enumerate(rng.uniform(-5, 80, size=(60, 4)).tolist())
+    ]
+    start = [
+        (entity.get_component_nowait(Velocity).vx, entity.get_component_nowait(Velocity).vy) for entity in entities
+    ]
+
+    results = []
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        for pool in (None, executor):
+            for entity, (vx, vy) in zip(entities, start):
+                entity.get_component_nowait(Velocity).vx = vx
+                entity.get_component_nowait(Velocity).vy = vy
+            system = CollisionSystem(registry, vectorized=True, executor=pool)
+            await system.update()
+            velocities = [entity.get_component_nowait(Velocity) for entity in entities]
+            results.append((system.collision_count, [(velocity.vx, velocity.vy) for velocity in velocities]))
+
+    assert results[0][0] > 0
+    assert results[0] == results[1]
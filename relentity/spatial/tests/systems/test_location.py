@@ -1,11 +1,12 @@
 from unittest.mock import AsyncMock
 
+import numpy as np
 import pytest
 
 from relentity.core import EntityRef
 from relentity.core.entities import Entity
 from relentity.spatial.registry import SpatialRegistry
-from relentity.spatial.components import Position, Area, Located
+from relentity.spatial.components import Position, Velocity, Area, Located
 from relentity.spatial.events import AREA_ENTERED_EVENT_TYPE, AREA_EXITED_EVENT_TYPE
 from relentity.spatial.systems import LocationSystem
 
@@ -15,9 +16,9 @@ def registry():
     return SpatialRegistry()
 
 
-@pytest.fixture
-def location_system(registry):
-    return LocationSystem(registry)
+@pytest.fixture(params=[False, True], ids=["full", "incremental"])
+def location_system(registry, request):
+    return LocationSystem(registry, incremental=request.param)
 
 
 @pytest.mark.asyncio
@@ -135,3 +136,85 @@ async def test_entity_moves_within_area(registry, location_system):
     # exit was never called
     mock_area_area_exited_handler.assert_not_awaited()
     mock_entity_area_exited_handler.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_incremental_only_retests_moved_entities(registry, mocker):
+    location_system = LocationSystem(registry, incremental=True)
+    area_entity = Entity[Area(geometry=[(0, 0), (10, 0), (10, 10), (0, 10)])](registry)
+    Entity[Area(geometry=[(100, 100), (110, 100), (110, 110), (100, 110)])](registry)
+    mover = Entity[Position(x=5, y=5)](registry)
+    Entity[Position(x=50, y=50)](registry)
+    await location_system.update()
+
+    tested = mocker.spy(Area, "points_within_bounds")
+    iterated = mocker.spy(registry, "iter_components")
+    await location_system.update()
+    assert tested.call_count == 0
+
+    exited = AsyncMock()
+    area_entity.event_bus.register_handler(AREA_EXITED_EVENT_TYPE, exited)
+    mover.get_component_nowait(Position).x = 20
+    await location_system.update()
+
+    # only the first area's bounding box held the mover's old or new position
+    assert tested.call_count == 1
+    # and the positions of the entities that didn't move were never read
+    assert all(call.args != (Position,) for call in iterated.call_args_list)
+    exited.assert_awaited_once()
+    assert mover.get_component_nowait(Located) is None
+
+
+@pytest.mark.asyncio
+async def test_incremental_sees_dense_positions_written_in_place():
+    registry = SpatialRegistry(dense_storage=True)
+    location_system = LocationSystem(registry, incremental=True)
+    Entity[Area(geometry=[(0, 0), (10, 0), (10, 10), (0, 10)])](registry)
+    entity = Entity[Position(x=5, y=5), Velocity(vx=0, vy=0)](registry)
+    await location_system.update()
+    assert entity.get_component_nowait(Located) is not None
+
+    entity.get_component_nowait(Position).x = 20
+    await location_system.update()
+
+    assert entity.get_component_nowait(Located) is None
+
+
+@pytest.mark.asyncio
+async def test_incremental_forgets_removed_entities(registry):
+    location_system = LocationSystem(registry, incremental=True)
+    area = Entity[Area(geometry=[(0, 0), (10, 0), (10, 10), (0, 10)])](registry).get_component_nowait(Area)
+    entity = Entity[Position(x=5, y=5)](registry)
+    await location_system.update()
+    assert len(area._entities) == 1
+
+    await registry.remove_entity(entity.id)
+    await location_system.update()
+
+    assert area._entities == set()
+
+
+@pytest.mark.asyncio
+async def test_reshaped_area_is_recomputed(registry, location_system):
+    area = Entity[Area(geometry=[(0, 0), (10, 0), (10, 10), (0, 10)])](registry).get_component_nowait(Area)
+    entity = Entity[Position(x=5, y=5)](registry)
+    await location_system.update()
+    assert entity.get_component_nowait(Located) is not None
+
+    area.geometry = [(20, 20), (30, 20), (30, 30), (20, 30)]
+    await location_system.update()
+
+    assert entity.get_component_nowait(Located) is None
+    assert area._entities == set()
+
+
+def test_area_reassigning_geometry_refreshes_cached_bounds():
+    area = Area(geometry=[(0, 0), (10, 0), (10, 10), (0, 10)])
+    assert area.get_bounds() == (0, 0, 10, 10)
+    version = area.geometry_version
+
+    area.geometry = [(0, 0), (20, 0), (20, 5), (0, 5)]
+
+    assert area.geometry_version == version + 1
+    assert area.get_bounds() == (0, 0, 20, 5)
+    assert area.points_within_bounds(np.array([15.0]), np.array([2.0])).tolist() == [True]
@@ -0,0 +1,85 @@
+import pytest
+
+from relentity.core.entities import Entity
+from relentity.spatial.components import Position, Velocity
+from relentity.spatial.events import POSITIONS_UPDATED_EVENT_TYPE, PositionsUpdatedEvent
+from relentity.spatial.registry import SpatialRegistry
+from relentity.spatial.systems import MovementSystem
+
+
+@pytest.fixture(params=[False, True], ids=["components", "dense"])
+def registry(request):
+    return SpatialRegistry(dense_storage=request.param)
+
+
+@pytest.fixture(params=[False, True], ids=["per_entity", "vectorized"])
+def vectorized(request):
+    return request.param
+
+
+@pytest.mark.asyncio
+async def test_entities_move_by_velocity(registry, vectorized):
+    entity = Entity[Position(x=0, y=0), Velocity(vx=2, vy=1)](registry)
+
+    await MovementSystem(registry, vectorized=vectorized).update(0.5)
+
+    position = await entity.get_component(Position)
+    assert (position.x, position.y) == (1, 0.5)
+
+
+@pytest.mark.asyncio
+async def test_speed_is_clamped(registry, vectorized):
+    entity = Entity[Position(x=0, y=0), Velocity(vx=30, vy=40)](registry)
+
+    await MovementSystem(registry, max_speed=10, vectorized=vectorized).update(1)
+
+    velocity = await entity.get_component(Velocity)
+    position = await entity.get_component(Position)
+    assert velocity.vx == pytest.approx(6) and velocity.vy == pytest.approx(8)
+    assert position.x == pytest.approx(6) and position.y == pytest.approx(8)
+
+
+@pytest.mark.asyncio
+async def test_position_updated_only_for_moving_entities(registry, vectorized):
+    moving = Entity[Position(x=0, y=0), Velocity(vx=1, vy=0)](registry)
+    stationary = Entity[Position(x=0, y=0), Velocity(vx=0, vy=0)](registry)
+    seen = []
+
+    async def on_moved(position):
+        seen.append(position.x)
+
+    moving.event_bus.register_handler("position_updated", on_moved)
+    stationary.event_bus.register_handler("position_updated", on_moved)
+
+    await MovementSystem(registry, vectorized=vectorized).update(1)
+
+    assert seen == [1]
+
+
+@pytest.mark.asyncio
+async def test_vectorized_emits_one_batched_event(registry):
+    first = Entity[Position(x=0, y=0), Velocity(vx=1, vy=0)](registry)
+    second = Entity[Position(x=5, y=5), Velocity(vx=0, vy=-2)](registry)
+    Entity[Position(x=0, y=0), Velocity(vx=0, vy=0)](registry)
+    listener = Entity[Position(x=0, y=0), Velocity(vx=0, vy=1)](registry)
+    system = MovementSystem(registry, vectorized=True)
+    batches = []
+    seen = []
+
+    async def on_batch(event):
+        batches.append(event)
+
+    async def on_moved(position):
+        seen.append((position.x, position.y))
+
+    system.register_event_handler(POSITIONS_UPDATED_EVENT_TYPE, on_batch)
+    listener.event_bus.register_handler("position_updated", on_moved)
+
+    await system.update(1)
+
+    assert len(batches) == 1
+    event = batches[0]
+    assert isinstance(event, PositionsUpdatedEvent)
+    moved = dict(zip(event.entity_ids, map(tuple, event.positions.tolist())))
+    assert moved == {first.id: (1, 0), second.id: (5, 3), listener.id: (0, 1)}
+    assert seen == [(0, 1)]
@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, Mock
 
 from relentity.core.entities import Entity
 from relentity.spatial.registry import SpatialRegistry
@@ -19,6 +19,12 @@ def vision_system(registry):
     return VisionSystem(registry)
 
 
+def listen(entity):
+    handler = AsyncMock()
+    entity.event_bus.register_handler(ENTITY_SEEN_EVENT_TYPE, handler)
+    return handler
+
+
 @pytest.mark.asyncio
 async def test_entity_sees_visible_entity_within_range(registry, vision_system):
     # Create entity with vision
@@ -27,20 +33,18 @@ async def test_entity_sees_visible_entity_within_range(registry, vision_system):
     # Create a visible entity within range
     visible_entity = Entity[Position(x=50, y=0), Velocity(vx=5, vy=0), Visible()](registry)
 
-    # Mock the emit method to track calls
-    observer_entity.event_bus.emit = AsyncMock()
+    handler = listen(observer_entity)
 
     # Update the system
     await vision_system.update()
 
     # Verify that ENTITY_SEEN_EVENT_TYPE was emitted with the visible entity info
-    observer_entity.event_bus.emit.assert_called_once()
-    args = observer_entity.event_bus.emit.call_args[0]
-    assert args[0] == ENTITY_SEEN_EVENT_TYPE
-    assert isinstance(args[1], EntitySeenEvent)
-    assert args[1].entity_ref.entity_id == visible_entity.id
-    assert args[1].position.x == 50 and args[1].position.y == 0
-    assert args[1].velocity.vx == 5 and args[1].velocity.vy == 0
+    handler.assert_called_once()
+    event = handler.call_args.args[0]
+    assert isinstance(event, EntitySeenEvent)
+    assert event.entity_ref.entity_id == visible_entity.id
+    assert event.position.x == 50 and event.position.y == 0
+    assert event.velocity.vx == 5 and event.velocity.vy == 0
 
 
 @pytest.mark.asyncio
@@ -51,14 +55,13 @@ async def test_entity_does_not_see_outside_vision_range(registry, vision_system)
     # Create a visible entity outside the vision range
     Entity[Position(x=60, y=0), Visible()](registry)  # Distance = 60 > 50
 
-    # Mock the emit method to track calls
-    observer_entity.event_bus.emit = AsyncMock()
+    handler = listen(observer_entity)
 
     # Update the system
     await vision_system.update()
 
     # Verify that no events were emitted (entity is out of range)
-    observer_entity.event_bus.emit.assert_not_called()
+    handler.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -71,21 +74,16 @@ async def test_entity_sees_multiple_visible_entities(registry, vision_system):
     visible_entity2 = Entity[Position(x=0, y=70), Velocity(vx=0, vy=2), Visible()](registry)
     visible_entity3 = Entity[Position(x=110, y=0), Velocity(vx=3, vy=0), Visible()](registry)  # Out of range
 
-    # Mock the emit method to track calls
-    observer_entity.event_bus.emit = AsyncMock()
+    handler = listen(observer_entity)
 
     # Update the system
     await vision_system.update()
 
     # Verify that events were emitted for the two in-range entities
-    assert observer_entity.event_bus.emit.call_count == 2
+    assert handler.call_count == 2
 
     # Collect the entities that were seen
-    seen_entities = []
-    for call in observer_entity.event_bus.emit.call_args_list:
-        args = call[0]
-        assert args[0] == ENTITY_SEEN_EVENT_TYPE
-        seen_entities.append(args[1].entity_ref.entity_id)
+    seen_entities = [call.args[0].entity_ref.entity_id for call in handler.call_args_list]
 
     # Verify the right entities were seen
     assert visible_entity1.id in seen_entities
@@ -101,14 +99,13 @@ async def test_entity_without_vision_component(registry, vision_system):
     # Create a visible entity
     Entity[Position(x=10, y=0), Visible()](registry)
 
-    # Mock the emit method to track calls
-    observer_entity.event_bus.emit = AsyncMock()
+    handler = listen(observer_entity)
 
     # Update the system
     await vision_system.update()
 
     # Verify that no events were emitted (entity has no Vision)
-    observer_entity.event_bus.emit.assert_not_called()
+    handler.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -116,11 +113,23 @@ async def test_entity_does_not_see_itself(registry, vision_system):
     # Create entity with both Vision and Visible components
     entity = Entity[Position(x=0, y=0), Vision(max_range=100), Visible(), Velocity(vx=0, vy=0)](registry)
 
-    # Mock the emit method to track calls
-    entity.event_bus.emit = AsyncMock()
+    handler = listen(entity)
 
     # Update the system
     await vision_system.update()
 
     # Verify that no events were emitted (entity shouldn't see itself)
-    entity.event_bus.emit.assert_not_called()
+    handler.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_observers_without_handlers_are_skipped(registry, vision_system, monkeypatch):
+    # An observer in range of a visible entity, but nobody listens for what it sees
+    Entity[Position(x=0, y=0), Vision(max_range=100)](registry)
+    Entity[Position(x=10, y=0), Visible()](registry)
+    neighbors_within = Mock()
+    monkeypatch.setattr(registry, "neighbors_within", neighbors_within)
+
+    await vision_system.update()
+
+    neighbors_within.assert_not_called()
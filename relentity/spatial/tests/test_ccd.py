@@ -0,0 +1,41 @@
+import pytest
+
+from relentity.spatial.physics.ccd import swept_circle_circle, swept_point_box, time_of_impact
+from relentity.spatial.physics.components import ShapeBody, ShapeType
+
+
+def test_swept_circle_circle_finds_first_contact():
+    t, nx, ny = swept_circle_circle(0, 0, 20, 0, 15, 0, 5)
+
+    assert t == pytest.approx(0.5)
+    assert (nx, ny) == pytest.approx((-1, 0))
+
+
+@pytest.mark.parametrize(
+    "move",
+    [
+        (0, 0, 4, 0, 15, 0, 5),  # stops short
+        (0, 0, 20, 0, 15, 10, 5),  # passes by
+        (14, 0, 1, 0, 15, 0, 5),  # already overlapping
+    ],
+)
+def test_swept_circle_circle_misses(move):
+    assert swept_circle_circle(*move) is None
+
+
+def test_swept_point_box_hits_the_facing_side():
+    t, nx, ny = swept_point_box(0, 5, 100, 0, 50, 0, 1, 10)
+
+    assert t == pytest.approx(0.49)
+    assert (nx, ny) == (-1, 0)
+    assert swept_point_box(0, 15, 100, 0, 50, 0, 1, 10) is None
+
+
+def test_time_of_impact_of_box_sweeping_into_circle():
+    box = ShapeBody(shape_type=ShapeType.RECTANGLE, width=4, height=4)
+    circle = ShapeBody(shape_type=ShapeType.CIRCLE, radius=3)
+
+    t, nx, ny = time_of_impact(0, 0, box, 0, 20, 0, 15, circle)
+
+    assert t == pytest.approx(0.5)
+    assert (nx, ny) == (0, -1)
@@ -0,0 +1,65 @@
+import random
+
+import pytest
+
+from relentity.core.entities import Entity
+from relentity.spatial.components import Position
+from relentity.spatial.registry import SpatialRegistry
+from relentity.spatial.sound import Hearing
+from relentity.spatial.vision import Vision, Visible
+
+
+@pytest.mark.asyncio
+async def test_neighbors_within_matches_entities_within_distance():
+    rng = random.Random(3)
+    registry = SpatialRegistry(cell_size=20)
+    observers = [
+        Entity[Position(x=rng.uniform(0, 300), y=rng.uniform(0, 300)), Vision(max_range=rng.uniform(5, 80))](registry)
+        for _ in range(30)
+    ]
+    for _ in range(200):
+        Entity[Position(x=rng.uniform(0, 300), y=rng.uniform(0, 300)), Visible()](registry)
+
+    radii = {observer.id: observer.get_component_nowait(Vision).max_range for observer in observers}
+    neighbors = registry.neighbors_within(radii, Visible)
+
+    assert set(neighbors) == set(radii)
+    for observer in observers:
+        position = observer.get_component_nowait(Position)
+        expected = {
+            ref.entity_id async for ref in registry.entities_within_distance(position, radii[observer.id], Visible)
+        }
+        assert {ref.entity_id for ref in neighbors[observer.id]} == expected
+
+
+@pytest.mark.asyncio
+async def test_neighbors_within_skips_observers_without_position_and_tracks_moves():
+    registry = SpatialRegistry()
+    observer = Entity[Position(x=0, y=0)](registry)
+    blind = Entity[Vision(max_range=10)](registry)
+    listener = Entity[Position(x=50, y=0), Hearing()](registry)
+
+    assert registry.neighbors_within({observer.id: 10, blind.id: 10}, Hearing) == {observer.id: []}
+
+    listener.get_component_nowait(Position).x = 5
+    neighbors = registry.neighbors_within({observer.id: 10}, Hearing)
+    assert [ref.entity_id for ref in neighbors[observer.id]] == [listener.id]
+
+
+@pytest.mark.asyncio
+async def test_positions_version_only_changes_with_the_position_component():
+    registry = SpatialRegistry()
+    entity = Entity[Position(x=0, y=0)](registry)
+    version = registry.positions_version
+
+    await entity.add_component(Hearing())
+    await entity.remove_component(Hearing)
+    assert registry.positions_version == version
+
+    await entity.add_component(Position(x=1, y=1))
+    assert registry.positions_version != version
+    version = registry.positions_version
+
+    await entity.add_component(Visible())
+    await entity.remove_component(Position)
+    assert registry.positions_version != version
@@ -0,0 +1,130 @@
+import random
+import uuid
+
+import pytest
+
+from relentity.core.entities import Entity
+from relentity.spatial.components import Area, Position, Velocity
+from relentity.spatial.registry import SpatialRegistry
+from relentity.spatial.sound import Hearing
+from relentity.spatial.spatial_hash import SpatialHash
+from relentity.spatial.systems import MovementSystem
+from relentity.spatial.vision.components import Visible
+
+
+def test_within_distance_matches_brute_force():
+    rng = random.Random(7)
+    entries = [(uuid.uuid4(), rng.uniform(-200, 200), rng.uniform(-200, 200)) for _ in range(500)]
+    spatial_hash = SpatialHash(cell_size=25)
+    spatial_hash.rebuild(entries)
+
+    for x, y, distance in [(0, 0, 10), (13.5, -80, 60), (150, 150, 500), (-199, 42, 0.5)]:
+        expected = {entity_id for entity_id, ex, ey in entries if (ex - x) ** 2 + (ey - y) ** 2 <= distance**2}
+        assert set(spatial_hash.within_distance(x, y, distance)) == expected
+
+
+def test_within_distance_is_inclusive_and_handles_negative_cells():
+    entity_id = uuid.uuid4()
+    spatial_hash = SpatialHash(cell_size=10)
+    spatial_hash.rebuild([(entity_id, -5, 0)])
+
+    assert spatial_hash.cell_of(-5, 0) == (-1, 0)
+    assert list(spatial_hash.within_distance(5, 0, 10)) == [entity_id]
+    assert list(spatial_hash.within_distance(5.1, 0, 10)) == []
+
+
+def test_cell_size_must_be_positive():
+    with pytest.raises(ValueError):
+        SpatialHash(cell_size=0)
+
+
+@pytest.mark.parametrize("dense_storage", [False, True], ids=["components", "dense"])
+@pytest.mark.asyncio
+async def test_registry_hash_follows_position_changes(dense_storage):
+    registry = SpatialRegistry(dense_storage=dense_storage, cell_size=10)
+    mover = Entity[Position(x=0, y=0), Velocity(vx=100, vy=0), Visible()](registry)
+    teleporter = Entity[Position(x=500, y=500), Visible()](registry)
+    origin = Position(x=0, y=0)
+
+    async def ids_near_origin():
+        return {ref.entity_id async for ref in registry.entities_within_distance(origin, 5, Visible)}
+
+    assert await ids_near_origin() == {mover.id}
+
+    await MovementSystem(registry, max_speed=100).update(1)
+    teleporter.get_component_nowait(Position).x = 1
+    teleporter.get_component_nowait(Position).y = 1
+    assert await ids_near_origin() == {teleporter.id}
+
+    await teleporter.add_component(Position(x=300, y=0))
+    late = Entity[Position(x=2, y=2), Visible()](registry)
+    assert await ids_near_origin() == {late.id}
+
+    await registry.remove_entity(late.id)
+    assert await ids_near_origin() == set()
+
+
+@pytest.mark.parametrize("dense_storage", [False, True], ids=["components", "dense"])
+@pytest.mark.asyncio
+async def test_registry_hash_sees_positions_written_in_place(dense_storage):
+    registry = SpatialRegistry(dense_storage=dense_storage, cell_size=10)
+    entity = Entity[Position(x=0, y=0), Velocity(vx=0, vy=0)](registry)
+    origin = Position(x=0, y=0)
+    assert [ref.entity_id async for ref in registry.entities_within_distance(origin, 5)] == [entity.id]
+
+    entity.get_component_nowait(Position).x = 100
+
+    assert [ref.entity_id async for ref in registry.entities_within_distance(origin, 5)] == []
+    assert [ref.entity_id async for ref in registry.entities_within_distance(Position(x=100, y=0), 5)] == [entity.id]
+
+
+@pytest.mark.asyncio
+async def test_radius_query_only_indexes_entities_with_requested_components():
+    registry = SpatialRegistry()
+    listener = Entity[Position(x=1, y=1), Hearing()](registry)
+    for _ in range(20):
+        Entity[Position(x=0, y=0), Visible()](registry)
+    centroid = Position(x=0, y=0)
+
+    found = [ref.entity_id async for ref in registry.entities_within_distance(centroid, 5, Hearing)]
+
+    assert found == [listener.id]
+    assert len(registry.get_spatial_hash(Hearing)) == 1
+    assert len(registry.get_spatial_hash()) == 21
+
+
+def test_within_bounds_is_inclusive():
+    inside, edge, outside = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    spatial_hash = SpatialHash(cell_size=4)
+    spatial_hash.rebuild([(inside, 5, 5), (edge, 10, 0), (outside, 10.5, 5)])
+
+    assert {entry[0] for entry in spatial_hash.within_bounds(0, 0, 10, 10)} == {inside, edge}
+
+
+@pytest.mark.asyncio
+async def test_entities_within_area_uses_polygon_not_just_bounds():
+    registry = SpatialRegistry(cell_size=2)
+    area = Area(geometry=[(0, 0), (10, 0), (0, 10)])
+    below = Entity[Position(x=2, y=2)](registry)
+    Entity[Position(x=8, y=8)](registry)  # inside the bounding box, outside the triangle
+    Entity[Position(x=20, y=1)](registry)
+
+    assert area.get_bounds() == (0, 0, 10, 10)
+    assert [ref.entity_id async for ref in registry.entities_within_area(area)] == [below.id]
+
+
+@pytest.mark.parametrize("dense_storage", [False, True], ids=["components", "dense"])
+@pytest.mark.asyncio
+async def test_entities_within_area_sees_positions_written_in_place(dense_storage):
+    registry = SpatialRegistry(dense_storage=dense_storage, cell_size=2)
+    area = Area(geometry=[(0, 0), (10, 0), (10, 10), (0, 10)])
+    leaving = Entity[Position(x=5, y=5), Velocity(vx=0, vy=0)](registry)
+    entering = Entity[Position(x=50, y=50), Velocity(vx=0, vy=0)](registry)
+    assert [ref.entity_id async for ref in registry.entities_within_area(area)] == [leaving.id]
+
+    leaving.get_component_nowait(Position).x = 50
+    position = entering.get_component_nowait(Position)
+    position.x = 3
+    position.y = 3
+
+    assert [ref.entity_id async for ref in registry.entities_within_area(area)] == [entering.id]
@@ -0,0 +1,97 @@
+import copy
+import pickle
+
+import pytest
+
+from relentity.core.entities import Entity
+from relentity.spatial.components import Position, Velocity
+from relentity.spatial.registry import SpatialRegistry
+
+
+@pytest.fixture
+def registry():
+    return SpatialRegistry(dense_storage=True, dense_capacity=2)
+
+
+@pytest.mark.asyncio
+async def test_components_become_views(registry):
+    entity = Entity[Position(x=1, y=2), Velocity(vx=3, vy=4)](registry)
+    store = registry.motion_store
+    slot = store.get_slot(entity.id)
+
+    position = await entity.get_component(Position)
+    velocity = await entity.get_component(Velocity)
+    assert isinstance(position, Position)
+    assert tuple(store.positions[slot]) == (1, 2)
+    assert tuple(store.velocities[slot]) == (3, 4)
+
+    # writes through the component land in the arrays and vice versa
+    position.x = 10
+    store.velocities[slot, 1] = 7
+    assert store.positions[slot, 0] == 10
+    assert velocity.vy == 7
+    assert position.model_dump() == {"x": 10, "y": 2}
+    assert position == Position(x=10, y=2)
+
+
+@pytest.mark.asyncio
+async def test_only_entities_with_both_components_are_bound(registry):
+    static = Entity[Position(x=0, y=0)](registry)
+    moving = Entity[Position(x=0, y=0), Velocity(vx=1, vy=0)](registry)
+
+    assert static.id not in registry.motion_store
+    assert moving.id in registry.motion_store
+
+    await moving.remove_component(Velocity)
+    assert moving.id not in registry.motion_store
+    assert type(moving.components[Position]) is Position
+
+
+@pytest.mark.asyncio
+async def test_unbind_keeps_rows_contiguous(registry):
+    entities = [Entity[Position(x=i, y=i), Velocity(vx=i, vy=0)](registry) for i in range(5)]
+    store = registry.motion_store
+
+    await registry.unregister_entity(entities[0].id)
+    detached = entities[0].components[Position]
+    assert type(detached) is Position and detached.x == 0
+
+    assert store.count == 4
+    for entity in entities[1:]:
+        slot = store.get_slot(entity.id)
+        assert store.entity_ids[slot] == entity.id
+        assert (await entity.get_component(Position)).x == store.positions[slot, 0]
+
+
+@pytest.mark.asyncio
+async def test_replacing_a_component_rebinds(registry):
+    entity = Entity[Position(x=0, y=0), Velocity(vx=1, vy=0)](registry)
+    old_position = entity.components[Position]
+
+    await entity.add_component(Position(x=5, y=5))
+
+    assert type(old_position) is Position
+    assert registry.motion_store.positions[registry.motion_store.get_slot(entity.id), 0] == 5
+
+
+@pytest.mark.parametrize(
+    "make_copy",
+    [copy.copy, copy.deepcopy, lambda component: pickle.loads(pickle.dumps(component)), lambda c: c.model_copy()],
+    ids=["copy", "deepcopy", "pickle", "model_copy"],
+)
+@pytest.mark.asyncio
+async def test_copies_of_views_are_plain_snapshots(registry, make_copy):
+    entity = Entity[Position(x=1, y=2), Velocity(vx=3, vy=4)](registry)
+    position = entity.get_component_nowait(Position)
+    velocity = entity.get_component_nowait(Velocity)
+    position.x = 5
+
+    copied_position = make_copy(position)
+    copied_velocity = make_copy(velocity)
+    position.x = 6
+
+    assert type(copied_position) is Position and type(copied_velocity) is Velocity
+    assert (copied_position.x, copied_position.y) == (5, 2)
+    assert repr(copied_velocity) == "Velocity(vx=3.0, vy=4.0)"
+    copied_position.x = 7
+    assert position.x == 6
@@ -1,6 +1,13 @@
 import pytest
 import numpy as np
-from relentity.spatial.utils import do_edges_intersect, is_simple_polygon, point_in_polygon
+from relentity.spatial.utils import (
+    do_edges_intersect,
+    is_simple_polygon,
+    point_in_polygon,
+    points_in_polygon,
+    polygon_edges,
+)
+from relentity.spatial import utils
 
 
 @pytest.mark.parametrize(
@@ -35,6 +42,53 @@ def test_is_simple_polygon(polygon, expected):
     assert is_simple_polygon(polygon) == expected
 
 
+def _is_simple_polygon_pairwise(polygon):
+    n = len(polygon)
+    polygon_np = np.array(polygon)
+    for i in range(n):
+        for j in range(i + 1, n):
+            if (i + 1) % n != j and i != (j + 1) % n:
+                if do_edges_intersect(polygon_np[i], polygon_np[(i + 1) % n], polygon_np[j], polygon_np[(j + 1) % n]):
+                    return False
+    return True
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_is_simple_polygon_matches_pairwise_check(seed):
+    rng = np.random.default_rng(seed)
+    n = int(rng.integers(3, 12))
+    if seed % 2:
+        # star-shaped polygons from sorted angles are simple, small integer grids produce touching edges
+        angles = np.sort(rng.uniform(0, 2 * np.pi, n))
+        radii = rng.uniform(1, 5, n)
+        polygon = [(float(r * np.cos(a)), float(r * np.sin(a))) for r, a in zip(radii, angles)]
+    else:
+        polygon = [tuple(int(v) for v in vertex) for vertex in rng.integers(0, 4, size=(n, 2))]
+
+    assert is_simple_polygon(polygon, chunk_pairs=7) == _is_simple_polygon_pairwise(polygon)
+
+
+def test_is_simple_polygon_caches_per_geometry(monkeypatch):
+    # a deep notch brings non-adjacent edges' bounding boxes together, so checking it runs the edge tests;
+    # the odd vertex keeps other tests from having cached it already
+    polygon = [(0.137, 0), (6, 0), (6, 6), (1, 1.5), (5, 6), (0, 6)]
+    edge_tests = []
+
+    def counting_edges_intersect_batch(*args):
+        edge_tests.append(args)
+        return intersect(*args)
+
+    intersect = utils._edges_intersect_batch
+    monkeypatch.setattr(utils, "_edges_intersect_batch", counting_edges_intersect_batch)
+
+    assert is_simple_polygon(polygon)
+    computed = len(edge_tests)
+    assert is_simple_polygon([list(vertex) for vertex in polygon])
+
+    assert computed > 0
+    assert len(edge_tests) == computed
+
+
 @pytest.mark.parametrize(
     "x, y, polygon, expected",
     [
@@ -46,3 +100,22 @@ def test_is_simple_polygon(polygon, expected):
 )
 def test_point_in_polygon(x, y, polygon, expected):
     assert point_in_polygon(x, y, polygon) == expected
+
+
+@pytest.mark.parametrize(
+    "polygon",
+    [
+        [(0, 0), (10, 0), (10, 10), (0, 10)],  # Square
+        [(0, 0), (2, 0), (1, 1), (2, 2), (0, 2)],  # Concave
+        [(0, 0), (4, 0), (4, 1), (1, 1), (1, 3), (4, 3), (4, 4), (0, 4)],  # C shape with vertical edges
+    ],
+)
+def test_points_in_polygon_matches_point_in_polygon(polygon):
+    rng = np.random.default_rng(5)
+    # random points plus points on vertices and on the integer grid, which hit edges exactly
+    grid = np.array([(x, y) for x in np.arange(-1, 11, 0.5) for y in np.arange(-1, 11, 0.5)])
+    points = np.vstack((rng.uniform(-1, 11, size=(500, 2)), np.array(polygon, dtype=float), grid))
+
+    inside = points_in_polygon(points[:, 0], points[:, 1], polygon_edges(polygon), chunk_size=64)
+
+    assert inside.tolist() == [point_in_polygon(x, y, polygon) for x, y in points.tolist()]
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import List, Tuple
 
 import numpy as np
@@ -35,14 +36,82 @@ def do_edges_intersect(p1: np.ndarray, p2: np.ndarray, p3: np.ndarray, p4: np.nd
     return False
 
 
-def is_simple_polygon(polygon: List[Tuple[float, float]]) -> bool:
+def _edges_intersect_batch(p1: np.ndarray, p2: np.ndarray, p3: np.ndarray, p4: np.ndarray) -> np.ndarray:
+    """
+    Vectorized `do_edges_intersect` over rows of (k, 2) endpoint arrays, with the same results.
+    """
+
+    def orientation(p: np.ndarray, q: np.ndarray, r: np.ndarray) -> np.ndarray:
+        val = (q[:, 1] - p[:, 1]) * (r[:, 0] - q[:, 0]) - (q[:, 0] - p[:, 0]) * (r[:, 1] - q[:, 1])
+        return np.where(val == 0, 0, np.where(val > 0, 1, 2))
+
+    def on_segment(p: np.ndarray, q: np.ndarray, r: np.ndarray) -> np.ndarray:
+        return (
+            (np.minimum(p[:, 0], r[:, 0]) <= q[:, 0])
+            & (q[:, 0] <= np.maximum(p[:, 0], r[:, 0]))
+            & (np.minimum(p[:, 1], r[:, 1]) <= q[:, 1])
+            & (q[:, 1] <= np.maximum(p[:, 1], r[:, 1]))
+        )
+
+    o1 = orientation(p1, p2, p3)
+    o2 = orientation(p1, p2, p4)
+    o3 = orientation(p3, p4, p1)
+    o4 = orientation(p3, p4, p2)
+
+    return (
+        ((o1 != o2) & (o3 != o4))
+        | ((o1 == 0) & on_segment(p1, p3, p2))
+        | ((o2 == 0) & on_segment(p1, p4, p2))
+        | ((o3 == 0) & on_segment(p3, p1, p4))
+        | ((o4 == 0) & on_segment(p3, p2, p4))
+    )
+
+
+def is_simple_polygon(polygon: List[Tuple[float, float]], chunk_pairs: int = 1 << 20) -> bool:
+    """
+    Checks that no two non-adjacent edges of a polygon intersect.
+
+    Results are cached per geometry, so copies of the same Area are only validated once.
+
+    Args:
+        polygon (List[Tuple[float, float]]): The polygon's vertices, in order.
+        chunk_pairs (int): Roughly how many edge pairs to test at a time, bounding memory for large polygons.
+
+    Returns:
+        bool: True if the polygon is simple, False otherwise.
+    """
+    return _is_simple_polygon(tuple(tuple(vertex) for vertex in polygon), chunk_pairs)
+
+
+@lru_cache(maxsize=1024)
+def _is_simple_polygon(polygon: Tuple[Tuple[float, float], ...], chunk_pairs: int) -> bool:
     n = len(polygon)
-    polygon_np = np.array(polygon)
-    for i in range(n):
-        for j in range(i + 1, n):
-            if i != j and (i + 1) % n != j and i != (j + 1) % n:
-                if do_edges_intersect(polygon_np[i], polygon_np[(i + 1) % n], polygon_np[j], polygon_np[(j + 1) % n]):
-                    return False
+    if n < 4:
+        # every pair of edges of a triangle is adjacent
+        return True
+
+    starts = np.array(polygon)
+    ends = np.roll(starts, -1, axis=0)
+    low = np.minimum(starts, ends)
+    high = np.maximum(starts, ends)
+    columns = np.arange(n)
+    rows_per_chunk = max(1, chunk_pairs // n)
+
+    # test the pairs i < j of non-adjacent edges, a block of rows at a time to bound memory; edges can only
+    # intersect if their bounding boxes overlap, so only those pairs reach the orientation tests
+    for first in range(0, n, rows_per_chunk):
+        last = min(first + rows_per_chunk, n)
+        rows = np.arange(first, last)[:, np.newaxis]
+        candidates = (columns > rows) & ((rows + 1) % n != columns) & (rows != (columns + 1) % n)
+        for axis in (0, 1):
+            candidates &= low[first:last, axis, np.newaxis] <= high[:, axis]
+            candidates &= low[:, axis] <= high[first:last, axis, np.newaxis]
+        i, j = np.nonzero(candidates)
+        if not len(i):
+            continue
+        i += first
+        if _edges_intersect_batch(starts[i], ends[i], starts[j], ends[j]).any():
+            return False
     return True
 
 
@@ -63,3 +132,55 @@ def point_in_polygon(x, y, polygon):
         p1x, p1y = p2x, p2y
 
     return inside
+
+
+def polygon_edges(polygon: List[Tuple[float, float]]) -> np.ndarray:
+    """
+    Builds the edge array of a polygon for `points_in_polygon`.
+
+    Args:
+        polygon (List[Tuple[float, float]]): The polygon's vertices, in order.
+
+    Returns:
+        np.ndarray: An (n, 4) array holding the x1, y1, x2, y2 of each edge, the last edge closing the polygon.
+    """
+    vertices = np.asarray(polygon, dtype=np.float64).reshape(-1, 2)
+    return np.hstack((vertices, np.roll(vertices, -1, axis=0)))
+
+
+def points_in_polygon(xs: np.ndarray, ys: np.ndarray, edges: np.ndarray, chunk_size: int = 4096) -> np.ndarray:
+    """
+    Vectorized `point_in_polygon`: tests many points against one polygon, with the same boundary rules.
+
+    Args:
+        xs (np.ndarray): The x-coordinates of the points.
+        ys (np.ndarray): The y-coordinates of the points.
+        edges (np.ndarray): The polygon's edges, as returned by `polygon_edges`.
+        chunk_size (int, optional): The number of points tested per array operation, bounding the size of the
+            (points x edges) intermediates. Defaults to 4096.
+
+    Returns:
+        np.ndarray: A boolean array, True for each point inside the polygon.
+    """
+    xs = np.asarray(xs, dtype=np.float64)
+    ys = np.asarray(ys, dtype=np.float64)
+    inside = np.zeros(len(xs), dtype=bool)
+    if not len(edges) or not len(xs):
+        return inside
+
+    x1, y1, x2, y2 = edges.T
+    min_y = np.minimum(y1, y2)
+    max_y = np.maximum(y1, y2)
+    max_x = np.maximum(x1, x2)
+    dx = x2 - x1
+    # horizontal edges never satisfy min_y < y <= max_y, so their divisor is never used
+    dy = np.where(y1 == y2, 1.0, y2 - y1)
+    vertical = x1 == x2
+
+    for start in range(0, len(xs), chunk_size):
+        x = xs[start : start + chunk_size, np.newaxis]
+        y = ys[start : start + chunk_size, np.newaxis]
+        crosses = (y > min_y) & (y <= max_y) & (x <= max_x)
+        crosses &= vertical | (x <= (y - y1) * dx / dy + x1)
+        inside[start : start + chunk_size] = np.count_nonzero(crosses, axis=1) % 2 == 1
+    return inside
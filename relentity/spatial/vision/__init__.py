@@ -0,0 +1,8 @@
+from .components import Vision, Visible
+from .systems import VisionSystem
+
+__all__ = [
+    "Vision",
+    "Visible",
+    "VisionSystem",
+]
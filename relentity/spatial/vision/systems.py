@@ -12,20 +12,33 @@ class VisionSystem(SpatialSystem):
         update: Detects entities within the vision range and emits ENTITY_SEEN_EVENT_TYPE events.
     """
 
+    reads = {Vision, Visible, Position, Velocity}
+    writes = set()
+
     async def update(self, delta_time: float = 0) -> None:
         """
-        Detects entities within the vision range of entities with Vision and Position components.
-        Emits an ENTITY_SEEN_EVENT_TYPE event for each detected entity.
+        Detects entities within the vision range of entities with Vision and Position components,
+        answering every observer's range query with one bulk `neighbors_within` call.
+        Emits an ENTITY_SEEN_EVENT_TYPE event for each detected entity. Observers that have no handler
+        for the event are left out of the query entirely.
         """
-        async for entity_ref in self.registry.entities_with_components(Vision, Position):
-            entity = await entity_ref.resolve()
-            vision = await entity.get_component(Vision)
-            position = await entity.get_component(Position)
-            async for other_entity_ref in self.registry.entities_within_distance(position, vision.max_range, Visible):
-                if other_entity_ref.entity_id != entity.id:
-                    other_entity = await other_entity_ref.resolve()
-                    other_position = await other_entity.get_component(Position)
-                    other_velocity = await other_entity.get_component(Velocity)
+        entities = self.registry.entities
+        radii = {
+            entity_id: vision.max_range
+            for entity_id, vision, _ in self.registry.iter_components(Vision, Position)
+            if entities[entity_id].event_bus.has_subscribers(ENTITY_SEEN_EVENT_TYPE)
+        }
+        if not radii:
+            return
+
+        neighbors = self.registry.neighbors_within(radii, Visible)
+        for entity_id, other_entity_refs in neighbors.items():
+            entity = entities[entity_id]
+            for other_entity_ref in other_entity_refs:
+                if other_entity_ref.entity_id != entity_id:
+                    other_entity = other_entity_ref.resolve_nowait()
+                    other_position = other_entity.get_component_nowait(Position)
+                    other_velocity = other_entity.get_component_nowait(Velocity)
                     event = EntitySeenEvent(
                         entity_ref=other_entity_ref, position=other_position, velocity=other_velocity
                     )
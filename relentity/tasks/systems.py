@@ -11,15 +11,18 @@ class TaskSystem(System):
         update: Processes tasks for entities, updating their progress and handling completion.
     """
 
+    reads = set()
+    writes = {Task}
+
     async def update(self, delta_time: float = 0) -> None:
         """
         Updates the system by processing all entities with Task components.
         Decrements the remaining cycles for each task and emits progress events.
         If a task is completed, emits a completion event and removes the task component from the entity.
         """
-        async for entity_ref in self.registry.entities_with_components(Task, include_subclasses=True):
-            entity = await entity_ref.resolve()
-            task = await entity.get_component(Task, include_subclasses=True)
+        for entity_ref in self.registry.entities_with_components_nowait(Task, include_subclasses=True):
+            entity = entity_ref.resolve_nowait()
+            task = entity.get_component_nowait(Task, include_subclasses=True)
 
             if task:
                 task.remaining_cycles -= 1